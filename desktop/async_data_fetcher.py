@@ -0,0 +1,192 @@
+"""
+Async data fetcher module for DCF analyzer
+Fetches financial data from Financial Modeling Prep API using httpx,
+firing all endpoints for a ticker in parallel instead of sequentially.
+With http2 support installed (httpx[http2]) every in-flight request is
+multiplexed over a single TCP+TLS connection.
+"""
+
+import asyncio
+import json
+import time
+import httpx
+from typing import List, Dict, Optional
+
+try:
+    # orjson parses the large statement payloads 2-5x faster than stdlib json
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter shared across coroutines; a lock guards the
+    token count so parallel fetches can't trigger a 429 storm
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: float = 10.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, waiting only when the budget is exhausted"""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+                self.tokens = 1
+                self.last = time.monotonic()
+
+            self.tokens -= 1
+
+
+class AsyncDataFetcher:
+    def __init__(self, api_key: str = None):
+        """
+        Initialize async data fetcher with API key
+        Get free API key from: https://financialmodelingprep.com/developer/docs/
+        """
+        self.api_key = api_key or "demo"  # demo key for testing, limited to few stocks
+        self.base_url = "https://financialmodelingprep.com/api/v3"
+        self._session = None
+        self.bucket = AsyncTokenBucket(rate=5.0, capacity=10.0)
+
+    async def _get_session(self) -> httpx.AsyncClient:
+        """Create the shared client lazily so it binds to the running loop"""
+        if self._session is None or self._session.is_closed:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            headers = {"Accept-Encoding": "gzip, deflate, br"}
+            try:
+                self._session = httpx.AsyncClient(
+                    http2=True, limits=limits, timeout=20.0, headers=headers
+                )
+            except ImportError:
+                # h2 not installed; plain HTTP/1.1 keep-alive still pools
+                self._session = httpx.AsyncClient(
+                    limits=limits, timeout=20.0, headers=headers
+                )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP client"""
+        if self._session is not None and not self._session.is_closed:
+            await self._session.aclose()
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """Make API request with error handling"""
+        if params is None:
+            params = {}
+        params['apikey'] = self.api_key
+
+        session = await self._get_session()
+        await self.bucket.acquire()
+        try:
+            response = await session.get(f"{self.base_url}/{endpoint}", params=params)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except httpx.HTTPError as e:
+            print(f"Error fetching {endpoint}: {e}")
+            return None
+
+    async def get_company_profile(self, ticker: str) -> Optional[Dict]:
+        """Get company profile information"""
+        data = await self._make_request(f"profile/{ticker}")
+        return data[0] if data else None
+
+    async def get_income_statement(self, ticker: str, period: str = "annual", limit: int = 5) -> List[Dict]:
+        """Get income statement data"""
+        params = {'period': period, 'limit': limit}
+        data = await self._make_request(f"income-statement/{ticker}", params)
+        return data if data else []
+
+    async def get_balance_sheet(self, ticker: str, period: str = "annual", limit: int = 5) -> List[Dict]:
+        """Get balance sheet data"""
+        params = {'period': period, 'limit': limit}
+        data = await self._make_request(f"balance-sheet-statement/{ticker}", params)
+        return data if data else []
+
+    async def get_cash_flow(self, ticker: str, period: str = "annual", limit: int = 5) -> List[Dict]:
+        """Get cash flow statement data"""
+        params = {'period': period, 'limit': limit}
+        data = await self._make_request(f"cash-flow-statement/{ticker}", params)
+        return data if data else []
+
+    async def get_key_metrics(self, ticker: str, period: str = "annual", limit: int = 5) -> List[Dict]:
+        """Get key financial metrics"""
+        params = {'period': period, 'limit': limit}
+        data = await self._make_request(f"key-metrics/{ticker}", params)
+        return data if data else []
+
+    async def get_current_price(self, ticker: str) -> Optional[float]:
+        """Get current stock price"""
+        data = await self._make_request(f"quote-short/{ticker}")
+        if data and len(data) > 0:
+            return data[0].get('price')
+        return None
+
+    async def get_financial_data_complete(self, ticker: str) -> Dict:
+        """
+        Get all financial data needed for DCF analysis
+        All six endpoints are fetched in parallel, so wall time is
+        roughly one round trip instead of six
+        """
+        print(f"Fetching data for {ticker}...")
+
+        (profile, income_statements, balance_sheets,
+         cash_flows, key_metrics, current_price) = await asyncio.gather(
+            self.get_company_profile(ticker),
+            self.get_income_statement(ticker),
+            self.get_balance_sheet(ticker),
+            self.get_cash_flow(ticker),
+            self.get_key_metrics(ticker),
+            self.get_current_price(ticker)
+        )
+
+        return {
+            'ticker': ticker,
+            'profile': profile,
+            'income_statements': income_statements,
+            'balance_sheets': balance_sheets,
+            'cash_flows': cash_flows,
+            'key_metrics': key_metrics,
+            'current_price': current_price
+        }
+
+
+def run_sync(coro):
+    """Run an async fetcher coroutine from synchronous code"""
+    return asyncio.run(coro)
+
+
+def fetch_financial_data_complete(ticker: str, api_key: str = None) -> Dict:
+    """Sync facade: fetch one ticker's complete dataset in parallel"""
+    async def _fetch():
+        async with AsyncDataFetcher(api_key) as fetcher:
+            return await fetcher.get_financial_data_complete(ticker)
+
+    return run_sync(_fetch())
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    # For testing - replace with your API key
+    data = fetch_financial_data_complete("AAPL", api_key="demo")
+
+    print(f"Company: {data['profile'].get('companyName') if data['profile'] else 'N/A'}")
+    print(f"Current Price: ${data['current_price']}")
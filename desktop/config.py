@@ -2,6 +2,9 @@
 # Define preset parameter configurations for different analysis styles
 
 import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
 
 
 PRESET_CONFIGS = {
@@ -111,30 +114,58 @@ SCREENING_PRESETS = {
 }
 
 
+# Freeze the preset tables: every lookup shares the same immutable
+# mappings instead of aliasing mutable module state. Callers that need
+# to mutate take an explicit dict(...) / .copy() snapshot.
+PRESET_CONFIGS = MappingProxyType(
+    {name: MappingProxyType(cfg) for name, cfg in PRESET_CONFIGS.items()}
+)
+SCREENING_PRESETS = MappingProxyType(
+    {name: MappingProxyType(cfg) for name, cfg in SCREENING_PRESETS.items()}
+)
+
+
+_CUSTOM_PRESETS_FILE = os.path.join(os.path.dirname(__file__), 'custom_presets.json')
+
+
+@lru_cache(maxsize=None)
+def _load_custom_presets(mtime: float):
+    """Parse custom_presets.json once per mtime; re-reads only after edits"""
+    try:
+        with open(_CUSTOM_PRESETS_FILE, 'r') as f:
+            # Freeze at parse time so lookups hand out the cached view
+            # without re-wrapping on every call
+            return {name: MappingProxyType(cfg)
+                    for name, cfg in json.load(f).items()}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _get_custom_presets():
+    """Get custom presets, hitting disk only when the file has changed"""
+    try:
+        mtime = os.stat(_CUSTOM_PRESETS_FILE).st_mtime
+    except OSError:
+        return {}
+    return _load_custom_presets(mtime)
+
+
 def get_dcf_preset(preset_name: str):
-    """Get DCF parameter preset by name"""
-    # First check built-in presets
+    """
+    Get DCF parameter preset by name
+    Returns a read-only view; callers needing mutation should copy it
+    """
+    # First check built-in presets (already frozen)
     preset = PRESET_CONFIGS.get(preset_name.lower())
     if preset:
         return preset
-    
-    # Then check custom presets
-    import os
-    import json
-    custom_file = os.path.join(os.path.dirname(__file__), 'custom_presets.json')
-    if os.path.exists(custom_file):
-        try:
-            with open(custom_file, 'r') as f:
-                custom_presets = json.load(f)
-                return custom_presets.get(preset_name.lower())
-        except:
-            pass
-    
-    return None
+
+    # Then check custom presets (cached, mtime-invalidated, pre-frozen)
+    return _get_custom_presets().get(preset_name.lower())
 
 
 def get_screening_preset(preset_name: str):
-    """Get screening filter preset by name"""
+    """Get screening filter preset by name (read-only view)"""
     return SCREENING_PRESETS.get(preset_name.lower())
 
 
@@ -4,51 +4,356 @@ Fetches financial data from Financial Modeling Prep API
 Free tier allows 250 requests per day
 """
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
+import hashlib
+import json
+import sqlite3
+import threading
 import time
+from collections import defaultdict
+from operator import itemgetter
+from urllib.parse import urlencode
+
+try:
+    # orjson parses the large statement payloads 2-5x faster than stdlib json
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: blocks only when the request budget is
+    actually exhausted, instead of taxing every call with a fixed sleep
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: float = 10.0):
+        self.rate = rate          # tokens refilled per second
+        self.capacity = capacity  # burst allowance
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def acquire(self):
+        """Take one token, sleeping just long enough if none are available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            self.tokens = 1
+            self.last = time.monotonic()
+
+        self.tokens -= 1
+
+    def drain(self, seconds: float):
+        """Empty the bucket so the next request waits at least this long"""
+        self.tokens = min(self.tokens, -seconds * self.rate)
+        self.last = time.monotonic()
+
+
+def _make_extractor(field: str):
+    """
+    Build a typed-default field extractor: itemgetter is a C-level
+    callable, and None/missing both normalize to 0.0 once here instead
+    of `dict.get(...) or 0` on every row of every hot loop
+    """
+    getter = itemgetter(field)
+
+    def extract(row) -> float:
+        try:
+            return getter(row) or 0.0
+        except KeyError:
+            return 0.0
+
+    return extract
+
+
+extract_operating_cf = _make_extractor('operatingCashFlow')
+extract_capex = _make_extractor('capitalExpenditure')
+extract_free_cash_flow = _make_extractor('freeCashFlow')
+
+
+class CircuitBreaker:
+    """
+    Stops hammering the API during an outage: after `threshold`
+    consecutive failures, calls short-circuit for `cooldown` seconds
+    instead of paying a timeout (and quota) per endpoint per ticker
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may proceed (False while the breaker is open)"""
+        with self._lock:
+            return time.monotonic() >= self.open_until
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.open_until = time.monotonic() + self.cooldown
+                self.failures = 0
+
+
+class ResponseCache:
+    """
+    On-disk cache for API responses, keyed by endpoint+params
+    Fundamentals change at most quarterly, so repeat runs on the same
+    tickers can be served locally instead of burning the 250-req/day quota
+    """
+
+    # TTL in seconds by endpoint prefix; quotes go stale fast, profiles don't
+    DEFAULT_TTL = 12 * 3600
+    TTL_BY_ENDPOINT = {
+        'profile': 7 * 24 * 3600,
+        'quote-short': 300,
+        'income-statement': 24 * 3600,
+        'balance-sheet-statement': 24 * 3600,
+        'cash-flow-statement': 24 * 3600,
+        'key-metrics': 24 * 3600,
+    }
+
+    def __init__(self, cache_path: str = "fmp_cache.db"):
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT,
+                expires_at REAL,
+                etag TEXT,
+                last_modified TEXT
+            )
+        """)
+        # Upgrade caches created before the conditional-GET columns
+        for column in ('etag', 'last_modified'):
+            try:
+                self.conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+            except sqlite3.OperationalError:
+                pass
+        self.conn.commit()
+
+    @staticmethod
+    def _key(endpoint: str, params: Dict) -> str:
+        query = urlencode(sorted((k, v) for k, v in params.items() if k != 'apikey'))
+        return hashlib.sha1(f"{endpoint}?{query}".encode()).hexdigest()
+
+    def _ttl(self, endpoint: str) -> float:
+        return self.TTL_BY_ENDPOINT.get(endpoint.split('/')[0], self.DEFAULT_TTL)
+
+    def get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """Return the cached response, or None if missing/expired"""
+        row = self.conn.execute(
+            "SELECT payload, expires_at FROM responses WHERE key = ?",
+            (self._key(endpoint, params),)
+        ).fetchone()
+
+        if row and row[1] > time.time():
+            return json.loads(row[0])
+        return None
+
+    def get_stale(self, endpoint: str, params: Dict):
+        """
+        Return (payload, etag, last_modified) even when expired, so the
+        caller can revalidate with a conditional GET; None if missing
+        """
+        row = self.conn.execute(
+            "SELECT payload, etag, last_modified FROM responses WHERE key = ?",
+            (self._key(endpoint, params),)
+        ).fetchone()
+
+        if row:
+            return json.loads(row[0]), row[1], row[2]
+        return None
+
+    def put(self, endpoint: str, params: Dict, payload,
+            etag: str = None, last_modified: str = None):
+        """Store a response with the endpoint's TTL and its validators"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, payload, expires_at, etag, last_modified)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (self._key(endpoint, params), json.dumps(payload),
+             time.time() + self._ttl(endpoint), etag, last_modified)
+        )
+        self.conn.commit()
+
+    def touch(self, endpoint: str, params: Dict):
+        """Extend a revalidated entry's TTL without rewriting the body"""
+        self.conn.execute(
+            "UPDATE responses SET expires_at = ? WHERE key = ?",
+            (time.time() + self._ttl(endpoint), self._key(endpoint, params))
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
 
 
 class DataFetcher:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_path: str = "fmp_cache.db"):
         """
         Initialize data fetcher with API key
         Get free API key from: https://financialmodelingprep.com/developer/docs/
+        Pass cache_path=None to disable the on-disk response cache
         """
         self.api_key = api_key or "demo"  # demo key for testing, limited to few stocks
         self.base_url = "https://financialmodelingprep.com/api/v3"
-    
+
+        # Reuse one pooled session so repeated calls to the same host
+        # skip the TCP+TLS handshake, and retry transient server errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        )
+        self.session.mount("https://", adapter)
+        # FMP JSON compresses ~8x; negotiate everything the server offers
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate, br"})
+
+        # FMP free tier allows ~300 req/min; throttle only when we
+        # actually approach that, not on every single call
+        self.bucket = TokenBucket(rate=5.0, capacity=10.0)
+        self.breaker = CircuitBreaker(threshold=5, cooldown=30.0)
+        self.cache = ResponseCache(cache_path) if cache_path else None
+
+        # Short-lived in-memory quote cache for tight screening loops
+        # that revisit the same ticker within a run
+        self._price_cache = {}
+        self._price_cache_ttl = 60.0
+        self._price_cache_max = 4096
+
+        # Full stock list bucketed by exchange, refreshed daily, so
+        # repeated exchange filters are dict lookups, not 30k-row scans
+        self._stock_list = None
+        self._stock_groups = None
+        self._stock_list_expiry = 0.0
+
+        # Warm the pool in the background so the first real request
+        # doesn't pay DNS + TCP + TLS setup on the critical path
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _warm_up(self):
+        try:
+            self.session.head(self.base_url, timeout=5)
+        except requests.exceptions.RequestException:
+            pass  # best-effort; the real request will report any problem
+
+    def close(self):
+        """Close the underlying HTTP session and cache"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request with error handling"""
         if params is None:
             params = {}
         params['apikey'] = self.api_key
-        
+
+        stale = None
+        if self.cache:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+            # Expired entry: keep it around to revalidate with a 304
+            stale = self.cache.get_stale(endpoint, params)
+
+        if not self.breaker.allow():
+            print(f"Skipping {endpoint}: circuit breaker open (API unreachable)")
+            return None
+
+        headers = {}
+        if stale:
+            _, etag, last_modified = stale
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        self.bucket.acquire()
         try:
-            response = requests.get(f"{self.base_url}/{endpoint}", params=params)
+            response = self.session.get(f"{self.base_url}/{endpoint}", params=params,
+                                        headers=headers or None, timeout=(3.05, 15))
+            if response.status_code == 304 and stale:
+                # Body unchanged server-side; reuse it and extend the TTL
+                self.breaker.record_success()
+                self.cache.touch(endpoint, params)
+                return stale[0]
+            if response.status_code == 429:
+                # Back off for as long as the server asks before retrying
+                retry_after = float(response.headers.get('Retry-After', 1))
+                self.bucket.drain(retry_after)
             response.raise_for_status()
-            time.sleep(0.3)  # Rate limiting courtesy
-            return response.json()
+            data = _json_loads(response.content)
+            self.breaker.record_success()
+            if self.cache and data is not None:
+                self.cache.put(endpoint, params, data,
+                               etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'))
+            return data
         except requests.exceptions.RequestException as e:
+            self.breaker.record_failure()
             print(f"Error fetching {endpoint}: {e}")
             return None
     
+    def _refresh_stock_list(self):
+        """Fetch the full stock list and bucket it by exchange (24h TTL)"""
+        if self._stock_groups is not None and time.monotonic() < self._stock_list_expiry:
+            return
+
+        data = self._make_request("stock/list")
+        if not data:
+            return
+
+        groups = defaultdict(list)
+        for stock in data:
+            groups[stock.get('exchangeShortName')].append(stock)
+
+        self._stock_list = data
+        self._stock_groups = dict(groups)
+        self._stock_list_expiry = time.monotonic() + 24 * 3600
+
     def get_stock_list(self, exchange: str = None) -> List[Dict]:
         """
         Get list of all stocks, optionally filtered by exchange
         Exchanges: NYSE, NASDAQ, AMEX, etc.
         """
-        endpoint = "stock/list"
-        data = self._make_request(endpoint)
-        
-        if not data:
+        self._refresh_stock_list()
+
+        if self._stock_groups is None:
             return []
-        
-        # Filter by exchange if specified
+
         if exchange:
-            data = [stock for stock in data if stock.get('exchangeShortName') == exchange]
-        
-        return data
+            return self._stock_groups.get(exchange, [])
+
+        return self._stock_list
     
     def get_company_profile(self, ticker: str) -> Optional[Dict]:
         """Get company profile information"""
@@ -88,12 +393,24 @@ class DataFetcher:
         return data if data else []
     
     def get_current_price(self, ticker: str) -> Optional[float]:
-        """Get current stock price"""
+        """Get current stock price (memoized for 60s per ticker)"""
+        cached = self._price_cache.get(ticker)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
         endpoint = f"quote-short/{ticker}"
         data = self._make_request(endpoint)
         if data and len(data) > 0:
-            return data[0].get('price')
+            price = data[0].get('price')
+            if len(self._price_cache) >= self._price_cache_max:
+                self._price_cache.clear()
+            self._price_cache[ticker] = (price, time.monotonic() + self._price_cache_ttl)
+            return price
         return None
+
+    def invalidate_price(self, ticker: str):
+        """Drop a ticker's memoized quote so the next call refetches"""
+        self._price_cache.pop(ticker, None)
     
     def get_financial_data_complete(self, ticker: str) -> Dict:
         """
@@ -119,6 +436,53 @@ class DataFetcher:
             'current_price': current_price
         }
     
+    def get_company_profiles(self, tickers: List[str]) -> Dict[str, Dict]:
+        """
+        Get company profiles for many tickers in chunked batch requests
+        FMP accepts comma-joined symbols, so 100 tickers cost 1 request
+        """
+        profiles = {}
+        for i in range(0, len(tickers), 100):
+            chunk = tickers[i:i + 100]
+            data = self._make_request(f"profile/{','.join(chunk)}")
+            for profile in data or []:
+                if profile.get('symbol'):
+                    profiles[profile['symbol']] = profile
+        return profiles
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Get current prices for many tickers in chunked batch requests"""
+        prices = {}
+        for i in range(0, len(tickers), 100):
+            chunk = tickers[i:i + 100]
+            data = self._make_request(f"quote-short/{','.join(chunk)}")
+            for quote in data or []:
+                if quote.get('symbol'):
+                    prices[quote['symbol']] = quote.get('price')
+        return prices
+
+    def get_financial_data_complete_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """
+        Get complete datasets for many tickers, batching the endpoints
+        that support comma-joined symbols (profiles and quotes)
+        """
+        profiles = self.get_company_profiles(tickers)
+        prices = self.get_current_prices(tickers)
+
+        results = {}
+        for ticker in tickers:
+            # Statement endpoints are per-ticker on the free tier
+            results[ticker] = {
+                'ticker': ticker,
+                'profile': profiles.get(ticker),
+                'income_statements': self.get_income_statement(ticker),
+                'balance_sheets': self.get_balance_sheet(ticker),
+                'cash_flows': self.get_cash_flow(ticker),
+                'key_metrics': self.get_key_metrics(ticker),
+                'current_price': prices.get(ticker)
+            }
+        return results
+
     def get_exchange_tickers(self, exchange: str, limit: int = None) -> List[str]:
         """Get list of tickers for a specific exchange"""
         stocks = self.get_stock_list(exchange)
@@ -134,16 +498,32 @@ class DataFetcher:
         Calculate Free Cash Flow from cash flow statement
         FCF = Operating Cash Flow - Capital Expenditures
         """
-        operating_cf = cash_flow.get('operatingCashFlow', 0) or 0
-        capex = cash_flow.get('capitalExpenditure', 0) or 0
+        operating_cf = extract_operating_cf(cash_flow)
+        capex = extract_capex(cash_flow)
         
         # CapEx is usually negative, but sometimes reported as positive
         if capex > 0:
             capex = -capex
-        
+
         fcf = operating_cf + capex  # capex is negative
         return fcf
 
+    def calculate_fcf_batch(self, cash_flows: List[Dict]) -> np.ndarray:
+        """
+        Vectorized FCF for a list of cash flow statements
+        Column extraction + one array op replaces the per-row Python
+        branch; np.abs handles the occasional positive-signed CapEx
+        """
+        ocf = np.fromiter(
+            map(extract_operating_cf, cash_flows),
+            dtype=np.float64, count=len(cash_flows)
+        )
+        capex = np.fromiter(
+            map(extract_capex, cash_flows),
+            dtype=np.float64, count=len(cash_flows)
+        )
+        return ocf - np.abs(capex)
+
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -4,31 +4,60 @@ Provides 30+ years of financial data from SEC filings
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
+import threading
 import time
 
 
 class RoicDataFetcher:
+    # Minimum spacing between API requests (rate-limiting courtesy)
+    _MIN_REQUEST_INTERVAL = 0.1
     def __init__(self, api_key: str):
         """
         Initialize Roic.ai fetcher with API key
         """
         self.api_key = api_key
         self.base_url = "https://api.roic.ai/v2"
-    
+
+        # Persistent session: keep-alive skips the per-request TCP+TLS
+        # handshake, and the pool is sized for analyze_exchange's workers
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504])
+        ))
+
+        # Request pacing state; the lock keeps slot reservation atomic
+        # when analyze_exchange fetches from several threads
+        self._pace_lock = threading.Lock()
+        self._next_request = time.monotonic()
+
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[List]:
         """Make API request with error handling"""
         if params is None:
             params = {}
         params['apikey'] = self.api_key
-        
+
         url = f"{self.base_url}/{endpoint}"
-        
+
+        # Pace before the request rather than sleeping after the
+        # response: back-to-back calls still space out, but a caller who
+        # already waited (e.g. doing DCF math) proceeds immediately
+        with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_request - now
+            self._next_request = max(self._next_request, now) + self._MIN_REQUEST_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
-            time.sleep(0.1)  # Rate limiting courtesy
-            
+
             data = response.json()
             # Debug output disabled - uncomment if needed
             # print(f"DEBUG - {endpoint}: {type(data)}, Length: {len(data) if isinstance(data, (list, dict)) else 'N/A'}")
@@ -12,10 +12,28 @@ import json
 class DCFDatabase:
     def __init__(self, db_path: str = "dcf_analysis.db"):
         self.db_path = db_path
+        # One connection for the life of the object; check_same_thread is
+        # off because analyze_exchange workers write through the
+        # analyzer's DB lock
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._apply_pragmas()
         self.init_database()
-    
+
+    def _apply_pragmas(self):
+        """Tune SQLite for batch-heavy writes"""
+        # WAL lets readers run during writes and, with synchronous=NORMAL,
+        # cuts fsyncs to one per commit instead of two
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")   # 64 MiB page cache
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB mmap
+
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return self.conn
+
+    def close(self):
+        self.conn.close()
     
     def init_database(self):
         """Initialize database schema"""
@@ -94,41 +112,52 @@ class DCFDatabase:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_calc_date ON dcf_calculations(calculation_date)")
         
         conn.commit()
-        conn.close()
     
     def add_stock(self, ticker: str, company_name: str = None, 
                   exchange: str = None, sector: str = None, industry: str = None):
         """Add or update stock information"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO stocks (ticker, company_name, exchange, sector, industry, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (ticker, company_name, exchange, sector, industry, datetime.now()))
-        
-        conn.commit()
-        conn.close()
+        # with-block scopes the transaction: commit on success,
+        # rollback if the INSERT raises
+        with self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO stocks (ticker, company_name, exchange, sector, industry, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (ticker, company_name, exchange, sector, industry, datetime.now()))
     
     def add_financial_data(self, ticker: str, period_date: str, period_type: str,
                           revenue: float, operating_income: float, net_income: float,
                           free_cash_flow: float, total_debt: float, 
                           cash_and_equivalents: float, shares_outstanding: float):
         """Add financial data for a specific period"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO financial_data 
-            (ticker, period_date, period_type, revenue, operating_income, net_income,
-             free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (ticker, period_date, period_type, revenue, operating_income, net_income,
-              free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding))
-        
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO financial_data
+                (ticker, period_date, period_type, revenue, operating_income, net_income,
+                 free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (ticker, period_date, period_type, revenue, operating_income, net_income,
+                  free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding))
     
+    def add_financial_data_bulk(self, rows: List[tuple]):
+        """
+        Insert many financial-data periods in a single transaction.
+        Each row is a tuple matching add_financial_data's argument order:
+        (ticker, period_date, period_type, revenue, operating_income,
+         net_income, free_cash_flow, total_debt, cash_and_equivalents,
+         shares_outstanding). One executemany + commit means one fsync
+        for the whole batch instead of one per period.
+        """
+        if not rows:
+            return
+
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO financial_data
+                (ticker, period_date, period_type, revenue, operating_income, net_income,
+                 free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
     def save_dcf_calculation(self, ticker: str, model_type: str, parameters: Dict,
                            intrinsic_value: float, current_price: float,
                            wacc: float, terminal_growth_rate: float,
@@ -136,24 +165,19 @@ class DCFDatabase:
                            terminal_value: float, enterprise_value: float,
                            equity_value: float, shares_outstanding: float):
         """Save DCF calculation results with full historical tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         discount_pct = ((intrinsic_value - current_price) / current_price * 100) if current_price > 0 else None
-        
-        cursor.execute("""
-            INSERT INTO dcf_calculations 
-            (ticker, calculation_date, model_type, parameters, intrinsic_value,
-             current_price, discount_pct, wacc, terminal_growth_rate, projection_years,
-             fcf_projections, terminal_value, enterprise_value, equity_value, shares_outstanding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (ticker, datetime.now(), model_type, json.dumps(parameters),
-              intrinsic_value, current_price, discount_pct, wacc, terminal_growth_rate,
-              projection_years, json.dumps(fcf_projections), terminal_value,
-              enterprise_value, equity_value, shares_outstanding))
-        
-        conn.commit()
-        conn.close()
+
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO dcf_calculations
+                (ticker, calculation_date, model_type, parameters, intrinsic_value,
+                 current_price, discount_pct, wacc, terminal_growth_rate, projection_years,
+                 fcf_projections, terminal_value, enterprise_value, equity_value, shares_outstanding)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (ticker, datetime.now(), model_type, json.dumps(parameters),
+                  intrinsic_value, current_price, discount_pct, wacc, terminal_growth_rate,
+                  projection_years, json.dumps(fcf_projections), terminal_value,
+                  enterprise_value, equity_value, shares_outstanding))
     
     def get_latest_dcf(self, ticker: str) -> Optional[Dict]:
         """Get the most recent DCF calculation for a ticker"""
@@ -168,7 +192,6 @@ class DCFDatabase:
         """, (ticker,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             columns = [desc[0] for desc in cursor.description]
@@ -192,7 +215,6 @@ class DCFDatabase:
         cursor.execute(query, (ticker,))
         rows = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
-        conn.close()
         
         return [dict(zip(columns, row)) for row in rows]
     
@@ -213,7 +235,6 @@ class DCFDatabase:
         
         rows = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
-        conn.close()
         
         return [dict(zip(columns, row)) for row in rows]
     
@@ -231,6 +252,5 @@ class DCFDatabase:
         
         rows = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
-        conn.close()
         
         return [dict(zip(columns, row)) for row in rows]
@@ -6,6 +6,8 @@ Supports multiple DCF models with configurable parameters
 from typing import List, Dict, Optional
 import statistics
 
+import numpy as np
+
 
 class DCFCalculator:
     def __init__(self):
@@ -106,12 +108,12 @@ class DCFCalculator:
             base_fcf = historical_fcf[0]
             print(f"  Using most recent value as starting point: ${base_fcf:.2f}")
         
-        projections = []
-        for year in range(1, projection_years + 1):
-            projected_fcf = base_fcf * ((1 + growth_rate) ** year)
-            projections.append(projected_fcf)
-        
-        return projections
+        # Closed-form compound growth for all years at once; tolist()
+        # keeps the result JSON-serializable for the database layer
+        years = np.arange(1, projection_years + 1)
+        projections = base_fcf * (1 + growth_rate) ** years
+
+        return projections.tolist()
     
     def project_fcf_revenue_based(self, historical_revenue: List[float],
                                  historical_fcf: List[float],
@@ -136,16 +138,12 @@ class DCFCalculator:
         if fcf_margin_target is None:
             fcf_margin_target = statistics.mean(fcf_margins) if fcf_margins else 0.15
         
-        # Project revenue and apply margin
+        # Project revenue and apply margin (vectorized compound growth)
         base_revenue = historical_revenue[0]
-        projections = []
-        
-        for year in range(1, projection_years + 1):
-            projected_revenue = base_revenue * ((1 + revenue_growth_rate) ** year)
-            projected_fcf = projected_revenue * fcf_margin_target
-            projections.append(projected_fcf)
-        
-        return projections
+        years = np.arange(1, projection_years + 1)
+        projections = base_revenue * (1 + revenue_growth_rate) ** years * fcf_margin_target
+
+        return projections.tolist()
     
     def calculate_terminal_value(self, final_fcf: float,
                                 terminal_growth_rate: float,
@@ -166,12 +164,12 @@ class DCFCalculator:
         Discount cash flows to present value
         PV = CF / (1 + WACC)^year
         """
-        present_value = 0
-        for year, cf in enumerate(cash_flows, start=1):
-            pv = cf / ((1 + wacc) ** year)
-            present_value += pv
-        
-        return present_value
+        if not len(cash_flows):
+            return 0.0
+
+        cf = np.asarray(cash_flows, dtype=np.float64)
+        years = np.arange(1, len(cf) + 1)
+        return float((cf / (1 + wacc) ** years).sum())
     
     def calculate_dcf_simple(self, historical_fcf: List[float],
                            params: Dict = None) -> Dict:
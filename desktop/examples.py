@@ -4,6 +4,10 @@ Example Usage Script
 Demonstrates key features of the DCF Analyzer
 """
 
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from main import DCFAnalyzer
 from config import get_dcf_preset, get_screening_preset, list_presets
 import time
@@ -31,13 +35,55 @@ def demo_multiple_analyses(analyzer):
     print("="*60)
     
     stocks = ['AAPL', 'MSFT', 'GOOGL']
-    
-    for ticker in stocks:
+
+    def analyze_one(ticker):
         print(f"\n--- {ticker} ---")
         try:
             # Analyze with conservative parameters
-            result = analyzer.analyze_stock(ticker, params=get_dcf_preset('conservative'))
-            time.sleep(1)  # Rate limiting
+            return analyzer.analyze_stock(ticker, params=get_dcf_preset('conservative'))
+        except Exception as e:
+            print(f"Error: {e}")
+            return None
+
+    # Overlap the network waits; throttling lives in the fetcher's token bucket
+    with ThreadPoolExecutor(max_workers=min(8, len(stocks))) as executor:
+        results = list(executor.map(analyze_one, stocks))
+
+
+def demo_pipelined_analyses(analyzer):
+    """Demo: Prefetch the next ticker's data while analyzing the current one"""
+    print("\n" + "="*60)
+    print("DEMO 2b: Pipelined Prefetch Analysis")
+    print("="*60)
+
+    stocks = ['AAPL', 'MSFT', 'GOOGL']
+    prefetched = queue.Queue(maxsize=2)
+
+    def producer():
+        # Background thread keeps the queue primed with fetched data
+        for ticker in stocks:
+            try:
+                prefetched.put((ticker, analyzer.fetcher.get_financial_data_complete(ticker)))
+            except Exception as e:
+                prefetched.put((ticker, e))
+        prefetched.put(None)  # sentinel: no more tickers
+
+    threading.Thread(target=producer, daemon=True).start()
+
+    # Main thread runs the DCF compute on already-fetched data, so the
+    # network wait for ticker N+1 overlaps the math for ticker N
+    while True:
+        item = prefetched.get()
+        if item is None:
+            break
+        ticker, data = item
+        print(f"\n--- {ticker} ---")
+        if isinstance(data, Exception):
+            print(f"Error: {data}")
+            continue
+        try:
+            analyzer.analyze_stock(ticker, params=get_dcf_preset('conservative'),
+                                   prefetched_data=data)
         except Exception as e:
             print(f"Error: {e}")
 
@@ -135,10 +181,11 @@ def interactive_demo():
         print("6. Custom parameters")
         print("7. Show available presets")
         print("8. Run all demos")
+        print("9. Pipelined prefetch analysis")
         print("0. Exit")
         print("="*60)
-        
-        choice = input("\nSelect option (0-8): ").strip()
+
+        choice = input("\nSelect option (0-9): ").strip()
         
         if choice == '1':
             demo_single_stock_analysis(analyzer)
@@ -154,12 +201,16 @@ def interactive_demo():
             demo_custom_parameters(analyzer)
         elif choice == '7':
             list_presets()
+        elif choice == '9':
+            demo_pipelined_analyses(analyzer)
         elif choice == '8':
             print("\nRunning all demos...")
             demo_single_stock_analysis(analyzer)
             time.sleep(2)
             demo_multiple_analyses(analyzer)
             time.sleep(2)
+            demo_pipelined_analyses(analyzer)
+            time.sleep(2)
             demo_screening(analyzer)
             time.sleep(2)
             demo_trending_analysis(analyzer)
@@ -6,17 +6,113 @@ Makes it easy to run analyses without command line
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import contextlib
 import threading
-import subprocess
+import json
+import re
 import sys
 import os
+import time
+
+# Matches a plain (possibly negative) decimal number
+_NUM_RE = re.compile(r'^-?\d+(\.\d+)?$')
+
+# Plausible ticker symbol (AAPL, BRK.B, RDS-A, ...); rejecting garbage
+# up-front saves launching an analysis that can only fail
+_TICKER_RE = re.compile(r'^[A-Z][A-Z0-9.\-]{0,9}$')
+
+# Lazily-loaded module cache: heavy/rarely-used siblings are imported on
+# first use, and repeat uses skip the import machinery entirely
+_lazy_modules = {}
+
+
+def _lazy_import(name):
+    module = _lazy_modules.get(name)
+    if module is None:
+        import importlib
+        module = importlib.import_module(name)
+        _lazy_modules[name] = module
+    return module
+
+
+_PRESET_CONFIGS = None
+
+
+def _get_preset_configs():
+    """Import config.PRESET_CONFIGS once and cache the reference"""
+    global _PRESET_CONFIGS
+    if _PRESET_CONFIGS is None:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        if current_dir not in sys.path:
+            sys.path.insert(0, current_dir)
+        from config import PRESET_CONFIGS
+        _PRESET_CONFIGS = PRESET_CONFIGS
+    return _PRESET_CONFIGS
+
+
+class _BatchedOutputWriter:
+    """
+    File-like stdout/stderr target for in-process CLI runs: accumulates
+    writes on the worker thread and flushes batched text to the Tk
+    thread via root.after() every ~50ms.
+    """
+
+    def __init__(self, root, append, interval=0.05, max_pending=65536):
+        self._root = root
+        self._append = append
+        self._interval = interval
+        self._max_pending = max_pending
+        self._chunks = []
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text):
+        if text:
+            self._chunks.append(text)
+            self._pending += len(text)
+            now = time.monotonic()
+            # Flush on the timer, or early if a burst piles up ~64KB so
+            # pending output can't grow without bound between ticks
+            if now - self._last_flush >= self._interval or self._pending >= self._max_pending:
+                self.flush_pending()
+                self._last_flush = now
+        return len(text)
+
+    def flush(self):
+        # print() calls flush() per line; batching is time-based instead
+        pass
+
+    def flush_pending(self):
+        if self._chunks:
+            blob = ''.join(self._chunks)
+            self._chunks = []
+            self._pending = 0
+            self._root.after(0, self._append, blob)
+
 
 class DCFAnalyzerGUI:
+    # Parsed custom_presets.json, shared across instances and
+    # invalidated by mtime so saves/reloads skip redundant JSON parses
+    _presets_cache = {'mtime': None, 'data': None}
+
     def __init__(self, root):
         self.root = root
         self.root.title("DCF Stock Analyzer")
         self.root.geometry("900x650")
         
+        # Cache of key-file contents keyed by mtime, so radio toggles
+        # don't re-stat + re-read the same file on every event
+        self._api_key_cache = {}
+
+        # Pending after() id for the debounced percentage-label refresh
+        self._pct_after_id = None
+
+        # Resolve the interpreter once; every launch button reuses it
+        self._python_cmd = self.get_python_command()
+
+        # Last time the output pane autoscrolled (throttled in _append_output)
+        self._last_scroll = 0.0
+
         # Load API key if exists
         self.api_key = self.load_api_key()
         
@@ -31,42 +127,86 @@ class DCFAnalyzerGUI:
     
     def load_all_presets(self):
         """Load both built-in and custom presets"""
-        import os
-        
         # Load built-in presets from config.py
         try:
-            import sys
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            if current_dir not in sys.path:
-                sys.path.insert(0, current_dir)
-            
-            from config import PRESET_CONFIGS
-            self.preset_configs = PRESET_CONFIGS.copy()
-        except:
+            self.preset_configs = _get_preset_configs().copy()
+        except ImportError:
             self.preset_configs = {}
-        
+
         # Load custom presets from JSON file
         self.custom_presets_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'custom_presets.json')
         try:
-            if os.path.exists(self.custom_presets_file):
-                import json
-                with open(self.custom_presets_file, 'r') as f:
-                    custom_presets = json.load(f)
-                    self.preset_configs.update(custom_presets)
-                    print(f"Loaded {len(custom_presets)} custom presets")
+            custom_presets = self._load_custom_presets()
+            if custom_presets:
+                self.preset_configs.update(custom_presets)
+                print(f"Loaded {len(custom_presets)} custom presets")
         except Exception as e:
             print(f"Error loading custom presets: {e}")
-        
+
+        # Presets are immutable between edits, so format the percentage
+        # label strings once here instead of on every preset switch
+        self._preset_pct_labels = {
+            name: self._format_pct_labels(preset)
+            for name, preset in self.preset_configs.items()
+        }
+
+    @staticmethod
+    def _format_pct_labels(preset):
+        """Pre-format the four percentage label strings for a preset"""
+        return (
+            f"({preset.get('wacc', 0)*100:.1f}%)",
+            f"({preset.get('terminal_growth_rate', 0)*100:.1f}%)",
+            f"({preset.get('fcf_growth_rate', 0)*100:.1f}%)",
+            f"({preset.get('conservative_adjustment', 0)*100:.1f}%)",
+        )
+
+    def _load_custom_presets(self):
+        """Parse custom_presets.json through the mtime-keyed cache"""
+        # Open first and fstat the handle: one path resolution instead
+        # of the exists()/stat()+open() double syscall
+        try:
+            f = open(self.custom_presets_file, 'r')
+        except OSError:
+            return {}
+
+        with f:
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+            cache = self._presets_cache
+            if cache['mtime'] != mtime:
+                cache['data'] = json.load(f)
+                cache['mtime'] = mtime
+        return cache['data']
+        
+    def _read_key_file(self, path):
+        """
+        Read a key file through the mtime cache; returns None if missing.
+        A single open() + fstat replaces the exists()+stat()+open()
+        syscall chain, and unchanged files are served from memory.
+        """
+        try:
+            with open(path, "r") as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                cached = self._api_key_cache.get(path)
+                if cached and cached[0] == mtime:
+                    return cached[1]
+                data = f.read().strip()
+        except OSError:
+            self._api_key_cache.pop(path, None)
+            return None
+
+        self._api_key_cache[path] = (mtime, data)
+        return data
+
     def load_api_key(self):
         """Load API key from file if it exists"""
         # Try roic key first (more likely to be set)
-        if os.path.exists("roic_api_key.txt"):
-            with open("roic_api_key.txt", "r") as f:
-                return f.read().strip()
+        key = self._read_key_file("roic_api_key.txt")
+        if key is not None:
+            return key
         # Fall back to generic api_key.txt
-        if os.path.exists("api_key.txt"):
-            with open("api_key.txt", "r") as f:
-                return f.read().strip()
+        key = self._read_key_file("api_key.txt")
+        if key is not None:
+            return key
         return ""
     
     def save_api_key(self):
@@ -99,11 +239,10 @@ class DCFAnalyzerGUI:
                 foreground="orange"
             )
             # Load roic API key if saved
-            if os.path.exists("roic_api_key.txt"):
-                with open("roic_api_key.txt", "r") as f:
-                    key = f.read().strip()
-                    self.api_key_entry.delete(0, tk.END)
-                    self.api_key_entry.insert(0, key)
+            key = self._read_key_file("roic_api_key.txt")
+            if key is not None:
+                self.api_key_entry.delete(0, tk.END)
+                self.api_key_entry.insert(0, key)
             
             # Enable EPS option for roic
             self.eps_radio.config(state='normal')
@@ -122,13 +261,12 @@ class DCFAnalyzerGUI:
     def auto_load_data_source(self):
         """Auto-select data source and load key on startup"""
         # If roic key exists, default to roic
-        if os.path.exists("roic_api_key.txt"):
+        if self._read_key_file("roic_api_key.txt") is not None:
             self.data_source_var.set("roic")
-            self.on_data_source_changed()
         # Otherwise default to yahoo
         else:
             self.data_source_var.set("yahoo")
-            self.on_data_source_changed()
+        self.on_data_source_changed()
         
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -161,28 +299,31 @@ class DCFAnalyzerGUI:
         self.api_key_status.grid(row=1, column=2, sticky="w", pady=3, padx=5)
         
         # Tabs for different operations
-        notebook = ttk.Notebook(self.root)
-        notebook.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Tab 1: Single Stock Analysis
-        self.single_tab = ttk.Frame(notebook)
-        notebook.add(self.single_tab, text="Analyze Stock")
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=5)
+
+        # Tab 1: Single Stock Analysis (default view, built eagerly)
+        self.single_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.single_tab, text="Analyze Stock")
         self.create_single_analysis_tab()
-        
-        # Tab 2: Batch Analysis
-        self.batch_tab = ttk.Frame(notebook)
-        notebook.add(self.batch_tab, text="Batch Analysis")
-        self.create_batch_analysis_tab()
-        
-        # Tab 3: Screening
-        self.screen_tab = ttk.Frame(notebook)
-        notebook.add(self.screen_tab, text="Screen Stocks")
-        self.create_screening_tab()
-        
-        # Tab 4: Trending
-        self.trend_tab = ttk.Frame(notebook)
-        notebook.add(self.trend_tab, text="View Trends")
-        self.create_trending_tab()
+
+        # Remaining tabs get empty frames now and are populated on
+        # first view, which keeps widget construction off the cold path
+        self.batch_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.batch_tab, text="Batch Analysis")
+
+        self.screen_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.screen_tab, text="Screen Stocks")
+
+        self.trend_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.trend_tab, text="View Trends")
+
+        self._tab_builders = {
+            str(self.batch_tab): self.create_batch_analysis_tab,
+            str(self.screen_tab): self.create_screening_tab,
+            str(self.trend_tab): self.create_trending_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Output Area
         output_frame = ttk.LabelFrame(self.root, text="Output", padding=10)
@@ -191,6 +332,12 @@ class DCFAnalyzerGUI:
         self.output_text = scrolledtext.ScrolledText(output_frame, height=10)
         self.output_text.pack(fill="both", expand=True)
         
+    def _on_tab_changed(self, event=None):
+        """Build a lazily-created tab's widgets the first time it is shown"""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+
     def create_single_analysis_tab(self):
         """Create single stock analysis tab"""
         main_frame = ttk.Frame(self.single_tab, padding=20)
@@ -206,8 +353,8 @@ class DCFAnalyzerGUI:
         self.ticker_entry.insert(0, "AAPL")
         
         ttk.Label(left_frame, text="Parameter Preset:").grid(row=1, column=0, sticky="w", pady=5)
-        preset_names = list(self.preset_configs.keys())
-        self.preset_combo = ttk.Combobox(left_frame, values=preset_names, width=18, state="readonly")
+        self._preset_names_tuple = tuple(self.preset_configs.keys())
+        self.preset_combo = ttk.Combobox(left_frame, values=self._preset_names_tuple, width=18, state="readonly")
         self.preset_combo.grid(row=1, column=1, sticky="w", pady=5)
         self.preset_combo.set("moderate")
         self.preset_combo.bind("<<ComboboxSelected>>", self.on_preset_changed)
@@ -232,13 +379,17 @@ class DCFAnalyzerGUI:
         right_frame = ttk.LabelFrame(main_frame, text="DCF Parameters", padding=10)
         right_frame.grid(row=0, column=1, sticky="nsew", padx=(20, 0))
         
-        # Parameter controls
+        # Parameter controls: each entry is backed by a StringVar so
+        # value refreshes are one set() instead of a config/delete/
+        # insert/config round-trip per widget
         self.param_entries = {}
+        self.param_vars = {}
         
         row = 0
         # WACC
         ttk.Label(right_frame, text="WACC (Discount Rate):").grid(row=row, column=0, sticky="w", pady=3)
-        self.param_entries['wacc'] = ttk.Entry(right_frame, width=10, state="readonly")
+        self.param_vars['wacc'] = tk.StringVar()
+        self.param_entries['wacc'] = ttk.Entry(right_frame, width=10, state="readonly", textvariable=self.param_vars['wacc'])
         self.param_entries['wacc'].grid(row=row, column=1, sticky="w", pady=3, padx=5)
         self.wacc_pct_label = ttk.Label(right_frame, text="", foreground="gray")
         self.wacc_pct_label.grid(row=row, column=2, sticky="w", pady=3)
@@ -246,7 +397,8 @@ class DCFAnalyzerGUI:
         row += 1
         # Terminal Growth Rate
         ttk.Label(right_frame, text="Terminal Growth Rate:").grid(row=row, column=0, sticky="w", pady=3)
-        self.param_entries['terminal_growth_rate'] = ttk.Entry(right_frame, width=10, state="readonly")
+        self.param_vars['terminal_growth_rate'] = tk.StringVar()
+        self.param_entries['terminal_growth_rate'] = ttk.Entry(right_frame, width=10, state="readonly", textvariable=self.param_vars['terminal_growth_rate'])
         self.param_entries['terminal_growth_rate'].grid(row=row, column=1, sticky="w", pady=3, padx=5)
         self.terminal_pct_label = ttk.Label(right_frame, text="", foreground="gray")
         self.terminal_pct_label.grid(row=row, column=2, sticky="w", pady=3)
@@ -255,7 +407,8 @@ class DCFAnalyzerGUI:
         # FCF Growth Rate
         self.growth_rate_label = ttk.Label(right_frame, text="FCF Growth Rate:")
         self.growth_rate_label.grid(row=row, column=0, sticky="w", pady=3)
-        self.param_entries['fcf_growth_rate'] = ttk.Entry(right_frame, width=10, state="readonly")
+        self.param_vars['fcf_growth_rate'] = tk.StringVar()
+        self.param_entries['fcf_growth_rate'] = ttk.Entry(right_frame, width=10, state="readonly", textvariable=self.param_vars['fcf_growth_rate'])
         self.param_entries['fcf_growth_rate'].grid(row=row, column=1, sticky="w", pady=3, padx=5)
         self.revenue_pct_label = ttk.Label(right_frame, text="", foreground="gray")
         self.revenue_pct_label.grid(row=row, column=2, sticky="w", pady=3)
@@ -263,13 +416,15 @@ class DCFAnalyzerGUI:
         row += 1
         # Projection Years
         ttk.Label(right_frame, text="Projection Years:").grid(row=row, column=0, sticky="w", pady=3)
-        self.param_entries['projection_years'] = ttk.Entry(right_frame, width=10, state="readonly")
+        self.param_vars['projection_years'] = tk.StringVar()
+        self.param_entries['projection_years'] = ttk.Entry(right_frame, width=10, state="readonly", textvariable=self.param_vars['projection_years'])
         self.param_entries['projection_years'].grid(row=row, column=1, sticky="w", pady=3, padx=5)
         
         row += 1
         # Conservative Adjustment
         ttk.Label(right_frame, text="Conservative Adjustment:").grid(row=row, column=0, sticky="w", pady=3)
-        self.param_entries['conservative_adjustment'] = ttk.Entry(right_frame, width=10, state="readonly")
+        self.param_vars['conservative_adjustment'] = tk.StringVar()
+        self.param_entries['conservative_adjustment'] = ttk.Entry(right_frame, width=10, state="readonly", textvariable=self.param_vars['conservative_adjustment'])
         self.param_entries['conservative_adjustment'].grid(row=row, column=1, sticky="w", pady=3, padx=5)
         self.conserv_pct_label = ttk.Label(right_frame, text="", foreground="gray")
         self.conserv_pct_label.grid(row=row, column=2, sticky="w", pady=3)
@@ -305,6 +460,14 @@ class DCFAnalyzerGUI:
         self.reset_btn = ttk.Button(button_frame, text="Reset to Preset", command=self.reset_to_preset, state="disabled")
         self.reset_btn.pack(side="left", padx=5)
         
+        # (entry, label) pairs for the debounced percentage refresh
+        self._pct_fields = [
+            (self.param_entries['wacc'], self.wacc_pct_label),
+            (self.param_entries['terminal_growth_rate'], self.terminal_pct_label),
+            (self.param_entries['fcf_growth_rate'], self.revenue_pct_label),
+            (self.param_entries['conservative_adjustment'], self.conserv_pct_label),
+        ]
+
         # Initialize with moderate preset
         self.is_custom_mode = False
         self.load_preset_parameters("moderate")
@@ -327,27 +490,26 @@ class DCFAnalyzerGUI:
             return
         
         preset = self.preset_configs[preset_name]
+
+        # Update entries: StringVar.set works even while the entry is
+        # readonly, so this is one Tcl call per field with no state
+        # toggling; after_idle coalesces the refresh with pending redraws
+        values = [(self.param_vars[key], str(preset.get(key, 0)))
+                  for key in self.param_vars]
+
+        def apply_values():
+            for var, value in values:
+                var.set(value)
+
+        self.root.after_idle(apply_values)
         
-        # Update entries
-        for key, entry in self.param_entries.items():
-            value = preset.get(key, 0)
-            entry.config(state="normal")
-            entry.delete(0, tk.END)
-            entry.insert(0, str(value))
-            entry.config(state="readonly")
-        
-        # Update percentage labels
-        wacc = preset.get('wacc', 0)
-        self.wacc_pct_label.config(text=f"({wacc*100:.1f}%)")
-        
-        terminal = preset.get('terminal_growth_rate', 0)
-        self.terminal_pct_label.config(text=f"({terminal*100:.1f}%)")
-        
-        revenue = preset.get('fcf_growth_rate', 0)
-        self.revenue_pct_label.config(text=f"({revenue*100:.1f}%)")
-        
-        conserv = preset.get('conservative_adjustment', 0)
-        self.conserv_pct_label.config(text=f"({conserv*100:.1f}%)")
+        # Update percentage labels from the strings formatted at load
+        wacc_pct, terminal_pct, fcf_pct, conserv_pct = self._preset_pct_labels.get(
+            preset_name) or self._format_pct_labels(preset)
+        self.wacc_pct_label.config(text=wacc_pct)
+        self.terminal_pct_label.config(text=terminal_pct)
+        self.revenue_pct_label.config(text=fcf_pct)
+        self.conserv_pct_label.config(text=conserv_pct)
         
         # Update status
         self.param_status_label.config(text=f"Using preset: {preset_name}", foreground="blue")
@@ -364,16 +526,27 @@ class DCFAnalyzerGUI:
         self.param_status_label.config(text="Custom parameters (modified)", foreground="orange")
         self.is_custom_mode = True
         
-        # Bind change events to update percentage labels
-        self.param_entries['wacc'].bind('<KeyRelease>', lambda e: self.update_percentage_labels())
-        self.param_entries['terminal_growth_rate'].bind('<KeyRelease>', lambda e: self.update_percentage_labels())
-        self.param_entries['fcf_growth_rate'].bind('<KeyRelease>', lambda e: self.update_percentage_labels())
-        self.param_entries['conservative_adjustment'].bind('<KeyRelease>', lambda e: self.update_percentage_labels())
+        # Bind change events to update percentage labels (debounced);
+        # keep the funcids so disable_customization can unbind them
+        self._keyrelease_binds = [
+            (entry, entry.bind('<KeyRelease>', self._on_keyrelease))
+            for entry, _ in self._pct_fields
+        ]
     
+    def _on_keyrelease(self, event):
+        """Single bound handler for all parameter entries (no lambda frames)"""
+        self._schedule_pct_update()
+
     def disable_customization(self):
         """Disable parameter editing"""
         for entry in self.param_entries.values():
             entry.config(state="readonly")
+
+        # Remove the KeyRelease bindings so stale callbacks don't fire
+        # while the entries are readonly
+        for entry, funcid in getattr(self, '_keyrelease_binds', ()):
+            entry.unbind('<KeyRelease>', funcid)
+        self._keyrelease_binds = []
         
         self.customize_btn.config(state="normal")
         self.save_preset_btn.config(state="disabled")
@@ -387,44 +560,31 @@ class DCFAnalyzerGUI:
         """Reset parameters to selected preset"""
         self.disable_customization()
     
+    def _schedule_pct_update(self):
+        """Debounce label refreshes so only the last keystroke in a burst paints"""
+        if self._pct_after_id is not None:
+            self.root.after_cancel(self._pct_after_id)
+        self._pct_after_id = self.root.after(80, self.update_percentage_labels)
+
     def update_percentage_labels(self):
         """Update percentage labels when values change"""
-        try:
-            wacc = float(self.param_entries['wacc'].get())
-            self.wacc_pct_label.config(text=f"({wacc*100:.1f}%)")
-        except:
-            pass
-        
-        try:
-            terminal = float(self.param_entries['terminal_growth_rate'].get())
-            self.terminal_pct_label.config(text=f"({terminal*100:.1f}%)")
-        except:
-            pass
-        
-        try:
-            revenue = float(self.param_entries['fcf_growth_rate'].get())
-            self.revenue_pct_label.config(text=f"({revenue*100:.1f}%)")
-        except:
-            pass
-        
-        try:
-            conserv = float(self.param_entries['conservative_adjustment'].get())
-            self.conserv_pct_label.config(text=f"({conserv*100:.1f}%)")
-        except:
-            pass
+        self._pct_after_id = None
+        for entry, label in self._pct_fields:
+            # Regex pre-check keeps the common invalid/partial input off
+            # the exception path (raising allocates a traceback per event)
+            text = entry.get()
+            if _NUM_RE.match(text):
+                label.config(text=f"({float(text)*100:.1f}%)")
     
     def save_custom_preset(self):
         """Save custom parameters as a preset"""
-        from tkinter import simpledialog
-        import json
-        import os
-        
+        simpledialog = _lazy_import('tkinter.simpledialog')
+
         # Ask user if they want to update existing or create new
         current_preset = self.preset_combo.get()
-        
+
         # Check if current preset is a built-in one
-        from config import PRESET_CONFIGS
-        is_builtin = current_preset in PRESET_CONFIGS
+        is_builtin = current_preset in _get_preset_configs()
         
         if is_builtin:
             # For built-in presets, only offer "Save As New"
@@ -475,27 +635,32 @@ class DCFAnalyzerGUI:
             messagebox.showerror("Invalid Values", f"Please enter valid numeric values.\n{e}")
             return
         
-        # Load existing custom presets
-        custom_presets = {}
-        if os.path.exists(self.custom_presets_file):
-            try:
-                with open(self.custom_presets_file, 'r') as f:
-                    custom_presets = json.load(f)
-            except:
-                pass
-        
+        # Load existing custom presets (cached parse)
+        try:
+            custom_presets = dict(self._load_custom_presets())
+        except (OSError, json.JSONDecodeError):
+            custom_presets = {}
+
         # Add/update preset
         custom_presets[preset_name] = new_preset
-        
+
         # Save to file
         try:
             with open(self.custom_presets_file, 'w') as f:
                 json.dump(custom_presets, f, indent=4)
+
+            # Refresh the cache from the dict we just wrote instead of
+            # forcing a re-read on the next load
+            self._presets_cache['data'] = custom_presets
+            self._presets_cache['mtime'] = os.stat(self.custom_presets_file).st_mtime_ns
             
-            # Reload presets immediately
+            # Reload presets immediately; only append to the combobox
+            # model when the name is actually new
             self.preset_configs.update(custom_presets)
-            preset_names = list(self.preset_configs.keys())
-            self.preset_combo['values'] = preset_names
+            self._preset_pct_labels[preset_name] = self._format_pct_labels(new_preset)
+            if preset_name not in self._preset_names_tuple:
+                self._preset_names_tuple = self._preset_names_tuple + (preset_name,)
+                self.preset_combo['values'] = self._preset_names_tuple
             self.preset_combo.set(preset_name)
             
             # Load the new preset
@@ -507,102 +672,6 @@ class DCFAnalyzerGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save preset: {e}")
     
-    def save_preset_to_file(self, preset_name, preset_data):
-        """Save preset to config.py file"""
-        try:
-            import os
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.py')
-            
-            print(f"Saving preset '{preset_name}' to {config_path}")
-            
-            # Read current config
-            with open(config_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Find PRESET_CONFIGS section
-            start_idx = None
-            end_idx = None
-            for i, line in enumerate(lines):
-                if 'PRESET_CONFIGS = {' in line:
-                    start_idx = i
-                if start_idx is not None and line.strip() == '}':
-                    # Make sure this is the closing brace for PRESET_CONFIGS
-                    # Check if next non-empty line starts SCREENING_PRESETS
-                    is_preset_end = False
-                    for j in range(i+1, min(i+5, len(lines))):
-                        if lines[j].strip():
-                            if 'SCREENING_PRESETS' in lines[j]:
-                                is_preset_end = True
-                            break
-                    if is_preset_end:
-                        end_idx = i
-                        break
-            
-            if start_idx is None or end_idx is None:
-                print(f"Could not find PRESET_CONFIGS section. start={start_idx}, end={end_idx}")
-                return False
-            
-            print(f"Found PRESET_CONFIGS from line {start_idx} to {end_idx}")
-            
-            # Build new preset entry
-            new_entry = f'''    "{preset_name}": {{
-        "name": "{preset_data['name']}",
-        "description": "{preset_data['description']}",
-        "wacc": {preset_data['wacc']},
-        "terminal_growth_rate": {preset_data['terminal_growth_rate']},
-        "projection_years": {preset_data['projection_years']},
-        "fcf_growth_rate": {preset_data['fcf_growth_rate']},
-        "conservative_adjustment": {preset_data['conservative_adjustment']}
-    }},
-'''
-            
-            # Check if preset already exists
-            preset_exists = False
-            preset_start = None
-            preset_end = None
-            
-            for i in range(start_idx, end_idx):
-                if f'"{preset_name}":' in lines[i]:
-                    preset_exists = True
-                    preset_start = i
-                    print(f"Preset '{preset_name}' already exists at line {i}")
-                    # Find end of this preset (next preset or closing brace)
-                    indent_level = len(lines[i]) - len(lines[i].lstrip())
-                    for j in range(i+1, end_idx):
-                        # Check if this line starts a new preset (same indent, has quotes and colon)
-                        if lines[j].strip() and not lines[j].strip().startswith('"'):
-                            continue
-                        line_indent = len(lines[j]) - len(lines[j].lstrip())
-                        if line_indent == indent_level and '":' in lines[j]:
-                            preset_end = j
-                            break
-                    if preset_end is None:
-                        preset_end = end_idx
-                    print(f"Preset ends at line {preset_end}")
-                    break
-            
-            # Update or add preset
-            if preset_exists:
-                # Replace existing preset
-                print(f"Replacing lines {preset_start} to {preset_end}")
-                lines[preset_start:preset_end] = [new_entry]
-            else:
-                # Add new preset before closing brace
-                print(f"Adding new preset at line {end_idx}")
-                lines.insert(end_idx, new_entry)
-            
-            # Write back to file
-            with open(config_path, 'w') as f:
-                f.writelines(lines)
-            
-            print(f"Successfully saved preset '{preset_name}'")
-            return True
-        except Exception as e:
-            print(f"Error saving preset: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-        
     def create_batch_analysis_tab(self):
         """Create batch analysis tab"""
         frame = ttk.Frame(self.batch_tab, padding=20)
@@ -667,48 +736,67 @@ class DCFAnalyzerGUI:
     
     def open_api_website(self):
         """Open API key website"""
-        import webbrowser
-        webbrowser.open("https://financialmodelingprep.com/developer/docs/")
+        _lazy_import('webbrowser').open("https://financialmodelingprep.com/developer/docs/")
         
     def get_python_command(self):
         """Get the correct python command"""
         return sys.executable
     
     def run_command(self, cmd):
-        """Run a command and show output"""
+        """Run a main.py command in-process and show output"""
         self.output_text.delete(1.0, tk.END)
         self.output_text.insert(tk.END, f"Running: {' '.join(cmd)}\n\n")
         self.output_text.see(tk.END)
-        
+
+        # The CLI runs in this interpreter now — no subprocess spawn,
+        # module re-import, or DB re-open per click. Drop the
+        # "python main.py" prefix the command builders still produce.
+        argv = cmd[2:] if len(cmd) > 2 and cmd[1] == "main.py" else cmd
+
         def execute():
+            # Worker thread: route CLI prints through the batching writer,
+            # which marshals text to the Tk thread via after()
+            writer = _BatchedOutputWriter(self.root, self._append_output)
             try:
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
-                )
-                
-                for line in process.stdout:
-                    self.output_text.insert(tk.END, line)
-                    self.output_text.see(tk.END)
-                    self.root.update()
-                
-                process.wait()
-                
-                if process.returncode == 0:
-                    self.output_text.insert(tk.END, "\n✓ Command completed successfully!\n")
+                run_cli = _lazy_import('main').run_cli
+                with contextlib.redirect_stdout(writer), \
+                     contextlib.redirect_stderr(writer):
+                    returncode = run_cli(argv)
+                writer.flush_pending()
+
+                if returncode == 0:
+                    self.root.after(0, self._append_output,
+                                    "\n✓ Command completed successfully!\n", True)
                 else:
-                    self.output_text.insert(tk.END, f"\n✗ Command failed with code {process.returncode}\n")
-                    
+                    self.root.after(0, self._append_output,
+                                    f"\n✗ Command failed with code {returncode}\n", True)
+
+            except SystemExit as e:
+                writer.flush_pending()
+                # argparse exits with code 0 on --help and bare
+                # sys.exit() leaves code as None; neither is a failure
+                if e.code in (0, None):
+                    self.root.after(0, self._append_output,
+                                    "\n✓ Command completed successfully!\n", True)
+                else:
+                    self.root.after(0, self._append_output,
+                                    f"\n✗ Command failed with code {e.code}\n", True)
             except Exception as e:
-                self.output_text.insert(tk.END, f"\n✗ Error: {str(e)}\n")
-            
-            self.output_text.see(tk.END)
-        
+                writer.flush_pending()
+                self.root.after(0, self._append_output, f"\n✗ Error: {str(e)}\n", True)
+
         thread = threading.Thread(target=execute, daemon=True)
         thread.start()
+
+    def _append_output(self, blob, force_scroll=False):
+        """Append a batch of command output (runs on the Tk thread)"""
+        self.output_text.insert(tk.END, blob)
+        # see() forces a geometry recompute, so autoscroll at most ~10x/s
+        # during streaming; completion messages always scroll into view
+        now = time.monotonic()
+        if force_scroll or now - self._last_scroll > 0.1:
+            self.output_text.see(tk.END)
+            self._last_scroll = now
     
     def run_single_analysis(self):
         """Run single stock analysis"""
@@ -727,10 +815,14 @@ class DCFAnalyzerGUI:
         if not ticker:
             messagebox.showwarning("No Ticker", "Please enter a stock ticker")
             return
-        
+
+        if not _TICKER_RE.match(ticker):
+            messagebox.showwarning("Invalid Ticker", f"'{ticker}' does not look like a valid ticker symbol")
+            return
+
         # Build command
         cmd = [
-            self.get_python_command(),
+            self._python_cmd,
             "main.py",
             "--api-key", api_key,
             "--data-source", data_source,
@@ -739,12 +831,9 @@ class DCFAnalyzerGUI:
         
         # Add years-back parameter for roic
         if data_source == "roic":
-            try:
-                years_back = self.years_back_entry.get().strip()
-                if years_back:
-                    cmd.extend(["--years-back", years_back])
-            except:
-                pass  # Use default if error
+            years_back = self.years_back_entry.get().strip()
+            if years_back:
+                cmd.extend(["--years-back", years_back])
         
         # If in custom mode, pass individual parameters
         if self.is_custom_mode:
@@ -778,7 +867,7 @@ class DCFAnalyzerGUI:
             api_key = "not_needed_with_yahoo_finance"
         
         cmd = [
-            self.get_python_command(),
+            self._python_cmd,
             "main.py",
             "--api-key", api_key,
             "batch", exchange,
@@ -794,7 +883,7 @@ class DCFAnalyzerGUI:
         top = self.top_entry.get().strip()
         
         cmd = [
-            self.get_python_command(),
+            self._python_cmd,
             "main.py",
             "screen",
             "--min-discount", discount,
@@ -811,9 +900,13 @@ class DCFAnalyzerGUI:
         if not ticker:
             messagebox.showwarning("No Ticker", "Please enter a stock ticker")
             return
-        
+
+        if not _TICKER_RE.match(ticker):
+            messagebox.showwarning("Invalid Ticker", f"'{ticker}' does not look like a valid ticker symbol")
+            return
+
         cmd = [
-            self.get_python_command(),
+            self._python_cmd,
             "main.py",
             "trending", ticker,
             "--periods", periods
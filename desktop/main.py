@@ -7,23 +7,31 @@ Mass DCF analysis tool for finding mispriced stocks
 import argparse
 import json
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict
-from database import DCFDatabase
-from dcf_calculator import DCFCalculator
-from screener import StockScreener
+
+# orjson serializes large exports ~10x faster; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Divisor/suffix table for format_value, largest first
+_VALUE_SUFFIXES = ((1e12, 'T'), (1e9, 'B'), (1e6, 'M'))
 
 
 def format_value(value):
     """Format large numbers with T/B/M notation"""
-    if abs(value) >= 1_000_000_000_000:
-        return f"${value / 1_000_000_000_000:.1f}T"
-    elif abs(value) >= 1_000_000_000:
-        return f"${value / 1_000_000_000:.1f}B"
-    elif abs(value) >= 1_000_000:
-        return f"${value / 1_000_000:.1f}M"
-    else:
-        return f"${value:,.0f}"
+    av = abs(value)
+    for divisor, suffix in _VALUE_SUFFIXES:
+        if av >= divisor:
+            return f"${value / divisor:.1f}{suffix}"
+    return f"${value:,.0f}"
 
 
 class DCFAnalyzer:
@@ -35,6 +43,12 @@ class DCFAnalyzer:
         - "yahoo": Yahoo Finance (free, 4-5 years of data, no API key needed)
         - "roic": Roic.ai (paid, 30+ years of data, requires API key)
         """
+        # Imported here rather than at module top so save-key/--help
+        # invocations don't pay for sqlite/numpy-backed modules
+        from database import DCFDatabase
+        from dcf_calculator import DCFCalculator
+        from screener import StockScreener
+
         self.db = DCFDatabase(db_path)
         self.data_source = data_source
         
@@ -50,15 +64,22 @@ class DCFAnalyzer:
         
         self.calculator = DCFCalculator()
         self.screener = StockScreener(self.db)
+        # Serializes SQLite writes when analyze_exchange runs tickers in parallel
+        self._db_lock = threading.Lock()
     
-    def analyze_stock(self, ticker: str, params: Dict = None, save: bool = True, years_back: int = None) -> Dict:
+    def analyze_stock(self, ticker: str, params: Dict = None, save: bool = True,
+                      years_back: int = None, prefetched_data: Dict = None,
+                      json_output: bool = False) -> Dict:
         """
         Analyze a single stock with DCF
         years_back: Number of years of historical data to fetch (only used with roic.ai)
+        prefetched_data: Already-fetched dataset (skips the network fetch)
+        json_output: Emit the result as one JSON line instead of the report
         """
-        print(f"\n{'='*60}")
-        print(f"Analyzing {ticker}")
-        print(f"{'='*60}")
+        if not json_output:
+            print(f"\n{'='*60}")
+            print(f"Analyzing {ticker}")
+            print(f"{'='*60}")
         
         # Determine years_back based on data source and parameters
         if years_back is None:
@@ -70,7 +91,9 @@ class DCFAnalyzer:
                 years_back = 5
         
         # Fetch data - roic supports years_back parameter
-        if hasattr(self.fetcher, 'get_financial_data_complete'):
+        if prefetched_data is not None:
+            financial_data = prefetched_data
+        elif hasattr(self.fetcher, 'get_financial_data_complete'):
             if self.data_source == "roic":
                 financial_data = self.fetcher.get_financial_data_complete(ticker, years_back=years_back)
             else:
@@ -84,40 +107,48 @@ class DCFAnalyzer:
         
         # Save company info
         profile = financial_data['profile']
-        self.db.add_stock(
-            ticker=ticker,
-            company_name=profile.get('companyName'),
-            exchange=profile.get('exchangeShortName'),
-            sector=profile.get('sector'),
-            industry=profile.get('industry')
-        )
+        with self._db_lock:
+            self.db.add_stock(
+                ticker=ticker,
+                company_name=profile.get('companyName'),
+                exchange=profile.get('exchangeShortName'),
+                sector=profile.get('sector'),
+                industry=profile.get('industry')
+            )
         
-        # Save financial data
+        # Save financial data — collect the periods and write them in one
+        # transaction rather than one INSERT+commit per period
         if financial_data['cash_flows']:
+            # Index statements by date once; beats rescanning the lists
+            # for every period when years_back is large
+            income_by_date = {i.get('date'): i for i in financial_data['income_statements']}
+            balance_by_date = {b.get('date'): b for b in financial_data['balance_sheets']}
+
+            rows = []
             for cf in financial_data['cash_flows'][:5]:
                 # Get matching income statement and balance sheet
                 period_date = cf.get('date')
-                
-                # Find matching statements
-                income = next((i for i in financial_data['income_statements'] 
-                             if i.get('date') == period_date), {})
-                balance = next((b for b in financial_data['balance_sheets'] 
-                              if b.get('date') == period_date), {})
-                
+
+                income = income_by_date.get(period_date, {})
+                balance = balance_by_date.get(period_date, {})
+
                 fcf = self.fetcher.calculate_fcf_from_statements(cf)
-                
-                self.db.add_financial_data(
-                    ticker=ticker,
-                    period_date=period_date,
-                    period_type=cf.get('period', 'annual'),
-                    revenue=income.get('revenue', 0) or 0,
-                    operating_income=income.get('operatingIncome', 0) or 0,
-                    net_income=income.get('netIncome', 0) or 0,
-                    free_cash_flow=fcf,
-                    total_debt=balance.get('totalDebt', 0) or 0,
-                    cash_and_equivalents=balance.get('cashAndCashEquivalents', 0) or 0,
-                    shares_outstanding=balance.get('commonStock', 0) or 0
-                )
+
+                rows.append((
+                    ticker,
+                    period_date,
+                    cf.get('period', 'annual'),
+                    income.get('revenue', 0) or 0,
+                    income.get('operatingIncome', 0) or 0,
+                    income.get('netIncome', 0) or 0,
+                    fcf,
+                    balance.get('totalDebt', 0) or 0,
+                    balance.get('cashAndCashEquivalents', 0) or 0,
+                    balance.get('commonStock', 0) or 0
+                ))
+
+            with self._db_lock:
+                self.db.add_financial_data_bulk(rows)
         
         # Run DCF
         dcf_result = self.calculator.run_full_dcf(financial_data, params=params)
@@ -130,91 +161,120 @@ class DCFAnalyzer:
         intrinsic_value = dcf_result['intrinsic_value_per_share']
         current_price = financial_data['current_price']
         
-        # Section 1: Company Info
-        print(f"\nCompany: {profile.get('companyName')}")
-        print(f"Sector: {profile.get('sector')}")
-        print(f"Current Price: ${current_price:.2f}")
-        print(f"Intrinsic Value: ${intrinsic_value:.2f}")
-        
         discount = ((intrinsic_value - current_price) / current_price * 100) if current_price else 0
-        print(f"Discount/Premium: {discount:+.2f}%")
-        
-        if discount > 20:
-            print(f"*** UNDERVALUED - Trading {abs(discount):.1f}% below intrinsic value ***")
-        elif discount < -20:
-            print(f"*** OVERVALUED - Trading {abs(discount):.1f}% above intrinsic value ***")
-        else:
-            print(f"*** FAIRLY VALUED ***")
-        
-        # Section 2: DCF Parameters Used
-        print(f"\nDCF Parameters:")
-        
-        # Show input type
-        input_type = dcf_result.get('input_type', 'fcf')
-        input_label = "EPS from Continuing Ops" if input_type == 'eps_cont_ops' else "Free Cash Flow per Share"
-        print(f"  Input Type: {input_label}")
-        
-        print(f"  WACC (Discount Rate): {dcf_result['params']['wacc']*100:.1f}%")
-        print(f"  Terminal Growth Rate: {dcf_result['params']['terminal_growth_rate']*100:.1f}%")
-        
-        # Show growth rate with historical comparison
-        fcf_growth = dcf_result['params'].get('fcf_growth_rate', 0)
-        historical_growth = dcf_result.get('historical_fcf_growth', 0)
-        years_used = dcf_result.get('historical_years_used', 0)
-        growth_label = "EPS Growth Rate" if input_type == 'eps_cont_ops' else "FCF Growth Rate"
-        if historical_growth != 0 and years_used > 0:
-            print(f"  {growth_label}: {fcf_growth*100:.1f}% (Historical {years_used}-yr: {historical_growth*100:.1f}%)")
+
+        if json_output:
+            # One machine-readable line per analysis; consumers parse
+            # instead of scraping the human report
+            payload = {
+                'ticker': ticker,
+                'company_name': profile.get('companyName'),
+                'sector': profile.get('sector'),
+                'current_price': current_price,
+                'intrinsic_value': intrinsic_value,
+                'discount_pct': discount,
+                'wacc': dcf_result['params']['wacc'],
+                'terminal_growth_rate': dcf_result['params']['terminal_growth_rate'],
+                'fcf_growth_rate': dcf_result['params'].get('fcf_growth_rate', 0),
+                'projection_years': dcf_result['params']['projection_years'],
+                'equity_value': dcf_result.get('equity_value', dcf_result['enterprise_value']),
+            }
+            if orjson is not None:
+                sys.stdout.write(orjson.dumps(payload, default=str).decode() + "\n")
+            else:
+                sys.stdout.write(json.dumps(payload, default=str) + "\n")
         else:
-            print(f"  {growth_label}: {fcf_growth*100:.1f}%")
-        
-        print(f"  Projection Years: {dcf_result['params']['projection_years']}")
-        
-        # Conservative adjustment is actually margin of safety
-        margin_of_safety = dcf_result['params'].get('conservative_adjustment', 0.0)
-        if margin_of_safety > 0:
-            print(f"  Margin of Safety: {margin_of_safety*100:.1f}%")
-        
-        # Section 3: Valuation Breakdown
-        print(f"\nValuation Breakdown:")
-        
-        # PV of future cash flows
-        pv_fcf = dcf_result.get('pv_fcf', 0)
-        total_fcf = sum(dcf_result.get('fcf_projections', []))
-        projection_years = dcf_result['params']['projection_years']
-        print(f"  PV of {projection_years} Years of FCF: {format_value(pv_fcf)} (Total FCF: {format_value(total_fcf)})")
-        
-        # Terminal value
-        terminal_value_pv = dcf_result.get('pv_terminal', dcf_result['terminal_value'])
-        terminal_value_actual = dcf_result['terminal_value']
-        print(f"  PV of Terminal Value: {format_value(terminal_value_pv)} (Terminal Value: {format_value(terminal_value_actual)})")
-        
-        # Total equity value with market cap (before margin of safety)
-        total_equity_value = dcf_result.get('equity_value', dcf_result['enterprise_value'])
-        shares_outstanding = dcf_result.get('shares_outstanding', 1)
-        market_cap = current_price * shares_outstanding if current_price and shares_outstanding > 0 else 0
-        print(f"  Total Equity Value: {format_value(total_equity_value)} (Market Cap: {format_value(market_cap)})")
-        
-        # Equity value per share - use the intrinsic value which has margin of safety applied
-        # This matches the "Intrinsic Value" shown above
-        print(f"  Total Equity Value per Share: ${intrinsic_value:.2f} (Current Price: ${current_price:.2f})")
+            # Build the whole report in a list and emit it with one stdout
+            # write: ~30 print calls (each locking/flushing stdout) become
+            # one, and the report stays contiguous under concurrent analyses
+            lines = []
+
+            # Section 1: Company Info
+            lines.append(f"\nCompany: {profile.get('companyName')}")
+            lines.append(f"Sector: {profile.get('sector')}")
+            lines.append(f"Current Price: ${current_price:.2f}")
+            lines.append(f"Intrinsic Value: ${intrinsic_value:.2f}")
+            lines.append(f"Discount/Premium: {discount:+.2f}%")
+
+            if discount > 20:
+                lines.append(f"*** UNDERVALUED - Trading {abs(discount):.1f}% below intrinsic value ***")
+            elif discount < -20:
+                lines.append(f"*** OVERVALUED - Trading {abs(discount):.1f}% above intrinsic value ***")
+            else:
+                lines.append(f"*** FAIRLY VALUED ***")
+
+            # Section 2: DCF Parameters Used
+            lines.append(f"\nDCF Parameters:")
+
+            # Show input type
+            input_type = dcf_result.get('input_type', 'fcf')
+            input_label = "EPS from Continuing Ops" if input_type == 'eps_cont_ops' else "Free Cash Flow per Share"
+            lines.append(f"  Input Type: {input_label}")
+
+            lines.append(f"  WACC (Discount Rate): {dcf_result['params']['wacc']*100:.1f}%")
+            lines.append(f"  Terminal Growth Rate: {dcf_result['params']['terminal_growth_rate']*100:.1f}%")
+
+            # Show growth rate with historical comparison
+            fcf_growth = dcf_result['params'].get('fcf_growth_rate', 0)
+            historical_growth = dcf_result.get('historical_fcf_growth', 0)
+            years_used = dcf_result.get('historical_years_used', 0)
+            growth_label = "EPS Growth Rate" if input_type == 'eps_cont_ops' else "FCF Growth Rate"
+            if historical_growth != 0 and years_used > 0:
+                lines.append(f"  {growth_label}: {fcf_growth*100:.1f}% (Historical {years_used}-yr: {historical_growth*100:.1f}%)")
+            else:
+                lines.append(f"  {growth_label}: {fcf_growth*100:.1f}%")
+
+            lines.append(f"  Projection Years: {dcf_result['params']['projection_years']}")
+
+            # Conservative adjustment is actually margin of safety
+            margin_of_safety = dcf_result['params'].get('conservative_adjustment', 0.0)
+            if margin_of_safety > 0:
+                lines.append(f"  Margin of Safety: {margin_of_safety*100:.1f}%")
+
+            # Section 3: Valuation Breakdown
+            lines.append(f"\nValuation Breakdown:")
+
+            # PV of future cash flows
+            pv_fcf = dcf_result.get('pv_fcf', 0)
+            total_fcf = sum(dcf_result.get('fcf_projections', []))
+            projection_years = dcf_result['params']['projection_years']
+            lines.append(f"  PV of {projection_years} Years of FCF: {format_value(pv_fcf)} (Total FCF: {format_value(total_fcf)})")
+
+            # Terminal value
+            terminal_value_pv = dcf_result.get('pv_terminal', dcf_result['terminal_value'])
+            terminal_value_actual = dcf_result['terminal_value']
+            lines.append(f"  PV of Terminal Value: {format_value(terminal_value_pv)} (Terminal Value: {format_value(terminal_value_actual)})")
+
+            # Total equity value with market cap (before margin of safety)
+            total_equity_value = dcf_result.get('equity_value', dcf_result['enterprise_value'])
+            shares_outstanding = dcf_result.get('shares_outstanding', 1)
+            market_cap = current_price * shares_outstanding if current_price and shares_outstanding > 0 else 0
+            lines.append(f"  Total Equity Value: {format_value(total_equity_value)} (Market Cap: {format_value(market_cap)})")
+
+            # Equity value per share - use the intrinsic value which has margin of safety applied
+            # This matches the "Intrinsic Value" shown above
+            lines.append(f"  Total Equity Value per Share: ${intrinsic_value:.2f} (Current Price: ${current_price:.2f})")
+
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Save DCF calculation
         if save:
-            self.db.save_dcf_calculation(
-                ticker=ticker,
-                model_type=params.get('model_type', 'revenue_based') if params else 'revenue_based',
-                parameters=dcf_result['params'],
-                intrinsic_value=intrinsic_value,
-                current_price=current_price,
-                wacc=dcf_result['params']['wacc'],
-                terminal_growth_rate=dcf_result['params']['terminal_growth_rate'],
-                projection_years=dcf_result['params']['projection_years'],
-                fcf_projections=dcf_result['fcf_projections'],
-                terminal_value=dcf_result['terminal_value'],
-                enterprise_value=dcf_result['enterprise_value'],
-                equity_value=dcf_result['equity_value'],
-                shares_outstanding=dcf_result['shares_outstanding']
-            )
+            with self._db_lock:
+                self.db.save_dcf_calculation(
+                    ticker=ticker,
+                    model_type=params.get('model_type', 'revenue_based') if params else 'revenue_based',
+                    parameters=dcf_result['params'],
+                    intrinsic_value=intrinsic_value,
+                    current_price=current_price,
+                    wacc=dcf_result['params']['wacc'],
+                    terminal_growth_rate=dcf_result['params']['terminal_growth_rate'],
+                    projection_years=dcf_result['params']['projection_years'],
+                    fcf_projections=dcf_result['fcf_projections'],
+                    terminal_value=dcf_result['terminal_value'],
+                    enterprise_value=dcf_result['enterprise_value'],
+                    equity_value=dcf_result['equity_value'],
+                    shares_outstanding=dcf_result['shares_outstanding']
+                )
         
         return {
             'ticker': ticker,
@@ -224,37 +284,53 @@ class DCFAnalyzer:
             'dcf_result': dcf_result
         }
     
-    def analyze_exchange(self, exchange: str, limit: int = None, 
-                        params: Dict = None, delay: float = 1.0):
+    def analyze_exchange(self, exchange: str, limit: int = None,
+                        params: Dict = None, delay: float = 1.0,
+                        max_workers: int = 8):
         """
         Analyze all stocks in an exchange
+
+        Tickers run concurrently on a thread pool (the workload is
+        network-bound), with starts paced `delay` seconds apart so the
+        API budget is respected. DB writes are serialized by _db_lock.
         """
-        import time
-        
         print(f"\nFetching tickers for {exchange}...")
         tickers = self.fetcher.get_exchange_tickers(exchange, limit=limit)
-        
+
         print(f"Found {len(tickers)} tickers")
         print(f"Starting analysis... (this will take a while)")
-        
+
         successful = 0
         failed = 0
-        
-        for i, ticker in enumerate(tickers, 1):
-            print(f"\n[{i}/{len(tickers)}] Processing {ticker}...")
-            
-            try:
-                result = self.analyze_stock(ticker, params=params)
-                if result:
-                    successful += 1
-                else:
+
+        # Pace request starts: each worker reserves the next start slot,
+        # then sleeps outside the lock until its slot arrives
+        pace_lock = threading.Lock()
+        next_start = [time.monotonic()]
+
+        def analyze_paced(ticker):
+            with pace_lock:
+                now = time.monotonic()
+                wait = next_start[0] - now
+                next_start[0] = max(next_start[0], now) + delay
+            if wait > 0:
+                time.sleep(wait)
+            return self.analyze_stock(ticker, params=params)
+
+        workers = max(1, min(max_workers, len(tickers) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(analyze_paced, t): t for t in tickers}
+            for i, future in enumerate(as_completed(futures), 1):
+                ticker = futures[future]
+                print(f"\n[{i}/{len(tickers)}] Finished {ticker}")
+                try:
+                    if future.result():
+                        successful += 1
+                    else:
+                        failed += 1
+                except Exception as e:
+                    print(f"Error analyzing {ticker}: {e}")
                     failed += 1
-            except Exception as e:
-                print(f"Error analyzing {ticker}: {e}")
-                failed += 1
-            
-            # Rate limiting
-            time.sleep(delay)
         
         print(f"\n{'='*60}")
         print(f"Analysis Complete!")
@@ -315,13 +391,84 @@ class DCFAnalyzer:
             'results': results
         }
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(export_data, default=str,
+                                     option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(export_data, f, indent=2, default=str)
         
         print(f"\nExported {len(results)} results to {filename}")
 
 
-def main():
+def _cmd_analyze(analyzer, args):
+    params = {}
+
+    # Check if preset is specified
+    if args.preset:
+        from config import get_dcf_preset
+        preset_params = get_dcf_preset(args.preset)
+        if preset_params:
+            params = preset_params.copy()
+            print(f"Using preset: {args.preset}")
+        else:
+            print(f"Warning: Preset '{args.preset}' not found, using defaults")
+
+    # Individual parameters override preset
+    if args.wacc:
+        params['wacc'] = args.wacc
+    if args.growth:
+        params['fcf_growth_rate'] = args.growth
+    if args.terminal:
+        params['terminal_growth_rate'] = args.terminal
+    # argparse defines --input-type/--years-back on the analyze
+    # subparser, so the attributes always exist here
+    if args.input_type:
+        params['dcf_input_type'] = args.input_type
+        print(f"Using DCF input type: {args.input_type}")
+
+    analyzer.analyze_stock(args.ticker, params=params if params else None,
+                           years_back=args.years_back, json_output=args.json)
+
+
+def _cmd_batch(analyzer, args):
+    analyzer.analyze_exchange(args.exchange, limit=args.limit, delay=args.delay)
+
+
+def _cmd_screen(analyzer, args):
+    filters = {'min_discount_pct': args.min_discount}
+    analyzer.screen_stocks(filters=filters, top_n=args.top)
+
+
+def _cmd_trending(analyzer, args):
+    analyzer.show_trending(args.ticker, periods=args.periods)
+
+
+def _cmd_export(analyzer, args):
+    filters = {}
+    if args.min_discount:
+        filters['min_discount_pct'] = args.min_discount
+    analyzer.export_results(filename=args.output, filters=filters if filters else None)
+
+
+# Command name -> handler(analyzer, args); save-key is handled before
+# the analyzer is constructed
+COMMANDS = {
+    'analyze': _cmd_analyze,
+    'batch': _cmd_batch,
+    'screen': _cmd_screen,
+    'trending': _cmd_trending,
+    'export': _cmd_export,
+}
+
+
+def run_cli(argv: List[str] = None) -> int:
+    """
+    Parse and execute a CLI command. Importable entry point so the GUI
+    (or tests) can run commands in-process instead of spawning a fresh
+    interpreter; argv defaults to sys.argv[1:].
+    """
     parser = argparse.ArgumentParser(description='DCF Stock Analyzer')
     parser.add_argument('--api-key', help='API key (required for Roic.ai, optional for Yahoo Finance)')
     parser.add_argument('--db', default='dcf_analysis.db', help='Database path')
@@ -339,6 +486,8 @@ def main():
     analyze_parser.add_argument('--terminal', type=float, help='Terminal growth rate')
     analyze_parser.add_argument('--input-type', choices=['fcf', 'eps_cont_ops'], default='fcf', help='DCF input: fcf or eps_cont_ops (default: fcf)')
     analyze_parser.add_argument('--years-back', type=int, help='Years of historical data to fetch (roic.ai only, default: 10)')
+    analyze_parser.add_argument('--json', action='store_true',
+                                help='Emit the result as one JSON line instead of the report')
     
     # Batch analyze command
     batch_parser = subparsers.add_parser('batch', help='Analyze multiple stocks')
@@ -367,8 +516,8 @@ def main():
     save_key_parser.add_argument('--source', choices=['yahoo', 'roic'], default='roic',
                                  help='Which data source this key is for (default: roic)')
     
-    args = parser.parse_args()
-    
+    args = parser.parse_args(argv)
+
     # Auto-load API key from file if not provided
     api_key = args.api_key
     if not api_key:
@@ -389,61 +538,24 @@ def main():
             f.write(args.key)
         print(f"✓ API key saved to {filename}")
         print(f"You can now run commands without --api-key flag")
-        return
-    
+        return 0
+
     # Initialize analyzer
     analyzer = DCFAnalyzer(api_key=api_key, db_path=args.db, data_source=args.data_source)
     
-    # Execute command
-    if args.command == 'analyze':
-        params = {}
-        
-        # Check if preset is specified
-        if args.preset:
-            from config import get_dcf_preset
-            preset_params = get_dcf_preset(args.preset)
-            if preset_params:
-                params = preset_params.copy()
-                print(f"Using preset: {args.preset}")
-            else:
-                print(f"Warning: Preset '{args.preset}' not found, using defaults")
-        
-        # Individual parameters override preset
-        if args.wacc:
-            params['wacc'] = args.wacc
-        if args.growth:
-            params['fcf_growth_rate'] = args.growth
-        if args.terminal:
-            params['terminal_growth_rate'] = args.terminal
-        # Note: argparse converts --input-type to args.input_type
-        if hasattr(args, 'input_type') and args.input_type:
-            params['dcf_input_type'] = args.input_type
-            print(f"Using DCF input type: {args.input_type}")
-        
-        # Pass years_back if specified
-        years_back = args.years_back if hasattr(args, 'years_back') else None
-        
-        analyzer.analyze_stock(args.ticker, params=params if params else None, years_back=years_back)
-    
-    elif args.command == 'batch':
-        analyzer.analyze_exchange(args.exchange, limit=args.limit, delay=args.delay)
-    
-    elif args.command == 'screen':
-        filters = {'min_discount_pct': args.min_discount}
-        analyzer.screen_stocks(filters=filters, top_n=args.top)
-    
-    elif args.command == 'trending':
-        analyzer.show_trending(args.ticker, periods=args.periods)
-    
-    elif args.command == 'export':
-        filters = {}
-        if args.min_discount:
-            filters['min_discount_pct'] = args.min_discount
-        analyzer.export_results(filename=args.output, filters=filters if filters else None)
-    
+    # Execute command via the dispatch table
+    handler = COMMANDS.get(args.command)
+    if handler:
+        handler(analyzer, args)
     else:
         parser.print_help()
 
+    return 0
+
+
+def main():
+    return run_cli()
+
 
 if __name__ == "__main__":
     main()
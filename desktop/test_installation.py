@@ -6,6 +6,21 @@ Test script to verify DCF Analyzer installation
 import sys
 import os
 
+_test_db = None
+
+def get_test_db():
+    """Shared in-memory database for the tests below.
+
+    One :memory: database means the schema DDL runs once per test run
+    and no temp files or journal fsyncs are involved.
+    """
+    global _test_db
+    if _test_db is None:
+        from database import DCFDatabase
+        _test_db = DCFDatabase(":memory:")
+    return _test_db
+
+
 def test_imports():
     """Test that all modules can be imported"""
     print("Testing imports...")
@@ -27,15 +42,7 @@ def test_database():
     """Test database creation"""
     print("\nTesting database...")
     try:
-        from database import DCFDatabase
-        import tempfile
-        import os
-        
-        # Use a temporary file for testing
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        temp_file.close()
-        
-        db = DCFDatabase(temp_file.name)  # This will initialize the schema
+        db = get_test_db()  # Shared schema, initialized once
         
         # Test adding a stock
         db.add_stock('TEST', 'Test Company', 'NYSE', 'Technology', 'Software')
@@ -55,9 +62,6 @@ def test_database():
         )
         
         print("✓ Database operations successful")
-        
-        # Clean up temp file
-        os.unlink(temp_file.name)
         return True
     except Exception as e:
         print(f"✗ Database error: {e}")
@@ -98,22 +102,14 @@ def test_screener():
     """Test screening functionality"""
     print("\nTesting screener...")
     try:
-        from database import DCFDatabase
         from screener import StockScreener
-        import tempfile
-        import os
-        
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        temp_file.close()
         
-        db = DCFDatabase(temp_file.name)
-        screener = StockScreener(db)
+        screener = StockScreener(get_test_db())
         
-        # Test filtering (should return empty list with no data)
+        # Test filtering
         results = screener.filter_by_discount(min_discount_pct=10.0)
         
         print("✓ Screener operations successful")
-        os.unlink(temp_file.name)
         return True
     except Exception as e:
         print(f"✗ Screener error: {e}")
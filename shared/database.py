@@ -4,19 +4,75 @@ Handles storage of financial data, DCF calculations, and historical tracking
 """
 
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
 
+import numpy as np
+
 
 class DCFDatabase:
     def __init__(self, db_path: str = "dcf_analysis.db"):
         self.db_path = db_path
+        # One connection for the life of the object: no per-call
+        # open/close syscalls and the page cache stays warm across the
+        # screener's back-to-back queries
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # Memoized latest-per-ticker rows, keyed on (row count, newest
+        # calculation_date); invalidated by save_dcf_calculation_bulk
+        self._latest_dcf_cache = None
+        self._latest_version = None
+        # Columnar (struct-of-arrays) view of the cached latest rows,
+        # rebuilt whenever the row list changes identity
+        self._columnar_cache = None
+        self._columnar_rows = None
+        self._apply_pragmas()
         self.init_database()
-    
+
+    def _apply_pragmas(self):
+        """Tune SQLite for read-heavy screener scans with batch writes"""
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-131072")  # 128 MiB page cache
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB mmap'd reads
+
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return self.conn
+
+    def close(self):
+        # Let SQLite refresh planner statistics it deems stale
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
     
+    # discount_pct is derived from intrinsic_value/current_price by
+    # SQLite itself (STORED, so it is indexable), which keeps it
+    # consistent even if either input is later corrected via UPDATE
+    _CALC_SCHEMA = """(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ticker TEXT,
+        calculation_date TIMESTAMP,
+        calc_ts INTEGER,
+        model_type TEXT,
+        parameters TEXT,
+        intrinsic_value REAL,
+        current_price REAL,
+        discount_pct REAL GENERATED ALWAYS AS (
+            CASE WHEN current_price > 0
+                 THEN (intrinsic_value - current_price) * 100.0 / current_price
+            END) STORED,
+        wacc REAL,
+        terminal_growth_rate REAL,
+        projection_years INTEGER,
+        fcf_projections TEXT,
+        terminal_value REAL,
+        enterprise_value REAL,
+        equity_value REAL,
+        shares_outstanding REAL,
+        FOREIGN KEY (ticker) REFERENCES stocks(ticker)
+    )"""
+
     def init_database(self):
         """Initialize database schema"""
         conn = self.get_connection()
@@ -54,27 +110,21 @@ class DCFDatabase:
         """)
         
         # DCF calculations table (historical tracking)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS dcf_calculations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ticker TEXT,
-                calculation_date TIMESTAMP,
-                model_type TEXT,
-                parameters TEXT,
-                intrinsic_value REAL,
-                current_price REAL,
-                discount_pct REAL,
-                wacc REAL,
-                terminal_growth_rate REAL,
-                projection_years INTEGER,
-                fcf_projections TEXT,
-                terminal_value REAL,
-                enterprise_value REAL,
-                equity_value REAL,
-                shares_outstanding REAL,
-                FOREIGN KEY (ticker) REFERENCES stocks(ticker)
-            )
-        """)
+        cursor.execute("CREATE TABLE IF NOT EXISTS dcf_calculations " + self._CALC_SCHEMA)
+
+        # Migrate tables created before discount_pct became a generated
+        # column (hidden == 0 means a plain stored column): rebuild the
+        # table once, copying everything except the derived value
+        cursor.execute("PRAGMA table_xinfo(dcf_calculations)")
+        col_info = {row['name']: row['hidden'] for row in cursor.fetchall()}
+        if col_info.get('discount_pct') == 0:
+            copy_cols = ", ".join(name for name, hidden in col_info.items()
+                                  if hidden == 0 and name != 'discount_pct')
+            cursor.execute("CREATE TABLE dcf_calculations_migrated " + self._CALC_SCHEMA)
+            cursor.execute(f"INSERT INTO dcf_calculations_migrated ({copy_cols}) "
+                           f"SELECT {copy_cols} FROM dcf_calculations")
+            cursor.execute("DROP TABLE dcf_calculations")
+            cursor.execute("ALTER TABLE dcf_calculations_migrated RENAME TO dcf_calculations")
         
         # Screening results table
         cursor.execute("""
@@ -92,43 +142,54 @@ class DCFDatabase:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_ticker ON financial_data(ticker)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_calc_ticker ON dcf_calculations(ticker)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_calc_date ON dcf_calculations(calculation_date)")
-        
+        # Composite + discount indexes serve the latest-per-ticker join
+        # and the screener's discount predicates/sorts
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_calc_ticker_date ON dcf_calculations(ticker, calculation_date DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_calc_discount ON dcf_calculations(discount_pct)")
+
+        # calc_ts (integer unix seconds) lets recency filters compare
+        # integers instead of parsing timestamp strings; databases from
+        # before the column existed gain it in the migration above
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_calc_ts ON dcf_calculations(calc_ts)")
+
         conn.commit()
-        conn.close()
     
     def add_stock(self, ticker: str, company_name: str = None, 
                   exchange: str = None, sector: str = None, industry: str = None):
         """Add or update stock information"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO stocks (ticker, company_name, exchange, sector, industry, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (ticker, company_name, exchange, sector, industry, datetime.now()))
-        
-        conn.commit()
-        conn.close()
+        with self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO stocks (ticker, company_name, exchange, sector, industry, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (ticker, company_name, exchange, sector, industry, datetime.now()))
     
     def add_financial_data(self, ticker: str, period_date: str, period_type: str,
                           revenue: float, operating_income: float, net_income: float,
-                          free_cash_flow: float, total_debt: float, 
+                          free_cash_flow: float, total_debt: float,
                           cash_and_equivalents: float, shares_outstanding: float):
         """Add financial data for a specific period"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO financial_data 
+        self.add_financial_data_bulk([
             (ticker, period_date, period_type, revenue, operating_income, net_income,
              free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (ticker, period_date, period_type, revenue, operating_income, net_income,
-              free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding))
-        
-        conn.commit()
-        conn.close()
-    
+        ])
+
+    def add_financial_data_bulk(self, rows: List[tuple]):
+        """
+        Insert many financial_data rows in one transaction.
+
+        Each row is (ticker, period_date, period_type, revenue,
+        operating_income, net_income, free_cash_flow, total_debt,
+        cash_and_equivalents, shares_outstanding). One commit/fsync for
+        the whole batch, and executemany reuses the prepared statement.
+        """
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO financial_data
+                (ticker, period_date, period_type, revenue, operating_income, net_income,
+                 free_cash_flow, total_debt, cash_and_equivalents, shares_outstanding)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
     def save_dcf_calculation(self, ticker: str, model_type: str, parameters: Dict,
                            intrinsic_value: float, current_price: float,
                            wacc: float, terminal_growth_rate: float,
@@ -136,25 +197,68 @@ class DCFDatabase:
                            terminal_value: float, enterprise_value: float,
                            equity_value: float, shares_outstanding: float):
         """Save DCF calculation results with full historical tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        discount_pct = ((intrinsic_value - current_price) / current_price * 100) if current_price > 0 else None
-        
-        cursor.execute("""
-            INSERT INTO dcf_calculations 
-            (ticker, calculation_date, model_type, parameters, intrinsic_value,
-             current_price, discount_pct, wacc, terminal_growth_rate, projection_years,
-             fcf_projections, terminal_value, enterprise_value, equity_value, shares_outstanding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (ticker, datetime.now(), model_type, json.dumps(parameters),
-              intrinsic_value, current_price, discount_pct, wacc, terminal_growth_rate,
-              projection_years, json.dumps(fcf_projections), terminal_value,
-              enterprise_value, equity_value, shares_outstanding))
-        
-        conn.commit()
-        conn.close()
+        self.save_dcf_calculation_bulk([
+            (ticker, model_type, parameters, intrinsic_value, current_price,
+             wacc, terminal_growth_rate, projection_years, fcf_projections,
+             terminal_value, enterprise_value, equity_value, shares_outstanding)
+        ])
+
+    def save_dcf_calculation_bulk(self, rows: List[tuple]):
+        """
+        Save many DCF calculations in one transaction.
+
+        Each row carries the same arguments as save_dcf_calculation, in
+        order. JSON serialization and the discount computation happen
+        once per row here, then a single executemany/commit writes the
+        whole batch.
+        """
+        now = datetime.now()
+        now_ts = int(now.timestamp())
+        flat = []
+        for (ticker, model_type, parameters, intrinsic_value, current_price,
+             wacc, terminal_growth_rate, projection_years, fcf_projections,
+             terminal_value, enterprise_value, equity_value, shares_outstanding) in rows:
+            # discount_pct is a generated column, derived by SQLite
+            flat.append((ticker, now, now_ts, model_type, json.dumps(parameters),
+                         intrinsic_value, current_price, wacc,
+                         terminal_growth_rate, projection_years,
+                         np.asarray(fcf_projections, dtype=np.float64).tobytes(),
+                         terminal_value,
+                         enterprise_value, equity_value, shares_outstanding))
+
+        self._latest_dcf_cache = None
+        self._latest_version = None
+
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO dcf_calculations
+                (ticker, calculation_date, calc_ts, model_type, parameters, intrinsic_value,
+                 current_price, wacc, terminal_growth_rate, projection_years,
+                 fcf_projections, terminal_value, enterprise_value, equity_value, shares_outstanding)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, flat)
+
+        if len(flat) > 1:
+            # Refresh index statistics after genuine batch ingests so
+            # the planner keeps picking the discount/ticker indexes
+            self.conn.execute("ANALYZE dcf_calculations")
     
+    @staticmethod
+    def _unpack_fcf(value) -> List[float]:
+        """Decode stored fcf_projections: packed float64 BLOB or legacy JSON"""
+        if isinstance(value, bytes):
+            return np.frombuffer(value, dtype=np.float64).tolist()
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def _calc_row(self, row) -> Dict:
+        """Materialize a dcf_calculations row, decoding packed columns"""
+        record = dict(row)
+        record['fcf_projections'] = self._unpack_fcf(record['fcf_projections'])
+        record.pop('rn', None)
+        return record
+
     def get_latest_dcf(self, ticker: str) -> Optional[Dict]:
         """Get the most recent DCF calculation for a ticker"""
         conn = self.get_connection()
@@ -168,11 +272,9 @@ class DCFDatabase:
         """, (ticker,))
         
         row = cursor.fetchone()
-        conn.close()
-        
+
         if row:
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
+            return self._calc_row(row)
         return None
     
     def get_dcf_history(self, ticker: str, limit: int = None) -> List[Dict]:
@@ -191,46 +293,200 @@ class DCFDatabase:
         
         cursor.execute(query, (ticker,))
         rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        conn.close()
-        
-        return [dict(zip(columns, row)) for row in rows]
+
+        return [self._calc_row(row) for row in rows]
     
-    def get_all_latest_dcf(self) -> List[Dict]:
-        """Get the latest DCF calculation for all stocks"""
+    # Latest-per-ticker base query shared by the discount screens.
+    # ROW_NUMBER over the (ticker, calculation_date DESC) index scans
+    # the table once, instead of a GROUP BY plus a self-join back.
+    # Extra predicates are appended with AND; _calc_row drops the rn
+    # helper column on materialization.
+    _LATEST_JOIN = """
+        SELECT d1.* FROM (
+            SELECT *, ROW_NUMBER() OVER (
+                PARTITION BY ticker ORDER BY calculation_date DESC) AS rn
+            FROM dcf_calculations
+        ) d1 WHERE d1.rn = 1
+    """
+
+    def top_by_discount(self, min_pct: float = None, max_pct: float = None,
+                        limit: int = None) -> List[Dict]:
+        """
+        Latest DCF rows within a discount range, sorted descending and
+        bounded in SQL, so SQLite can walk the discount index and stop
+        after `limit` rows instead of Python sorting the whole table.
+        """
+        where = ["d1.discount_pct IS NOT NULL"]
+        params = []
+
+        if min_pct is not None:
+            where.append("d1.discount_pct >= ?")
+            params.append(min_pct)
+        if max_pct is not None:
+            where.append("d1.discount_pct <= ?")
+            params.append(max_pct)
+
+        query = self._LATEST_JOIN + " AND " + " AND ".join(where)
+        query += " ORDER BY d1.discount_pct DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.get_connection().execute(query, params)
+        return [self._calc_row(row) for row in cursor.fetchall()]
+
+    def bottom_by_discount(self, max_pct: float, limit: int = None) -> List[Dict]:
+        """
+        Mirror of top_by_discount for overvalued stocks: latest rows
+        strictly below `max_pct`, sorted ascending (worst first).
+        """
+        query = self._LATEST_JOIN + " AND d1.discount_pct < ? ORDER BY d1.discount_pct ASC"
+        params = [max_pct]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.get_connection().execute(query, params)
+        return [self._calc_row(row) for row in cursor.fetchall()]
+
+    def get_recent_history_all(self, periods: int) -> Dict[str, List[Dict]]:
+        """
+        Get the most recent `periods` DCF calculations for every ticker
+        in one round-trip, keyed by ticker (newest first, matching
+        get_dcf_history order). Replaces a query-per-ticker pattern.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
         cursor.execute("""
-            SELECT d1.* FROM dcf_calculations d1
-            INNER JOIN (
-                SELECT ticker, MAX(calculation_date) as max_date
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY ticker ORDER BY calculation_date DESC
+                ) AS rn
                 FROM dcf_calculations
-                GROUP BY ticker
-            ) d2 ON d1.ticker = d2.ticker AND d1.calculation_date = d2.max_date
-            ORDER BY d1.discount_pct DESC
-        """)
-        
+            ) WHERE rn <= ?
+            ORDER BY ticker, rn
+        """, (periods,))
+
         rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        conn.close()
-        
-        return [dict(zip(columns, row)) for row in rows]
+
+        history = {}
+        for row in rows:
+            record = self._calc_row(row)
+            history.setdefault(record['ticker'], []).append(record)
+
+        return history
+
+    def get_all_latest_dcf(self) -> List[Dict]:
+        """
+        Get the latest DCF calculation for all stocks.
+
+        The result is memoized against a cheap version key
+        (row count + newest calculation_date), so back-to-back screener
+        calls reuse the list instead of re-running the self-join.
+        """
+        cursor = self.conn.execute(
+            "SELECT COUNT(*), MAX(calculation_date) FROM dcf_calculations")
+        version = tuple(cursor.fetchone())
+
+        if self._latest_dcf_cache is not None and version == self._latest_version:
+            return self._latest_dcf_cache
+
+        cursor = self.conn.execute(self._LATEST_JOIN + " ORDER BY d1.discount_pct DESC")
+        rows = [self._calc_row(row) for row in cursor.fetchall()]
+
+        self._latest_dcf_cache = rows
+        self._latest_version = version
+        return rows
+
+    def get_latest_dcf_columnar(self) -> Dict[str, np.ndarray]:
+        """
+        Column-oriented view of the latest-per-ticker rows: one
+        contiguous array per numeric field (NULL discount becomes NaN)
+        plus an object array of tickers. Screener scans that touch one
+        or two fields per row read a flat array instead of pulling a
+        whole dict per row; the arrays are cached alongside the row
+        list and share its ordering (discount_pct descending).
+        """
+        rows = self.get_all_latest_dcf()
+        if self._columnar_cache is not None and rows is self._columnar_rows:
+            return self._columnar_cache
+
+        n = len(rows)
+        cols = {
+            'ticker': np.array([r['ticker'] for r in rows], dtype=object),
+            'discount_pct': np.fromiter(
+                (r['discount_pct'] if r['discount_pct'] is not None else np.nan
+                 for r in rows), dtype=np.float64, count=n),
+            'intrinsic_value': np.fromiter(
+                (r['intrinsic_value'] for r in rows), dtype=np.float64, count=n),
+            'current_price': np.fromiter(
+                (r['current_price'] for r in rows), dtype=np.float64, count=n),
+        }
+
+        self._columnar_cache = cols
+        self._columnar_rows = rows
+        return cols
     
+    # Screener filter key -> SQL predicate on the latest-per-ticker rows.
+    # NULL discount_pct rows fail the comparisons, matching the old
+    # Python-side None checks.
+    _FILTER_PREDICATES = {
+        'min_discount_pct': "d1.discount_pct >= ?",
+        'max_discount_pct': "d1.discount_pct <= ?",
+        'min_intrinsic_value': "d1.intrinsic_value >= ?",
+        'max_intrinsic_value': "d1.intrinsic_value <= ?",
+        'min_current_price': "d1.current_price >= ?",
+        'max_current_price': "d1.current_price <= ?",
+    }
+
+    def query_latest_dcf(self, filters: Dict = None) -> List[Dict]:
+        """
+        Get the latest DCF calculation per stock, filtered in SQL.
+        Accepts the same filter keys the screener uses; predicates run
+        inside SQLite (index-assisted) instead of a Python loop over
+        every materialized row.
+        """
+        filters = filters or {}
+        where = []
+        params = []
+
+        for key, predicate in self._FILTER_PREDICATES.items():
+            if key in filters:
+                where.append(predicate)
+                params.append(filters[key])
+
+        if 'calculation_recency_days' in filters:
+            cutoff = datetime.now() - timedelta(days=filters['calculation_recency_days'])
+            # Integer compare on calc_ts; rows written before the column
+            # existed fall back to the timestamp-string comparison
+            where.append("(d1.calc_ts >= ? OR (d1.calc_ts IS NULL AND d1.calculation_date >= ?))")
+            params.append(int(cutoff.timestamp()))
+            params.append(cutoff)
+
+        query = self._LATEST_JOIN
+        if where:
+            query += " AND " + " AND ".join(where)
+        query += " ORDER BY d1.discount_pct DESC"
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+
+        return [self._calc_row(row) for row in cursor.fetchall()]
+
     def get_financial_data(self, ticker: str, limit: int = 5) -> List[Dict]:
         """Get historical financial data for a ticker"""
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
         cursor.execute("""
             SELECT * FROM financial_data
             WHERE ticker = ?
             ORDER BY period_date DESC
             LIMIT ?
         """, (ticker, limit))
-        
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        conn.close()
-        
-        return [dict(zip(columns, row)) for row in rows]
+
+        # sqlite3.Row supports row['column'] lookups without building a
+        # dict per row; no packed columns here, so pass them through
+        return cursor.fetchall()
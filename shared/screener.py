@@ -3,13 +3,70 @@ Screening and filtering module
 Find mispriced opportunities based on DCF analysis
 """
 
+import io
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain, repeat
 from typing import List, Dict, Callable
 from datetime import datetime, timedelta
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
+
+def _trend_kernel_py(iv):
+    """Single pass over intrinsic values: (avg_pct_change, trend_code)"""
+    n = iv.shape[0]
+    total = 0.0
+    for i in range(1, n):
+        total += (iv[i] - iv[i - 1]) / iv[i - 1] * 100.0
+    avg_change = total / (n - 1) if n > 1 else 0.0
+
+    if iv[0] < iv[n - 1]:
+        trend_code = 1
+    elif iv[0] > iv[n - 1]:
+        trend_code = -1
+    else:
+        trend_code = 0
+    return avg_change, trend_code
+
+
+if njit is not None:
+    _trend_kernel = njit(cache=True, fastmath=True)(_trend_kernel_py)
+    # Warm-up compile at import so the JIT cost doesn't land on the
+    # first user request
+    _trend_kernel(np.array([1.0, 2.0], dtype=np.float64))
+else:
+    _trend_kernel = _trend_kernel_py
+
+_TREND_NAMES = {1: 'increasing', -1: 'decreasing', 0: 'stable'}
+
+# Below this many rows, worker processes cost more in pickling and IPC
+# than the screen function saves
+_PARALLEL_SCREEN_MIN_ROWS = 5000
+
+
+def _apply_screen(rows, screen_function):
+    """Run a screen callback over a chunk of rows (worker entry point)"""
+    return [calc for calc in rows if screen_function(calc)]
+
 
 class StockScreener:
     def __init__(self, db):
         self.db = db
+        self._pool = None
+
+    def _get_pool(self):
+        """Lazily created process pool, reused across screen calls"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor()
+        return self._pool
     
     def filter_by_discount(self, min_discount_pct: float = 20.0,
                           max_discount_pct: float = None) -> List[Dict]:
@@ -17,18 +74,18 @@ class StockScreener:
         Filter stocks by discount to intrinsic value
         min_discount_pct: minimum discount % (e.g., 20 = trading 20% below intrinsic value)
         """
-        all_dcf = self.db.get_all_latest_dcf()
-        
-        results = []
-        for calc in all_dcf:
-            if calc['discount_pct'] is None:
-                continue
-            
-            if calc['discount_pct'] >= min_discount_pct:
-                if max_discount_pct is None or calc['discount_pct'] <= max_discount_pct:
-                    results.append(calc)
-        
-        return sorted(results, key=lambda x: x['discount_pct'], reverse=True)
+        # Vectorized mask over the columnar cache; NaN (NULL discount)
+        # fails both comparisons. The backing row list is already
+        # sorted by discount descending, so the mask preserves order
+        # and only matching rows are touched as dicts.
+        rows = self.db.get_all_latest_dcf()
+        cols = self.db.get_latest_dcf_columnar()
+
+        mask = cols['discount_pct'] >= min_discount_pct
+        if max_discount_pct is not None:
+            mask &= cols['discount_pct'] <= max_discount_pct
+
+        return [rows[i] for i in np.where(mask)[0]]
     
     def filter_by_criteria(self, filters: Dict) -> List[Dict]:
         """
@@ -44,69 +101,24 @@ class StockScreener:
             'calculation_recency_days': 7  # Calculated within last 7 days
         }
         """
-        all_dcf = self.db.get_all_latest_dcf()
-        results = []
-        
-        for calc in all_dcf:
-            # Check discount range
-            if 'min_discount_pct' in filters:
-                if calc['discount_pct'] is None or calc['discount_pct'] < filters['min_discount_pct']:
-                    continue
-            
-            if 'max_discount_pct' in filters:
-                if calc['discount_pct'] is None or calc['discount_pct'] > filters['max_discount_pct']:
-                    continue
-            
-            # Check intrinsic value range
-            if 'min_intrinsic_value' in filters:
-                if calc['intrinsic_value'] < filters['min_intrinsic_value']:
-                    continue
-            
-            if 'max_intrinsic_value' in filters:
-                if calc['intrinsic_value'] > filters['max_intrinsic_value']:
-                    continue
-            
-            # Check current price range
-            if 'min_current_price' in filters:
-                if calc['current_price'] < filters['min_current_price']:
-                    continue
-            
-            if 'max_current_price' in filters:
-                if calc['current_price'] > filters['max_current_price']:
-                    continue
-            
-            # Check calculation recency
-            if 'calculation_recency_days' in filters:
-                calc_date = datetime.fromisoformat(calc['calculation_date'])
-                cutoff_date = datetime.now() - timedelta(days=filters['calculation_recency_days'])
-                if calc_date < cutoff_date:
-                    continue
-            
-            results.append(calc)
-        
-        return results
+        # All predicates run inside SQLite (see query_latest_dcf) so
+        # only matching rows are ever materialized into Python
+        return self.db.query_latest_dcf(filters)
     
     def get_top_opportunities(self, n: int = 20, 
                             min_discount: float = 15.0) -> List[Dict]:
         """
         Get top N opportunities by discount percentage
         """
-        filtered = self.filter_by_discount(min_discount)
-        return filtered[:n]
+        # LIMIT in SQL: only n rows are ever materialized
+        return self.db.top_by_discount(min_pct=min_discount, limit=n)
     
     def get_value_traps(self, max_discount: float = -50.0) -> List[Dict]:
         """
         Find stocks trading significantly ABOVE intrinsic value
         Negative discount means overvalued
         """
-        all_dcf = self.db.get_all_latest_dcf()
-        
-        results = []
-        for calc in all_dcf:
-            if calc['discount_pct'] is not None and calc['discount_pct'] < max_discount:
-                results.append(calc)
-        
-        return sorted(results, key=lambda x: x['discount_pct'])
+        return self.db.bottom_by_discount(max_discount)
     
     def analyze_trending(self, ticker: str, periods: int = 5) -> Dict:
         """
@@ -114,7 +126,10 @@ class StockScreener:
         Useful for spotting improving or deteriorating businesses
         """
         history = self.db.get_dcf_history(ticker, limit=periods)
-        
+        return self._trend_from_history(ticker, history)
+
+    def _trend_from_history(self, ticker: str, history: List[Dict]) -> Dict:
+        """Compute the trend summary for an already-fetched history list"""
         if len(history) < 2:
             return {
                 'ticker': ticker,
@@ -122,33 +137,19 @@ class StockScreener:
                 'history': history
             }
         
-        # Calculate trend
-        intrinsic_values = [h['intrinsic_value'] for h in reversed(history)]
-        discounts = [h['discount_pct'] for h in reversed(history)]
-        
-        # Simple trend detection
-        if intrinsic_values[0] < intrinsic_values[-1]:
-            iv_trend = 'increasing'
-        elif intrinsic_values[0] > intrinsic_values[-1]:
-            iv_trend = 'decreasing'
-        else:
-            iv_trend = 'stable'
-        
-        # Calculate average change
-        changes = []
-        for i in range(1, len(intrinsic_values)):
-            pct_change = ((intrinsic_values[i] - intrinsic_values[i-1]) / intrinsic_values[i-1]) * 100
-            changes.append(pct_change)
-        
-        avg_change = sum(changes) / len(changes) if changes else 0
-        
+        intrinsic_values = np.asarray(
+            [h['intrinsic_value'] for h in reversed(history)], dtype=np.float64)
+        current_discount = history[0]['discount_pct']
+
+        avg_change, trend_code = _trend_kernel(intrinsic_values)
+
         return {
             'ticker': ticker,
-            'intrinsic_value_trend': iv_trend,
+            'intrinsic_value_trend': _TREND_NAMES[trend_code],
             'avg_iv_change_pct': avg_change,
-            'current_intrinsic_value': intrinsic_values[-1],
-            'oldest_intrinsic_value': intrinsic_values[0],
-            'current_discount': discounts[-1] if discounts[-1] else None,
+            'current_intrinsic_value': float(intrinsic_values[-1]),
+            'oldest_intrinsic_value': float(intrinsic_values[0]),
+            'current_discount': current_discount if current_discount else None,
             'history': history
         }
     
@@ -157,106 +158,195 @@ class StockScreener:
         """
         Find stocks where intrinsic value is improving over time
         """
-        all_dcf = self.db.get_all_latest_dcf()
+        # One windowed query fetches every ticker's recent history,
+        # instead of a get_dcf_history round-trip per ticker
+        latest_by_ticker = {c['ticker']: c for c in self.db.get_all_latest_dcf()}
+        history_by_ticker = self.db.get_recent_history_all(min_periods)
+
+        # Batch tickers by history length so each batch stacks into a
+        # rectangular (T, k) array and the change/trend reductions run
+        # as single vectorized calls across all rows
+        by_length = {}
+        for ticker in latest_by_ticker:
+            k = len(history_by_ticker.get(ticker, []))
+            if k >= 2:
+                by_length.setdefault(k, []).append(ticker)
+
         improving = []
-        
-        for calc in all_dcf:
-            trend_analysis = self.analyze_trending(calc['ticker'], periods=min_periods)
-            
-            if (trend_analysis['intrinsic_value_trend'] == 'increasing' and 
-                trend_analysis['avg_iv_change_pct'] >= min_avg_change):
+        for k, tickers in by_length.items():
+            # Rows are oldest-first so column -1 is the newest value
+            iv = np.array([[h['intrinsic_value']
+                            for h in reversed(history_by_ticker[t])]
+                           for t in tickers], dtype=np.float64)
+            avg = (np.diff(iv, axis=1) / iv[:, :-1] * 100.0).mean(axis=1)
+            selected = np.where((iv[:, -1] > iv[:, 0]) & (avg >= min_avg_change))[0]
+
+            # Full trend dicts are built only for the survivors
+            for i in selected:
+                ticker = tickers[i]
                 improving.append({
-                    **calc,
-                    'trend_data': trend_analysis
+                    **latest_by_ticker[ticker],
+                    'trend_data': self._trend_from_history(ticker, history_by_ticker[ticker])
                 })
-        
+
         return sorted(improving, key=lambda x: x['trend_data']['avg_iv_change_pct'], reverse=True)
     
     def custom_screen(self, screen_function: Callable) -> List[Dict]:
         """
         Apply a custom screening function
         screen_function should accept a DCF calculation dict and return True/False
+
+        Large universes are split across a process pool so expensive
+        predicates run on all cores; small ones (or unpicklable
+        functions such as lambdas) are screened in-process.
+        """
+        all_dcf = self.db.get_all_latest_dcf()
+        if len(all_dcf) < _PARALLEL_SCREEN_MIN_ROWS:
+            return _apply_screen(all_dcf, screen_function)
+
+        chunk_size = -(-len(all_dcf) // (os.cpu_count() or 1))
+        chunks = [all_dcf[i:i + chunk_size]
+                  for i in range(0, len(all_dcf), chunk_size)]
+        try:
+            results = self._get_pool().map(
+                _apply_screen, chunks, repeat(screen_function))
+            return list(chain.from_iterable(results))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return _apply_screen(all_dcf, screen_function)
+
+    def custom_screen_expr(self, expr: str) -> List[Dict]:
         """
+        Screen with a boolean expression over column names, e.g.
+        "discount_pct > 20 and intrinsic_value > 10".
+
+        The expression is compiled once and evaluated against each row
+        dict, which is cheaper than a Python callback per row. Builtins
+        are stripped from the eval environment, so only row columns are
+        in scope.
+        """
+        code = compile(expr, '<screen>', 'eval')
         all_dcf = self.db.get_all_latest_dcf()
-        return [calc for calc in all_dcf if screen_function(calc)]
+        empty = {'__builtins__': {}}
+        return [calc for calc in all_dcf if eval(code, empty, calc)]
     
     def get_stats_summary(self) -> Dict:
         """
         Get summary statistics of all DCF calculations
         """
-        all_dcf = self.db.get_all_latest_dcf()
-        
+        return self._stats_from(self.db.get_all_latest_dcf())
+
+    def _stats_from(self, all_dcf: List[Dict]) -> Dict:
+        """Summary statistics over an already-fetched latest-DCF list"""
         if not all_dcf:
             return {'total_stocks': 0}
-        
-        discounts = [c['discount_pct'] for c in all_dcf if c['discount_pct'] is not None]
-        intrinsic_values = [c['intrinsic_value'] for c in all_dcf]
-        
-        undervalued = len([d for d in discounts if d > 0])
-        overvalued = len([d for d in discounts if d < 0])
-        fairly_valued = len([d for d in discounts if -5 <= d <= 5])
-        
+
+        # Single pass into contiguous float arrays, then C-level
+        # reductions instead of four separate Python list walks
+        discounts = np.fromiter(
+            (c['discount_pct'] for c in all_dcf if c['discount_pct'] is not None),
+            dtype=np.float64
+        )
+        intrinsic_values = np.fromiter(
+            (c['intrinsic_value'] for c in all_dcf),
+            dtype=np.float64, count=len(all_dcf)
+        )
+
+        has_discounts = discounts.size > 0
+
         return {
             'total_stocks': len(all_dcf),
-            'undervalued_count': undervalued,
-            'overvalued_count': overvalued,
-            'fairly_valued_count': fairly_valued,
-            'avg_discount': sum(discounts) / len(discounts) if discounts else 0,
-            'max_discount': max(discounts) if discounts else 0,
-            'min_discount': min(discounts) if discounts else 0,
-            'avg_intrinsic_value': sum(intrinsic_values) / len(intrinsic_values)
+            'undervalued_count': int((discounts > 0).sum()),
+            'overvalued_count': int((discounts < 0).sum()),
+            'fairly_valued_count': int(((discounts >= -5) & (discounts <= 5)).sum()),
+            'avg_discount': float(discounts.mean()) if has_discounts else 0,
+            'max_discount': float(discounts.max()) if has_discounts else 0,
+            'min_discount': float(discounts.min()) if has_discounts else 0,
+            'avg_intrinsic_value': float(intrinsic_values.mean())
         }
     
+    # Python-side mirror of DCFDatabase._FILTER_PREDICATES, used when
+    # the rows are already in hand and a round-trip would cost more
+    # than the comparison
+    _ROW_PREDICATES = {
+        'min_discount_pct': lambda c, v: c['discount_pct'] is not None and c['discount_pct'] >= v,
+        'max_discount_pct': lambda c, v: c['discount_pct'] is not None and c['discount_pct'] <= v,
+        'min_intrinsic_value': lambda c, v: c['intrinsic_value'] >= v,
+        'max_intrinsic_value': lambda c, v: c['intrinsic_value'] <= v,
+        'min_current_price': lambda c, v: c['current_price'] >= v,
+        'max_current_price': lambda c, v: c['current_price'] <= v,
+    }
+
+    def _filter_from(self, rows: List[Dict], filters: Dict) -> List[Dict]:
+        """Apply a filter_by_criteria-style dict to pre-fetched rows"""
+        # Unpack the filter dict once into bound single-argument
+        # predicates; only the active checks run per row, with no dict
+        # lookups or cutoff arithmetic inside the loop
+        predicates = [partial(self._ROW_PREDICATES[key], v=value)
+                      for key, value in filters.items()
+                      if key in self._ROW_PREDICATES]
+
+        if 'calculation_recency_days' in filters:
+            cutoff = datetime.now() - timedelta(days=filters['calculation_recency_days'])
+            cutoff_ts = int(cutoff.timestamp())
+            cutoff_str = str(cutoff)
+            # Integer compare on calc_ts; string fallback for rows
+            # written before the column existed
+            predicates.append(
+                lambda c: (c['calc_ts'] >= cutoff_ts if c.get('calc_ts') is not None
+                           else c['calculation_date'] >= cutoff_str))
+
+        return [c for c in rows if all(p(c) for p in predicates)]
+
+    _ROW_FMT = ("{ticker:<10} ${current_price:<9.2f} ${intrinsic_value:<11.2f} "
+                "{discount_pct:<9.1f}% {model_type:<15}\n")
+
     def generate_report(self, filters: Dict = None, top_n: int = 20) -> str:
         """
         Generate a text report of screening results
         """
+        # Fetch the latest-per-ticker rows once and derive both the
+        # result set and the summary stats from the same list
+        all_dcf = self.db.get_all_latest_dcf()
+
         if filters:
-            results = self.filter_by_criteria(filters)
+            results = self._filter_from(all_dcf, filters)
         else:
-            results = self.get_top_opportunities(n=top_n)
-        
-        stats = self.get_stats_summary()
-        
-        report = []
-        report.append("=" * 80)
-        report.append("DCF STOCK SCREENING REPORT")
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 80)
-        report.append("")
-        
-        report.append("SUMMARY STATISTICS:")
-        report.append(f"  Total stocks analyzed: {stats['total_stocks']}")
-        report.append(f"  Undervalued: {stats['undervalued_count']}")
-        report.append(f"  Overvalued: {stats['overvalued_count']}")
-        report.append(f"  Fairly valued: {stats['fairly_valued_count']}")
-        report.append(f"  Average discount: {stats['avg_discount']:.2f}%")
-        report.append("")
-        
+            # all_dcf is already sorted by discount DESC
+            results = [c for c in all_dcf
+                       if c['discount_pct'] is not None and c['discount_pct'] >= 15.0][:top_n]
+
+        stats = self._stats_from(all_dcf)
+
+        # One growing buffer and a precompiled row format instead of a
+        # list of per-line strings joined at the end
+        buf = io.StringIO()
+        buf.write("=" * 80 + "\n")
+        buf.write("DCF STOCK SCREENING REPORT\n")
+        buf.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf.write("=" * 80 + "\n\n")
+
+        buf.write("SUMMARY STATISTICS:\n")
+        buf.write(f"  Total stocks analyzed: {stats['total_stocks']}\n")
+        buf.write(f"  Undervalued: {stats['undervalued_count']}\n")
+        buf.write(f"  Overvalued: {stats['overvalued_count']}\n")
+        buf.write(f"  Fairly valued: {stats['fairly_valued_count']}\n")
+        buf.write(f"  Average discount: {stats['avg_discount']:.2f}%\n\n")
+
         if filters:
-            report.append("FILTER CRITERIA:")
+            buf.write("FILTER CRITERIA:\n")
             for key, value in filters.items():
-                report.append(f"  {key}: {value}")
-            report.append("")
-        
-        report.append(f"TOP {len(results)} OPPORTUNITIES:")
-        report.append("")
-        report.append(f"{'Ticker':<10} {'Current':<10} {'Intrinsic':<12} {'Discount':<10} {'Model':<15}")
-        report.append("-" * 80)
-        
-        for calc in results[:top_n]:
-            report.append(
-                f"{calc['ticker']:<10} "
-                f"${calc['current_price']:<9.2f} "
-                f"${calc['intrinsic_value']:<11.2f} "
-                f"{calc['discount_pct']:<9.1f}% "
-                f"{calc['model_type']:<15}"
-            )
-        
-        report.append("")
-        report.append("=" * 80)
-        
-        return "\n".join(report)
+                buf.write(f"  {key}: {value}\n")
+            buf.write("\n")
+
+        buf.write(f"TOP {len(results)} OPPORTUNITIES:\n\n")
+        buf.write(f"{'Ticker':<10} {'Current':<10} {'Intrinsic':<12} {'Discount':<10} {'Model':<15}\n")
+        buf.write("-" * 80 + "\n")
+
+        buf.writelines(self._ROW_FMT.format_map(calc) for calc in results[:top_n])
+
+        buf.write("\n" + "=" * 80)
+
+        return buf.getvalue()
 
 
 # Example usage
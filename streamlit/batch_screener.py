@@ -5,12 +5,71 @@ Designed for extensibility - easy to add new filter types
 """
 
 import yfinance as yf
+import numpy as np
+import pandas as pd
 import requests
-from typing import List, Dict, Optional, Callable, Any, Generator
-from dataclasses import dataclass, field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import threading
+from typing import List, Dict, Mapping, Optional, Callable, Any, Generator, Tuple
+from dataclasses import dataclass
 from enum import Enum
+import functools
+import io
+import types
+import os
+import pickle
 import time
 
+# On-disk cache for fetched data; entries expire via file mtime so
+# repeat screener runs skip the network for recently seen tickers
+CACHE_DIR = os.path.expanduser("~/.dcf_cache")
+
+# Enrichment is network-bound, so a small thread pool overlaps the
+# yfinance round-trips; the pool size doubles as the rate limit.
+# Each request batches up to ENRICH_BATCH_SIZE symbols via yf.Tickers.
+ENRICH_MAX_WORKERS = 8
+ENRICH_BATCH_SIZE = 50
+
+# Financial metrics are one full-statement fetch per ticker; a few
+# workers keep the pipeline fed at a Yahoo-safe request rate
+METRICS_MAX_WORKERS = 6
+
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter shared by all request threads.
+    Bursts run at full speed until max_calls land within the period;
+    only then does acquire() block, unlike the fixed per-ticker sleeps
+    it replaced.
+    """
+
+    def __init__(self, max_calls: int, period: float = 1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call slot is free, then claim it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+# One limiter for every Yahoo-bound request across all screener
+# instances and worker threads
+_YAHOO_LIMITER = RateLimiter(max_calls=8, period=1.0)
+
 
 class FilterCategory(Enum):
     """Categories for organizing filters in the UI"""
@@ -21,14 +80,14 @@ class FilterCategory(Enum):
     QUALITY = "Quality Filters"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilterDefinition:
     """Definition of a filter parameter"""
     key: str
     label: str
     category: FilterCategory
     filter_type: str  # 'select', 'multiselect', 'range', 'number'
-    options: List[Any] = field(default_factory=list)  # For select/multiselect
+    options: Tuple[Any, ...] = ()  # For select/multiselect
     min_value: float = None  # For range/number
     max_value: float = None  # For range/number
     default: Any = None
@@ -66,6 +125,23 @@ def normalize_sector(sector: str) -> str:
     return GICS_SECTOR_MAP.get(sector, sector)
 
 
+@functools.lru_cache(maxsize=512)
+def _normalize_exchange(raw: str) -> str:
+    """
+    Map a raw exchange string (NMS, NYQ, ...) to its display name.
+    Only a handful of distinct strings ever appear, so the cache makes
+    repeat normalization a dict hit instead of substring scans.
+    """
+    upper = raw.upper()
+    if 'NASDAQ' in upper or 'NMS' in upper or 'NGM' in upper:
+        return 'NASDAQ'
+    if 'NYSE' in upper or 'NYQ' in upper:
+        return 'NYSE'
+    if 'AMEX' in upper:
+        return 'AMEX'
+    return raw
+
+
 # ==================== FILTER DEFINITIONS ====================
 # Add new filters here - they will automatically appear in the UI
 
@@ -76,12 +152,12 @@ FILTER_DEFINITIONS = [
         label="Sector",
         category=FilterCategory.BASIC,
         filter_type="multiselect",
-        options=[
+        options=(
             "Technology", "Healthcare", "Financial Services", "Consumer Cyclical",
             "Consumer Defensive", "Industrials", "Energy", "Utilities",
             "Real Estate", "Basic Materials", "Communication Services"
-        ],
-        default=[],
+        ),
+        default=(),
         help_text="Filter by company sector"
     ),
     FilterDefinition(
@@ -89,8 +165,8 @@ FILTER_DEFINITIONS = [
         label="Exchange",
         category=FilterCategory.BASIC,
         filter_type="multiselect",
-        options=["NASDAQ", "NYSE", "AMEX"],
-        default=[],
+        options=("NASDAQ", "NYSE", "AMEX"),
+        default=(),
         help_text="Filter by stock exchange"
     ),
 
@@ -100,8 +176,8 @@ FILTER_DEFINITIONS = [
         label="Market Cap Universe",
         category=FilterCategory.MARKET,
         filter_type="multiselect",
-        options=["Mega Cap", "Large Cap", "Mid Cap", "Small Cap", "Micro Cap"],
-        default=[],
+        options=("Mega Cap", "Large Cap", "Mid Cap", "Small Cap", "Micro Cap"),
+        default=(),
         help_text="Filter by market capitalization tier"
     ),
 
@@ -111,7 +187,7 @@ FILTER_DEFINITIONS = [
         label="Positive FCF (Last Year)",
         category=FilterCategory.PROFITABILITY,
         filter_type="select",
-        options=["Any", "Yes", "No"],
+        options=("Any", "Yes", "No"),
         default="Any",
         help_text="Require positive FCF in the most recent year",
         requires_financial_data=True
@@ -176,32 +252,332 @@ FILTER_DEFINITIONS = [
 ]
 
 
-def get_filters_by_category() -> Dict[FilterCategory, List[FilterDefinition]]:
+# FILTER_DEFINITIONS never changes after import, so the by-category and
+# by-key lookups the UI needs every rerun are built once here; the
+# read-only view keeps callers from mutating the shared grouping
+_by_category: Dict[FilterCategory, List[FilterDefinition]] = {}
+for _filter_def in FILTER_DEFINITIONS:
+    _by_category.setdefault(_filter_def.category, []).append(_filter_def)
+_FILTERS_BY_CATEGORY: Mapping[FilterCategory, List[FilterDefinition]] = \
+    types.MappingProxyType(_by_category)
+_FILTERS_BY_KEY: Dict[str, FilterDefinition] = {f.key: f for f in FILTER_DEFINITIONS}
+_OPTIONS_BY_KEY: Dict[str, Tuple[Any, ...]] = {
+    f.key: f.options for f in FILTER_DEFINITIONS}
+_FINANCIAL_KEYS = frozenset(
+    f.key for f in FILTER_DEFINITIONS if f.requires_financial_data)
+
+
+def get_filters_by_category() -> Mapping[FilterCategory, List[FilterDefinition]]:
     """Group filters by category for UI organization"""
-    result = {}
-    for filter_def in FILTER_DEFINITIONS:
-        if filter_def.category not in result:
-            result[filter_def.category] = []
-        result[filter_def.category].append(filter_def)
-    return result
+    return _FILTERS_BY_CATEGORY
+
+
+# Tier boundaries for market-cap classification; searchsorted over the
+# bins maps a cap to its label index in one step
+_MC_BINS = np.array([50e6, 300e6, 2e9, 10e9, 200e9])
+_MC_LABELS = np.array(["Nano Cap", "Micro Cap", "Small Cap",
+                       "Mid Cap", "Large Cap", "Mega Cap"])
 
 
 def get_market_cap_universe(market_cap: float) -> str:
     """Classify market cap into universe tier"""
     if not market_cap or market_cap == 0:
         return "Unknown"
-    if market_cap >= 200e9:
-        return "Mega Cap"
-    elif market_cap >= 10e9:
-        return "Large Cap"
-    elif market_cap >= 2e9:
-        return "Mid Cap"
-    elif market_cap >= 300e6:
-        return "Small Cap"
-    elif market_cap >= 50e6:
-        return "Micro Cap"
-    else:
-        return "Nano Cap"
+    return str(_MC_LABELS[np.searchsorted(_MC_BINS, market_cap, side='right')])
+
+
+def classify_market_caps(market_caps) -> np.ndarray:
+    """
+    Classify a whole array of market caps at once.
+    Missing/zero caps come back as 'Unknown', matching the scalar path.
+    """
+    caps = np.asarray([c if c else 0 for c in market_caps], dtype=np.float64)
+    labels = _MC_LABELS[np.searchsorted(_MC_BINS, caps, side='right')]
+    return np.where(caps > 0, labels, "Unknown")
+
+
+# Mega/Large Cap stocks (S&P 500) with correct exchanges
+LARGE_CAP_STOCKS = [
+    ('AAPL', 'Apple Inc.', 'Technology', 'NASDAQ'),
+    ('MSFT', 'Microsoft Corp.', 'Technology', 'NASDAQ'),
+    ('GOOGL', 'Alphabet Inc.', 'Communication Services', 'NASDAQ'),
+    ('AMZN', 'Amazon.com Inc.', 'Consumer Cyclical', 'NASDAQ'),
+    ('NVDA', 'NVIDIA Corp.', 'Technology', 'NASDAQ'),
+    ('META', 'Meta Platforms Inc.', 'Communication Services', 'NASDAQ'),
+    ('TSLA', 'Tesla Inc.', 'Consumer Cyclical', 'NASDAQ'),
+    ('BRK-B', 'Berkshire Hathaway', 'Financial Services', 'NYSE'),
+    ('UNH', 'UnitedHealth Group', 'Healthcare', 'NYSE'),
+    ('JNJ', 'Johnson & Johnson', 'Healthcare', 'NYSE'),
+    ('JPM', 'JPMorgan Chase', 'Financial Services', 'NYSE'),
+    ('V', 'Visa Inc.', 'Financial Services', 'NYSE'),
+    ('XOM', 'Exxon Mobil', 'Energy', 'NYSE'),
+    ('PG', 'Procter & Gamble', 'Consumer Defensive', 'NYSE'),
+    ('MA', 'Mastercard', 'Financial Services', 'NYSE'),
+    ('HD', 'Home Depot', 'Consumer Cyclical', 'NYSE'),
+    ('CVX', 'Chevron', 'Energy', 'NYSE'),
+    ('MRK', 'Merck & Co.', 'Healthcare', 'NYSE'),
+    ('LLY', 'Eli Lilly', 'Healthcare', 'NYSE'),
+    ('ABBV', 'AbbVie Inc.', 'Healthcare', 'NYSE'),
+    ('PEP', 'PepsiCo', 'Consumer Defensive', 'NASDAQ'),
+    ('KO', 'Coca-Cola', 'Consumer Defensive', 'NYSE'),
+    ('AVGO', 'Broadcom Inc.', 'Technology', 'NASDAQ'),
+    ('COST', 'Costco', 'Consumer Defensive', 'NASDAQ'),
+    ('MCD', 'McDonald\'s', 'Consumer Cyclical', 'NYSE'),
+    ('WMT', 'Walmart', 'Consumer Defensive', 'NYSE'),
+    ('CSCO', 'Cisco Systems', 'Technology', 'NASDAQ'),
+    ('TMO', 'Thermo Fisher', 'Healthcare', 'NYSE'),
+    ('ACN', 'Accenture', 'Technology', 'NYSE'),
+    ('ABT', 'Abbott Labs', 'Healthcare', 'NYSE'),
+    ('CRM', 'Salesforce', 'Technology', 'NYSE'),
+    ('DHR', 'Danaher', 'Healthcare', 'NYSE'),
+    ('ORCL', 'Oracle', 'Technology', 'NYSE'),
+    ('NKE', 'Nike Inc.', 'Consumer Cyclical', 'NYSE'),
+    ('AMD', 'AMD', 'Technology', 'NASDAQ'),
+    ('INTC', 'Intel', 'Technology', 'NASDAQ'),
+    ('DIS', 'Walt Disney', 'Communication Services', 'NYSE'),
+    ('VZ', 'Verizon', 'Communication Services', 'NYSE'),
+    ('NFLX', 'Netflix', 'Communication Services', 'NASDAQ'),
+    ('ADBE', 'Adobe Inc.', 'Technology', 'NASDAQ'),
+    ('TXN', 'Texas Instruments', 'Technology', 'NASDAQ'),
+    ('PM', 'Philip Morris', 'Consumer Defensive', 'NYSE'),
+    ('NEE', 'NextEra Energy', 'Utilities', 'NYSE'),
+    ('UNP', 'Union Pacific', 'Industrials', 'NYSE'),
+    ('RTX', 'Raytheon', 'Industrials', 'NYSE'),
+    ('HON', 'Honeywell', 'Industrials', 'NASDAQ'),
+    ('QCOM', 'Qualcomm', 'Technology', 'NASDAQ'),
+    ('LOW', 'Lowe\'s', 'Consumer Cyclical', 'NYSE'),
+    ('BA', 'Boeing', 'Industrials', 'NYSE'),
+    ('CAT', 'Caterpillar', 'Industrials', 'NYSE'),
+    ('GS', 'Goldman Sachs', 'Financial Services', 'NYSE'),
+    ('MS', 'Morgan Stanley', 'Financial Services', 'NYSE'),
+    ('BLK', 'BlackRock', 'Financial Services', 'NYSE'),
+    ('SPGI', 'S&P Global', 'Financial Services', 'NYSE'),
+    ('AXP', 'American Express', 'Financial Services', 'NYSE'),
+    ('IBM', 'IBM', 'Technology', 'NYSE'),
+    ('GE', 'General Electric', 'Industrials', 'NYSE'),
+    ('AMGN', 'Amgen', 'Healthcare', 'NASDAQ'),
+    ('GILD', 'Gilead Sciences', 'Healthcare', 'NASDAQ'),
+    ('MDLZ', 'Mondelez', 'Consumer Defensive', 'NASDAQ'),
+    ('DE', 'Deere & Co.', 'Industrials', 'NYSE'),
+    ('LMT', 'Lockheed Martin', 'Industrials', 'NYSE'),
+    ('NOW', 'ServiceNow', 'Technology', 'NYSE'),
+    ('ISRG', 'Intuitive Surgical', 'Healthcare', 'NASDAQ'),
+    ('BKNG', 'Booking Holdings', 'Consumer Cyclical', 'NASDAQ'),
+    ('ADI', 'Analog Devices', 'Technology', 'NASDAQ'),
+    ('SBUX', 'Starbucks', 'Consumer Cyclical', 'NASDAQ'),
+    ('MMC', 'Marsh McLennan', 'Financial Services', 'NYSE'),
+    ('VRTX', 'Vertex Pharma', 'Healthcare', 'NASDAQ'),
+    ('REGN', 'Regeneron', 'Healthcare', 'NASDAQ'),
+    ('ZTS', 'Zoetis', 'Healthcare', 'NYSE'),
+    ('PLD', 'Prologis', 'Real Estate', 'NYSE'),
+    ('AMT', 'American Tower', 'Real Estate', 'NYSE'),
+    ('SYK', 'Stryker', 'Healthcare', 'NYSE'),
+    ('SCHW', 'Charles Schwab', 'Financial Services', 'NYSE'),
+    ('ADP', 'ADP', 'Industrials', 'NASDAQ'),
+    ('LRCX', 'Lam Research', 'Technology', 'NASDAQ'),
+    ('CB', 'Chubb Limited', 'Financial Services', 'NYSE'),
+    ('MMM', '3M Company', 'Industrials', 'NYSE'),
+    ('SO', 'Southern Company', 'Utilities', 'NYSE'),
+    ('DUK', 'Duke Energy', 'Utilities', 'NYSE'),
+    ('CL', 'Colgate-Palmolive', 'Consumer Defensive', 'NYSE'),
+    ('EOG', 'EOG Resources', 'Energy', 'NYSE'),
+    ('SLB', 'Schlumberger', 'Energy', 'NYSE'),
+    ('PXD', 'Pioneer Natural', 'Energy', 'NYSE'),
+    ('FCX', 'Freeport-McMoRan', 'Basic Materials', 'NYSE'),
+    ('NEM', 'Newmont', 'Basic Materials', 'NYSE'),
+    ('APD', 'Air Products', 'Basic Materials', 'NYSE'),
+    ('SHW', 'Sherwin-Williams', 'Basic Materials', 'NYSE'),
+    ('ECL', 'Ecolab', 'Basic Materials', 'NYSE'),
+]
+
+# Mid Cap stocks with exchanges
+MID_CAP_STOCKS = [
+    ('ETSY', 'Etsy Inc.', 'Consumer Cyclical', 'NASDAQ'),
+    ('ROKU', 'Roku Inc.', 'Communication Services', 'NASDAQ'),
+    ('SNAP', 'Snap Inc.', 'Communication Services', 'NYSE'),
+    ('PINS', 'Pinterest', 'Communication Services', 'NYSE'),
+    ('DKNG', 'DraftKings', 'Consumer Cyclical', 'NASDAQ'),
+    ('CROX', 'Crocs Inc.', 'Consumer Cyclical', 'NASDAQ'),
+    ('BILL', 'Bill.com', 'Technology', 'NYSE'),
+    ('CFLT', 'Confluent', 'Technology', 'NASDAQ'),
+    ('PATH', 'UiPath', 'Technology', 'NYSE'),
+    ('GTLB', 'GitLab', 'Technology', 'NASDAQ'),
+    ('NET', 'Cloudflare', 'Technology', 'NYSE'),
+    ('DDOG', 'Datadog', 'Technology', 'NASDAQ'),
+    ('ZS', 'Zscaler', 'Technology', 'NASDAQ'),
+    ('OKTA', 'Okta Inc.', 'Technology', 'NASDAQ'),
+    ('TWLO', 'Twilio', 'Technology', 'NYSE'),
+    ('RNG', 'RingCentral', 'Technology', 'NYSE'),
+    ('HUBS', 'HubSpot', 'Technology', 'NYSE'),
+    ('DOCU', 'DocuSign', 'Technology', 'NASDAQ'),
+    ('WIX', 'Wix.com', 'Technology', 'NASDAQ'),
+    ('DBX', 'Dropbox', 'Technology', 'NASDAQ'),
+]
+
+# Small Cap stocks ($300M - $2B) with exchanges
+SMALL_CAP_STOCKS = [
+    ('APPS', 'Digital Turbine', 'Technology', 'NASDAQ'),
+    ('BIGC', 'BigCommerce', 'Technology', 'NASDAQ'),
+    ('UPST', 'Upstart Holdings', 'Financial Services', 'NASDAQ'),
+    ('SOFI', 'SoFi Technologies', 'Financial Services', 'NASDAQ'),
+    ('AFRM', 'Affirm Holdings', 'Financial Services', 'NASDAQ'),
+    ('BMBL', 'Bumble Inc.', 'Communication Services', 'NASDAQ'),
+    ('TUYA', 'Tuya Inc.', 'Technology', 'NYSE'),
+    ('OPEN', 'Opendoor', 'Real Estate', 'NASDAQ'),
+    ('WISH', 'ContextLogic', 'Consumer Cyclical', 'NASDAQ'),
+    ('BIRD', 'Allbirds', 'Consumer Cyclical', 'NASDAQ'),
+    ('RENT', 'Rent the Runway', 'Consumer Cyclical', 'NASDAQ'),
+    ('PTON', 'Peloton', 'Consumer Cyclical', 'NASDAQ'),
+    ('CHGG', 'Chegg Inc.', 'Consumer Cyclical', 'NYSE'),
+    ('COUR', 'Coursera', 'Consumer Cyclical', 'NYSE'),
+    ('DUOL', 'Duolingo', 'Consumer Cyclical', 'NASDAQ'),
+    ('ABNB', 'Airbnb', 'Consumer Cyclical', 'NASDAQ'),
+    ('LYFT', 'Lyft Inc.', 'Industrials', 'NASDAQ'),
+    ('GRPN', 'Groupon', 'Consumer Cyclical', 'NASDAQ'),
+    ('IRBT', 'iRobot', 'Consumer Cyclical', 'NASDAQ'),
+    ('LMND', 'Lemonade', 'Financial Services', 'NYSE'),
+]
+
+# Micro Cap stocks ($50M - $300M) with exchanges
+MICRO_CAP_STOCKS = [
+    # NASDAQ Micro Caps
+    ('SMSI', 'Smith Micro', 'Technology', 'NASDAQ'),
+    ('CUEN', 'Cuentas Inc.', 'Technology', 'NASDAQ'),
+    ('QNRX', 'Quoin Pharma', 'Healthcare', 'NASDAQ'),
+    ('BIOR', 'Biora Therapeutics', 'Healthcare', 'NASDAQ'),
+    ('DRUG', 'Bright Minds Bio', 'Healthcare', 'NASDAQ'),
+    ('CRIS', 'Curis Inc.', 'Healthcare', 'NASDAQ'),
+    ('OCGN', 'Ocugen Inc.', 'Healthcare', 'NASDAQ'),
+    ('SNES', 'SenesTech', 'Healthcare', 'NASDAQ'),
+    ('CTSO', 'Cytosorbents', 'Healthcare', 'NASDAQ'),
+    ('NVAX', 'Novavax', 'Healthcare', 'NASDAQ'),
+    ('IOVA', 'Iovance Bio', 'Healthcare', 'NASDAQ'),
+    ('SAVA', 'Cassava Sciences', 'Healthcare', 'NASDAQ'),
+    ('MNKD', 'MannKind Corp.', 'Healthcare', 'NASDAQ'),
+    ('VERU', 'Veru Inc.', 'Healthcare', 'NASDAQ'),
+    ('VYGR', 'Voyager Therapeutics', 'Healthcare', 'NASDAQ'),
+    # NYSE Micro Caps
+    ('BTG', 'B2Gold Corp', 'Basic Materials', 'NYSE'),
+    ('HL', 'Hecla Mining', 'Basic Materials', 'NYSE'),
+    ('CDE', 'Coeur Mining', 'Basic Materials', 'NYSE'),
+    ('EGO', 'Eldorado Gold', 'Basic Materials', 'NYSE'),
+    ('AG', 'First Majestic Silver', 'Basic Materials', 'NYSE'),
+    ('PAAS', 'Pan American Silver', 'Basic Materials', 'NYSE'),
+    ('NGD', 'New Gold Inc', 'Basic Materials', 'NYSE'),
+    ('FSM', 'Fortuna Silver', 'Basic Materials', 'NYSE'),
+    ('USAS', 'Americas Gold Silver', 'Basic Materials', 'NYSE'),
+    ('GPL', 'Great Panther Mining', 'Basic Materials', 'NYSE'),
+    ('MUX', 'McEwen Mining', 'Basic Materials', 'NYSE'),
+    ('THM', 'International Tower Hill', 'Basic Materials', 'NYSE'),
+    ('GATO', 'Gatos Silver', 'Basic Materials', 'NYSE'),
+    ('SVM', 'Silvercorp Metals', 'Basic Materials', 'NYSE'),
+    ('ASM', 'Avino Silver Gold', 'Basic Materials', 'NYSE'),
+    ('REI', 'Ring Energy', 'Energy', 'NYSE'),
+    ('SD', 'SandRidge Energy', 'Energy', 'NYSE'),
+    ('NEXT', 'NextDecade Corp', 'Energy', 'NYSE'),
+    ('NGL', 'NGL Energy Partners', 'Energy', 'NYSE'),
+    ('PBF', 'PBF Energy', 'Energy', 'NYSE'),
+    ('PUMP', 'ProPetro Holding', 'Energy', 'NYSE'),
+    ('CPE', 'Callon Petroleum', 'Energy', 'NYSE'),
+    ('CIVI', 'Civitas Resources', 'Energy', 'NYSE'),
+    ('HPK', 'HighPeak Energy', 'Energy', 'NYSE'),
+    ('GTE', 'Gran Tierra Energy', 'Energy', 'NYSE'),
+    ('OII', 'Oceaneering Intl', 'Energy', 'NYSE'),
+    ('BORR', 'Borr Drilling', 'Energy', 'NYSE'),
+    ('VAL', 'Valaris Ltd', 'Energy', 'NYSE'),
+    ('RIG', 'Transocean Ltd', 'Energy', 'NYSE'),
+    ('GTN', 'Gray Television', 'Communication Services', 'NYSE'),
+    ('MSGS', 'Madison Square Garden', 'Communication Services', 'NYSE'),
+    ('EVC', 'Entravision Comms', 'Communication Services', 'NYSE'),
+    ('SSP', 'E.W. Scripps', 'Communication Services', 'NYSE'),
+    ('GCI', 'Gannett Co', 'Communication Services', 'NYSE'),
+    ('NYT', 'New York Times', 'Communication Services', 'NYSE'),
+    ('CMCSA', 'Comcast Corp', 'Communication Services', 'NYSE'),
+    ('AHH', 'Armada Hoffler', 'Real Estate', 'NYSE'),
+    ('LAND', 'Gladstone Land', 'Real Estate', 'NYSE'),
+    ('GOOD', 'Gladstone Commercial', 'Real Estate', 'NYSE'),
+    ('ORC', 'Orchid Island Cap', 'Real Estate', 'NYSE'),
+    ('TWO', 'Two Harbors Inv', 'Real Estate', 'NYSE'),
+    ('NYMT', 'New York Mortgage', 'Real Estate', 'NYSE'),
+    ('MFA', 'MFA Financial', 'Real Estate', 'NYSE'),
+    ('CIM', 'Chimera Investment', 'Real Estate', 'NYSE'),
+    ('BXMT', 'Blackstone Mortgage', 'Real Estate', 'NYSE'),
+    ('RC', 'Ready Capital', 'Real Estate', 'NYSE'),
+    ('TRTX', 'TPG RE Finance', 'Real Estate', 'NYSE'),
+    ('KREF', 'KKR Real Estate', 'Real Estate', 'NYSE'),
+    ('BGS', 'B&G Foods', 'Consumer Defensive', 'NYSE'),
+    ('THS', 'TreeHouse Foods', 'Consumer Defensive', 'NYSE'),
+    ('JBSS', 'John B Sanfilippo', 'Consumer Defensive', 'NYSE'),
+    ('CENTA', 'Central Garden Pet', 'Consumer Defensive', 'NYSE'),
+    ('SENEA', 'Seneca Foods', 'Consumer Defensive', 'NYSE'),
+    ('HRL', 'Hormel Foods', 'Consumer Defensive', 'NYSE'),
+    # AMEX Micro Caps
+    ('INUV', 'Inuvo Inc.', 'Technology', 'AMEX'),
+    ('BTN', 'Ballantyne Strong', 'Technology', 'AMEX'),
+    ('PETZ', 'TDH Holdings', 'Consumer Cyclical', 'AMEX'),
+    ('REED', 'Reeds Inc', 'Consumer Defensive', 'AMEX'),
+    ('HUSA', 'Houston American Energy', 'Energy', 'AMEX'),
+    ('EPM', 'Evolution Petroleum', 'Energy', 'AMEX'),
+    ('USEG', 'US Energy Corp', 'Energy', 'AMEX'),
+    ('SNMP', 'Sanchez Midstream', 'Energy', 'AMEX'),
+    ('GORO', 'Gold Resource Corp', 'Basic Materials', 'AMEX'),
+    ('GSS', 'Golden Star Resources', 'Basic Materials', 'AMEX'),
+    ('TGB', 'Taseko Mines', 'Basic Materials', 'AMEX'),
+    ('SAND', 'Sandstorm Gold', 'Basic Materials', 'AMEX'),
+    ('EXK', 'Endeavour Silver', 'Basic Materials', 'AMEX'),
+    ('SILV', 'SilverCrest Metals', 'Basic Materials', 'AMEX'),
+    ('AXU', 'Alexco Resource', 'Basic Materials', 'AMEX'),
+    ('USAU', 'US Gold Corp', 'Basic Materials', 'AMEX'),
+    ('FSR', 'Fisker Inc', 'Consumer Cyclical', 'NYSE'),
+    ('GOEV', 'Canoo Inc', 'Consumer Cyclical', 'NYSE'),
+    ('LCID', 'Lucid Group', 'Consumer Cyclical', 'NYSE'),
+    ('RIVN', 'Rivian Automotive', 'Consumer Cyclical', 'NYSE'),
+    ('PSNY', 'Polestar Automotive', 'Consumer Cyclical', 'NYSE'),
+    ('NKLA', 'Nikola Corp', 'Industrials', 'NYSE'),
+    ('RIDE', 'Lordstown Motors', 'Consumer Cyclical', 'NYSE'),
+    ('ARVL', 'Arrival SA', 'Consumer Cyclical', 'NYSE'),
+    ('WKHS', 'Workhorse Group', 'Industrials', 'NYSE'),
+    ('HYLN', 'Hyliion Holdings', 'Industrials', 'NYSE'),
+    ('XL', 'XL Fleet Corp', 'Industrials', 'NYSE'),
+    ('ASTS', 'AST SpaceMobile', 'Technology', 'NYSE'),
+    ('SPCE', 'Virgin Galactic', 'Industrials', 'NYSE'),
+    ('RKLB', 'Rocket Lab USA', 'Industrials', 'NYSE'),
+    ('RDW', 'Redwire Corp', 'Industrials', 'NYSE'),
+    ('MNTS', 'Momentus Inc', 'Industrials', 'NYSE'),
+    ('ASTR', 'Astra Space', 'Industrials', 'NYSE'),
+    ('PL', 'Planet Labs', 'Technology', 'NYSE'),
+    ('BKSY', 'BlackSky Technology', 'Technology', 'NYSE'),
+    ('SATL', 'Satellogic Inc', 'Technology', 'NYSE'),
+]
+
+# (ticker rows, representative market cap, tier label) per static tier;
+# built once at import so each universe call is a single comprehension
+_UNIVERSE_TIERS = (
+    (LARGE_CAP_STOCKS, 50e9, 'Large Cap'),
+    (MID_CAP_STOCKS, 5e9, 'Mid Cap'),
+    (SMALL_CAP_STOCKS, 500e6, 'Small Cap'),
+    (MICRO_CAP_STOCKS, 100e6, 'Micro Cap'),
+)
+
+# The built-in universe is static, so the row dicts are assembled once
+# at import; screen runs take copies (enrichment mutates them in place)
+_BUILTIN_UNIVERSE = [
+    {
+        'ticker': ticker,
+        'name': name,
+        'sector': sector,
+        'exchange': exch,
+        'market_cap': cap,  # Approximate for sorting
+        'market_cap_universe': tier,
+    }
+    for tier_rows, cap, tier in _UNIVERSE_TIERS
+    for ticker, name, sector, exch in tier_rows
+]
+
+# In-process memo over the downloaded universe lists, so warm reruns
+# skip even the disk-cache unpickle; entries expire after an hour
+_UNIVERSE_MEMO_TTL = 3600.0
+_universe_memo: Dict[str, Any] = {}
 
 
 class BatchScreener:
@@ -210,9 +586,23 @@ class BatchScreener:
     Yields matched stocks as they're found for live display.
     """
 
-    def __init__(self, data_source: str = "yahoo", api_key: str = None):
+    def __init__(self, data_source: str = "yahoo", api_key: str = None,
+                 cache_ttl_hours: float = 24):
         self.data_source = data_source
         self.api_key = api_key
+        self.cache_ttl_hours = cache_ttl_hours
+        self._metrics_cache = {}  # in-process layer over the disk cache
+
+        # Shared HTTP session for all yfinance calls: pooled connections
+        # amortize the TLS handshake across fetches, and transient Yahoo
+        # errors (rate limits, 5xx) retry with backoff instead of failing
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504]))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
         # Initialize appropriate fetcher
         if data_source == "roic":
@@ -265,327 +655,16 @@ class BatchScreener:
         Get stock universe - uses a reliable built-in list of stocks across market caps.
         Format: (ticker, name, sector, exchange)
         """
-        # Mega/Large Cap stocks (S&P 500) with correct exchanges
-        LARGE_CAP_STOCKS = [
-            ('AAPL', 'Apple Inc.', 'Technology', 'NASDAQ'),
-            ('MSFT', 'Microsoft Corp.', 'Technology', 'NASDAQ'),
-            ('GOOGL', 'Alphabet Inc.', 'Communication Services', 'NASDAQ'),
-            ('AMZN', 'Amazon.com Inc.', 'Consumer Cyclical', 'NASDAQ'),
-            ('NVDA', 'NVIDIA Corp.', 'Technology', 'NASDAQ'),
-            ('META', 'Meta Platforms Inc.', 'Communication Services', 'NASDAQ'),
-            ('TSLA', 'Tesla Inc.', 'Consumer Cyclical', 'NASDAQ'),
-            ('BRK-B', 'Berkshire Hathaway', 'Financial Services', 'NYSE'),
-            ('UNH', 'UnitedHealth Group', 'Healthcare', 'NYSE'),
-            ('JNJ', 'Johnson & Johnson', 'Healthcare', 'NYSE'),
-            ('JPM', 'JPMorgan Chase', 'Financial Services', 'NYSE'),
-            ('V', 'Visa Inc.', 'Financial Services', 'NYSE'),
-            ('XOM', 'Exxon Mobil', 'Energy', 'NYSE'),
-            ('PG', 'Procter & Gamble', 'Consumer Defensive', 'NYSE'),
-            ('MA', 'Mastercard', 'Financial Services', 'NYSE'),
-            ('HD', 'Home Depot', 'Consumer Cyclical', 'NYSE'),
-            ('CVX', 'Chevron', 'Energy', 'NYSE'),
-            ('MRK', 'Merck & Co.', 'Healthcare', 'NYSE'),
-            ('LLY', 'Eli Lilly', 'Healthcare', 'NYSE'),
-            ('ABBV', 'AbbVie Inc.', 'Healthcare', 'NYSE'),
-            ('PEP', 'PepsiCo', 'Consumer Defensive', 'NASDAQ'),
-            ('KO', 'Coca-Cola', 'Consumer Defensive', 'NYSE'),
-            ('AVGO', 'Broadcom Inc.', 'Technology', 'NASDAQ'),
-            ('COST', 'Costco', 'Consumer Defensive', 'NASDAQ'),
-            ('MCD', 'McDonald\'s', 'Consumer Cyclical', 'NYSE'),
-            ('WMT', 'Walmart', 'Consumer Defensive', 'NYSE'),
-            ('CSCO', 'Cisco Systems', 'Technology', 'NASDAQ'),
-            ('TMO', 'Thermo Fisher', 'Healthcare', 'NYSE'),
-            ('ACN', 'Accenture', 'Technology', 'NYSE'),
-            ('ABT', 'Abbott Labs', 'Healthcare', 'NYSE'),
-            ('CRM', 'Salesforce', 'Technology', 'NYSE'),
-            ('DHR', 'Danaher', 'Healthcare', 'NYSE'),
-            ('ORCL', 'Oracle', 'Technology', 'NYSE'),
-            ('NKE', 'Nike Inc.', 'Consumer Cyclical', 'NYSE'),
-            ('AMD', 'AMD', 'Technology', 'NASDAQ'),
-            ('INTC', 'Intel', 'Technology', 'NASDAQ'),
-            ('DIS', 'Walt Disney', 'Communication Services', 'NYSE'),
-            ('VZ', 'Verizon', 'Communication Services', 'NYSE'),
-            ('NFLX', 'Netflix', 'Communication Services', 'NASDAQ'),
-            ('ADBE', 'Adobe Inc.', 'Technology', 'NASDAQ'),
-            ('TXN', 'Texas Instruments', 'Technology', 'NASDAQ'),
-            ('PM', 'Philip Morris', 'Consumer Defensive', 'NYSE'),
-            ('NEE', 'NextEra Energy', 'Utilities', 'NYSE'),
-            ('UNP', 'Union Pacific', 'Industrials', 'NYSE'),
-            ('RTX', 'Raytheon', 'Industrials', 'NYSE'),
-            ('HON', 'Honeywell', 'Industrials', 'NASDAQ'),
-            ('QCOM', 'Qualcomm', 'Technology', 'NASDAQ'),
-            ('LOW', 'Lowe\'s', 'Consumer Cyclical', 'NYSE'),
-            ('BA', 'Boeing', 'Industrials', 'NYSE'),
-            ('CAT', 'Caterpillar', 'Industrials', 'NYSE'),
-            ('GS', 'Goldman Sachs', 'Financial Services', 'NYSE'),
-            ('MS', 'Morgan Stanley', 'Financial Services', 'NYSE'),
-            ('BLK', 'BlackRock', 'Financial Services', 'NYSE'),
-            ('SPGI', 'S&P Global', 'Financial Services', 'NYSE'),
-            ('AXP', 'American Express', 'Financial Services', 'NYSE'),
-            ('IBM', 'IBM', 'Technology', 'NYSE'),
-            ('GE', 'General Electric', 'Industrials', 'NYSE'),
-            ('AMGN', 'Amgen', 'Healthcare', 'NASDAQ'),
-            ('GILD', 'Gilead Sciences', 'Healthcare', 'NASDAQ'),
-            ('MDLZ', 'Mondelez', 'Consumer Defensive', 'NASDAQ'),
-            ('DE', 'Deere & Co.', 'Industrials', 'NYSE'),
-            ('LMT', 'Lockheed Martin', 'Industrials', 'NYSE'),
-            ('NOW', 'ServiceNow', 'Technology', 'NYSE'),
-            ('ISRG', 'Intuitive Surgical', 'Healthcare', 'NASDAQ'),
-            ('BKNG', 'Booking Holdings', 'Consumer Cyclical', 'NASDAQ'),
-            ('ADI', 'Analog Devices', 'Technology', 'NASDAQ'),
-            ('SBUX', 'Starbucks', 'Consumer Cyclical', 'NASDAQ'),
-            ('MMC', 'Marsh McLennan', 'Financial Services', 'NYSE'),
-            ('VRTX', 'Vertex Pharma', 'Healthcare', 'NASDAQ'),
-            ('REGN', 'Regeneron', 'Healthcare', 'NASDAQ'),
-            ('ZTS', 'Zoetis', 'Healthcare', 'NYSE'),
-            ('PLD', 'Prologis', 'Real Estate', 'NYSE'),
-            ('AMT', 'American Tower', 'Real Estate', 'NYSE'),
-            ('SYK', 'Stryker', 'Healthcare', 'NYSE'),
-            ('SCHW', 'Charles Schwab', 'Financial Services', 'NYSE'),
-            ('ADP', 'ADP', 'Industrials', 'NASDAQ'),
-            ('LRCX', 'Lam Research', 'Technology', 'NASDAQ'),
-            ('CB', 'Chubb Limited', 'Financial Services', 'NYSE'),
-            ('MMM', '3M Company', 'Industrials', 'NYSE'),
-            ('SO', 'Southern Company', 'Utilities', 'NYSE'),
-            ('DUK', 'Duke Energy', 'Utilities', 'NYSE'),
-            ('CL', 'Colgate-Palmolive', 'Consumer Defensive', 'NYSE'),
-            ('EOG', 'EOG Resources', 'Energy', 'NYSE'),
-            ('SLB', 'Schlumberger', 'Energy', 'NYSE'),
-            ('PXD', 'Pioneer Natural', 'Energy', 'NYSE'),
-            ('FCX', 'Freeport-McMoRan', 'Basic Materials', 'NYSE'),
-            ('NEM', 'Newmont', 'Basic Materials', 'NYSE'),
-            ('APD', 'Air Products', 'Basic Materials', 'NYSE'),
-            ('SHW', 'Sherwin-Williams', 'Basic Materials', 'NYSE'),
-            ('ECL', 'Ecolab', 'Basic Materials', 'NYSE'),
-        ]
-
-        # Mid Cap stocks with exchanges
-        MID_CAP_STOCKS = [
-            ('ETSY', 'Etsy Inc.', 'Consumer Cyclical', 'NASDAQ'),
-            ('ROKU', 'Roku Inc.', 'Communication Services', 'NASDAQ'),
-            ('SNAP', 'Snap Inc.', 'Communication Services', 'NYSE'),
-            ('PINS', 'Pinterest', 'Communication Services', 'NYSE'),
-            ('DKNG', 'DraftKings', 'Consumer Cyclical', 'NASDAQ'),
-            ('CROX', 'Crocs Inc.', 'Consumer Cyclical', 'NASDAQ'),
-            ('BILL', 'Bill.com', 'Technology', 'NYSE'),
-            ('CFLT', 'Confluent', 'Technology', 'NASDAQ'),
-            ('PATH', 'UiPath', 'Technology', 'NYSE'),
-            ('GTLB', 'GitLab', 'Technology', 'NASDAQ'),
-            ('NET', 'Cloudflare', 'Technology', 'NYSE'),
-            ('DDOG', 'Datadog', 'Technology', 'NASDAQ'),
-            ('ZS', 'Zscaler', 'Technology', 'NASDAQ'),
-            ('OKTA', 'Okta Inc.', 'Technology', 'NASDAQ'),
-            ('TWLO', 'Twilio', 'Technology', 'NYSE'),
-            ('RNG', 'RingCentral', 'Technology', 'NYSE'),
-            ('HUBS', 'HubSpot', 'Technology', 'NYSE'),
-            ('DOCU', 'DocuSign', 'Technology', 'NASDAQ'),
-            ('WIX', 'Wix.com', 'Technology', 'NASDAQ'),
-            ('DBX', 'Dropbox', 'Technology', 'NASDAQ'),
-        ]
-
-        # Small Cap stocks ($300M - $2B) with exchanges
-        SMALL_CAP_STOCKS = [
-            ('APPS', 'Digital Turbine', 'Technology', 'NASDAQ'),
-            ('BIGC', 'BigCommerce', 'Technology', 'NASDAQ'),
-            ('UPST', 'Upstart Holdings', 'Financial Services', 'NASDAQ'),
-            ('SOFI', 'SoFi Technologies', 'Financial Services', 'NASDAQ'),
-            ('AFRM', 'Affirm Holdings', 'Financial Services', 'NASDAQ'),
-            ('BMBL', 'Bumble Inc.', 'Communication Services', 'NASDAQ'),
-            ('TUYA', 'Tuya Inc.', 'Technology', 'NYSE'),
-            ('OPEN', 'Opendoor', 'Real Estate', 'NASDAQ'),
-            ('WISH', 'ContextLogic', 'Consumer Cyclical', 'NASDAQ'),
-            ('BIRD', 'Allbirds', 'Consumer Cyclical', 'NASDAQ'),
-            ('RENT', 'Rent the Runway', 'Consumer Cyclical', 'NASDAQ'),
-            ('PTON', 'Peloton', 'Consumer Cyclical', 'NASDAQ'),
-            ('CHGG', 'Chegg Inc.', 'Consumer Cyclical', 'NYSE'),
-            ('COUR', 'Coursera', 'Consumer Cyclical', 'NYSE'),
-            ('DUOL', 'Duolingo', 'Consumer Cyclical', 'NASDAQ'),
-            ('ABNB', 'Airbnb', 'Consumer Cyclical', 'NASDAQ'),
-            ('LYFT', 'Lyft Inc.', 'Industrials', 'NASDAQ'),
-            ('GRPN', 'Groupon', 'Consumer Cyclical', 'NASDAQ'),
-            ('IRBT', 'iRobot', 'Consumer Cyclical', 'NASDAQ'),
-            ('LMND', 'Lemonade', 'Financial Services', 'NYSE'),
-        ]
-
-        # Micro Cap stocks ($50M - $300M) with exchanges
-        MICRO_CAP_STOCKS = [
-            # NASDAQ Micro Caps
-            ('SMSI', 'Smith Micro', 'Technology', 'NASDAQ'),
-            ('CUEN', 'Cuentas Inc.', 'Technology', 'NASDAQ'),
-            ('QNRX', 'Quoin Pharma', 'Healthcare', 'NASDAQ'),
-            ('BIOR', 'Biora Therapeutics', 'Healthcare', 'NASDAQ'),
-            ('DRUG', 'Bright Minds Bio', 'Healthcare', 'NASDAQ'),
-            ('CRIS', 'Curis Inc.', 'Healthcare', 'NASDAQ'),
-            ('OCGN', 'Ocugen Inc.', 'Healthcare', 'NASDAQ'),
-            ('SNES', 'SenesTech', 'Healthcare', 'NASDAQ'),
-            ('CTSO', 'Cytosorbents', 'Healthcare', 'NASDAQ'),
-            ('NVAX', 'Novavax', 'Healthcare', 'NASDAQ'),
-            ('IOVA', 'Iovance Bio', 'Healthcare', 'NASDAQ'),
-            ('SAVA', 'Cassava Sciences', 'Healthcare', 'NASDAQ'),
-            ('MNKD', 'MannKind Corp.', 'Healthcare', 'NASDAQ'),
-            ('VERU', 'Veru Inc.', 'Healthcare', 'NASDAQ'),
-            ('VYGR', 'Voyager Therapeutics', 'Healthcare', 'NASDAQ'),
-            # NYSE Micro Caps
-            ('BTG', 'B2Gold Corp', 'Basic Materials', 'NYSE'),
-            ('HL', 'Hecla Mining', 'Basic Materials', 'NYSE'),
-            ('CDE', 'Coeur Mining', 'Basic Materials', 'NYSE'),
-            ('EGO', 'Eldorado Gold', 'Basic Materials', 'NYSE'),
-            ('AG', 'First Majestic Silver', 'Basic Materials', 'NYSE'),
-            ('PAAS', 'Pan American Silver', 'Basic Materials', 'NYSE'),
-            ('NGD', 'New Gold Inc', 'Basic Materials', 'NYSE'),
-            ('FSM', 'Fortuna Silver', 'Basic Materials', 'NYSE'),
-            ('USAS', 'Americas Gold Silver', 'Basic Materials', 'NYSE'),
-            ('GPL', 'Great Panther Mining', 'Basic Materials', 'NYSE'),
-            ('MUX', 'McEwen Mining', 'Basic Materials', 'NYSE'),
-            ('THM', 'International Tower Hill', 'Basic Materials', 'NYSE'),
-            ('GATO', 'Gatos Silver', 'Basic Materials', 'NYSE'),
-            ('SVM', 'Silvercorp Metals', 'Basic Materials', 'NYSE'),
-            ('ASM', 'Avino Silver Gold', 'Basic Materials', 'NYSE'),
-            ('REI', 'Ring Energy', 'Energy', 'NYSE'),
-            ('SD', 'SandRidge Energy', 'Energy', 'NYSE'),
-            ('NEXT', 'NextDecade Corp', 'Energy', 'NYSE'),
-            ('NGL', 'NGL Energy Partners', 'Energy', 'NYSE'),
-            ('PBF', 'PBF Energy', 'Energy', 'NYSE'),
-            ('PUMP', 'ProPetro Holding', 'Energy', 'NYSE'),
-            ('CPE', 'Callon Petroleum', 'Energy', 'NYSE'),
-            ('CIVI', 'Civitas Resources', 'Energy', 'NYSE'),
-            ('HPK', 'HighPeak Energy', 'Energy', 'NYSE'),
-            ('GTE', 'Gran Tierra Energy', 'Energy', 'NYSE'),
-            ('OII', 'Oceaneering Intl', 'Energy', 'NYSE'),
-            ('BORR', 'Borr Drilling', 'Energy', 'NYSE'),
-            ('VAL', 'Valaris Ltd', 'Energy', 'NYSE'),
-            ('RIG', 'Transocean Ltd', 'Energy', 'NYSE'),
-            ('GTN', 'Gray Television', 'Communication Services', 'NYSE'),
-            ('MSGS', 'Madison Square Garden', 'Communication Services', 'NYSE'),
-            ('EVC', 'Entravision Comms', 'Communication Services', 'NYSE'),
-            ('SSP', 'E.W. Scripps', 'Communication Services', 'NYSE'),
-            ('GCI', 'Gannett Co', 'Communication Services', 'NYSE'),
-            ('NYT', 'New York Times', 'Communication Services', 'NYSE'),
-            ('CMCSA', 'Comcast Corp', 'Communication Services', 'NYSE'),
-            ('AHH', 'Armada Hoffler', 'Real Estate', 'NYSE'),
-            ('LAND', 'Gladstone Land', 'Real Estate', 'NYSE'),
-            ('GOOD', 'Gladstone Commercial', 'Real Estate', 'NYSE'),
-            ('ORC', 'Orchid Island Cap', 'Real Estate', 'NYSE'),
-            ('TWO', 'Two Harbors Inv', 'Real Estate', 'NYSE'),
-            ('NYMT', 'New York Mortgage', 'Real Estate', 'NYSE'),
-            ('MFA', 'MFA Financial', 'Real Estate', 'NYSE'),
-            ('CIM', 'Chimera Investment', 'Real Estate', 'NYSE'),
-            ('BXMT', 'Blackstone Mortgage', 'Real Estate', 'NYSE'),
-            ('RC', 'Ready Capital', 'Real Estate', 'NYSE'),
-            ('TRTX', 'TPG RE Finance', 'Real Estate', 'NYSE'),
-            ('KREF', 'KKR Real Estate', 'Real Estate', 'NYSE'),
-            ('BGS', 'B&G Foods', 'Consumer Defensive', 'NYSE'),
-            ('THS', 'TreeHouse Foods', 'Consumer Defensive', 'NYSE'),
-            ('JBSS', 'John B Sanfilippo', 'Consumer Defensive', 'NYSE'),
-            ('CENTA', 'Central Garden Pet', 'Consumer Defensive', 'NYSE'),
-            ('SENEA', 'Seneca Foods', 'Consumer Defensive', 'NYSE'),
-            ('HRL', 'Hormel Foods', 'Consumer Defensive', 'NYSE'),
-            # AMEX Micro Caps
-            ('INUV', 'Inuvo Inc.', 'Technology', 'AMEX'),
-            ('BTN', 'Ballantyne Strong', 'Technology', 'AMEX'),
-            ('PETZ', 'TDH Holdings', 'Consumer Cyclical', 'AMEX'),
-            ('REED', 'Reeds Inc', 'Consumer Defensive', 'AMEX'),
-            ('HUSA', 'Houston American Energy', 'Energy', 'AMEX'),
-            ('EPM', 'Evolution Petroleum', 'Energy', 'AMEX'),
-            ('USEG', 'US Energy Corp', 'Energy', 'AMEX'),
-            ('SNMP', 'Sanchez Midstream', 'Energy', 'AMEX'),
-            ('GORO', 'Gold Resource Corp', 'Basic Materials', 'AMEX'),
-            ('GSS', 'Golden Star Resources', 'Basic Materials', 'AMEX'),
-            ('TGB', 'Taseko Mines', 'Basic Materials', 'AMEX'),
-            ('SAND', 'Sandstorm Gold', 'Basic Materials', 'AMEX'),
-            ('EXK', 'Endeavour Silver', 'Basic Materials', 'AMEX'),
-            ('SILV', 'SilverCrest Metals', 'Basic Materials', 'AMEX'),
-            ('AXU', 'Alexco Resource', 'Basic Materials', 'AMEX'),
-            ('USAU', 'US Gold Corp', 'Basic Materials', 'AMEX'),
-            ('FSR', 'Fisker Inc', 'Consumer Cyclical', 'NYSE'),
-            ('GOEV', 'Canoo Inc', 'Consumer Cyclical', 'NYSE'),
-            ('LCID', 'Lucid Group', 'Consumer Cyclical', 'NYSE'),
-            ('RIVN', 'Rivian Automotive', 'Consumer Cyclical', 'NYSE'),
-            ('PSNY', 'Polestar Automotive', 'Consumer Cyclical', 'NYSE'),
-            ('NKLA', 'Nikola Corp', 'Industrials', 'NYSE'),
-            ('RIDE', 'Lordstown Motors', 'Consumer Cyclical', 'NYSE'),
-            ('ARVL', 'Arrival SA', 'Consumer Cyclical', 'NYSE'),
-            ('WKHS', 'Workhorse Group', 'Industrials', 'NYSE'),
-            ('HYLN', 'Hyliion Holdings', 'Industrials', 'NYSE'),
-            ('XL', 'XL Fleet Corp', 'Industrials', 'NYSE'),
-            ('ASTS', 'AST SpaceMobile', 'Technology', 'NYSE'),
-            ('SPCE', 'Virgin Galactic', 'Industrials', 'NYSE'),
-            ('RKLB', 'Rocket Lab USA', 'Industrials', 'NYSE'),
-            ('RDW', 'Redwire Corp', 'Industrials', 'NYSE'),
-            ('MNTS', 'Momentus Inc', 'Industrials', 'NYSE'),
-            ('ASTR', 'Astra Space', 'Industrials', 'NYSE'),
-            ('PL', 'Planet Labs', 'Technology', 'NYSE'),
-            ('BKSY', 'BlackSky Technology', 'Technology', 'NYSE'),
-            ('SATL', 'Satellogic Inc', 'Technology', 'NYSE'),
-        ]
-
-        stocks = []
-
-        # Add Large Cap stocks
-        for ticker, name, sector, exch in LARGE_CAP_STOCKS:
-            stocks.append({
-                'ticker': ticker,
-                'name': name,
-                'sector': sector,
-                'exchange': exch,
-                'market_cap': 50e9,  # Approximate for sorting
-                'market_cap_universe': 'Large Cap',
-            })
-
-        # Add Mid Cap stocks
-        for ticker, name, sector, exch in MID_CAP_STOCKS:
-            stocks.append({
-                'ticker': ticker,
-                'name': name,
-                'sector': sector,
-                'exchange': exch,
-                'market_cap': 5e9,
-                'market_cap_universe': 'Mid Cap',
-            })
-
-        # Add Small Cap stocks
-        for ticker, name, sector, exch in SMALL_CAP_STOCKS:
-            stocks.append({
-                'ticker': ticker,
-                'name': name,
-                'sector': sector,
-                'exchange': exch,
-                'market_cap': 500e6,
-                'market_cap_universe': 'Small Cap',
-            })
-
-        # Add Micro Cap stocks
-        for ticker, name, sector, exch in MICRO_CAP_STOCKS:
-            stocks.append({
-                'ticker': ticker,
-                'name': name,
-                'sector': sector,
-                'exchange': exch,
-                'market_cap': 100e6,
-                'market_cap_universe': 'Micro Cap',
-            })
+        stocks = [dict(s) for s in _BUILTIN_UNIVERSE]
 
         print(f"Loaded {len(stocks)} stocks from built-in list (Large: {len(LARGE_CAP_STOCKS)}, Mid: {len(MID_CAP_STOCKS)}, Small: {len(SMALL_CAP_STOCKS)}, Micro: {len(MICRO_CAP_STOCKS)})")
 
-        # Apply filters if provided
+        # Apply filters if provided. Every cheap field (sector,
+        # exchange, tier) is already on the built-in rows, so the whole
+        # cut happens here before any enrichment is spent
         if filters:
             original_count = len(stocks)
-
-            # Filter by sector
-            sector_filter = filters.get('sector', [])
-            if sector_filter and len(sector_filter) > 0:
-                stocks = [s for s in stocks if s['sector'] in sector_filter]
-
-            # Filter by exchange
-            exchange_filter = filters.get('exchange', [])
-            if exchange_filter and len(exchange_filter) > 0:
-                stocks = [s for s in stocks if s['exchange'] in exchange_filter]
-
-            # Filter by market cap universe
-            cap_filter = filters.get('market_cap_universe', [])
-            if cap_filter and len(cap_filter) > 0:
-                stocks = [s for s in stocks if s['market_cap_universe'] in cap_filter]
-
+            stocks = self.apply_basic_filters(stocks, filters)
             print(f"Filtered from {original_count} to {len(stocks)} stocks")
 
         return stocks
@@ -594,44 +673,58 @@ class BatchScreener:
         """
         Fetch comprehensive ticker list from NASDAQ (free, no API key needed).
         Returns ~11,000 stocks across NYSE, NASDAQ, AMEX.
+        The list changes slowly, so it is cached locally for a week —
+        warm runs skip the download and parse entirely.
         """
+        memo = _universe_memo.get('nasdaq')
+        if memo is not None and time.monotonic() - memo[0] < _UNIVERSE_MEMO_TTL:
+            return [dict(s) for s in memo[1]]
+
+        cached = self._cache_get('universe', 'nasdaq', ttl_hours=7 * 24)
+        if cached is not None:
+            print(f"Loaded {len(cached)} stocks from local NASDAQ cache")
+            _universe_memo['nasdaq'] = (time.monotonic(), cached)
+            return [dict(s) for s in cached]
+
         url = 'https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqtraded.txt'
 
         try:
             print("Fetching ticker list from NASDAQ...")
             resp = requests.get(url, timeout=30)
             resp.raise_for_status()
-            lines = resp.text.strip().split('\n')
 
             # Map market codes to exchange names
             market_map = {'N': 'NYSE', 'Q': 'NASDAQ', 'A': 'AMEX', 'P': 'NYSE'}
 
-            stocks = []
-            for line in lines[1:-1]:  # Skip header and footer
-                parts = line.split('|')
-                if len(parts) >= 6:
-                    symbol = parts[1].strip()
-                    name = parts[2].strip()
-                    market = parts[3].strip()
-                    is_etf = parts[5].strip() == 'Y'
-                    test_issue = parts[7].strip() == 'Y' if len(parts) > 7 else False
-
-                    # Skip ETFs, test issues, empty symbols, and symbols with special chars
-                    if (symbol and
-                        market in market_map and
-                        not is_etf and
-                        not test_issue and
-                        symbol.isalpha() and  # Only letters (skip warrants, units, etc.)
-                        len(symbol) <= 5):  # Standard stock symbols
-
-                        stocks.append({
-                            'ticker': symbol,
-                            'name': name,
-                            'sector': 'N/A',  # Will be enriched if needed
-                            'exchange': market_map[market],
-                            'market_cap': 0,  # Will be enriched if needed
-                            'market_cap_universe': 'Unknown',
-                        })
+            # Parse the pipe-delimited file with pandas' C parser and
+            # filter column-wise; the trailing creation-time footer
+            # parses as a one-field row and is dropped with the rest
+            df = pd.read_csv(io.StringIO(resp.text), sep='|', dtype=str)
+            symbol = df['Symbol'].fillna('').str.strip()
+            market = df['Listing Exchange'].fillna('').str.strip()
+
+            # Skip ETFs, test issues, empty symbols, and symbols with
+            # special chars (warrants, units, etc. - only letters, <= 5)
+            keep = (market.isin(market_map) &
+                    (df['ETF'].fillna('').str.strip() != 'Y') &
+                    (df['Test Issue'].fillna('').str.strip() != 'Y') &
+                    symbol.str.isalpha() &
+                    (symbol.str.len() <= 5))
+
+            stocks = [
+                {
+                    'ticker': sym,
+                    'name': name,
+                    'sector': 'N/A',  # Will be enriched if needed
+                    'exchange': market_map[mkt],
+                    'market_cap': 0,  # Will be enriched if needed
+                    'market_cap_universe': 'Unknown',
+                }
+                for sym, name, mkt in zip(
+                    symbol[keep],
+                    df['Security Name'][keep].fillna('').str.strip(),
+                    market[keep])
+            ]
 
             # Count by exchange
             exchanges = {}
@@ -640,6 +733,8 @@ class BatchScreener:
                 exchanges[e] = exchanges.get(e, 0) + 1
             print(f"Loaded {len(stocks)} stocks from NASDAQ: {exchanges}")
 
+            self._cache_put('universe', 'nasdaq', stocks)
+            _universe_memo['nasdaq'] = (time.monotonic(), stocks)
             return stocks
 
         except Exception as e:
@@ -707,99 +802,190 @@ class BatchScreener:
         print("Using fallback built-in stock list...")
         return self._get_yahoo_universe(exchange)
 
+    def _cache_path(self, kind: str, ticker: str) -> str:
+        return os.path.join(CACHE_DIR, f"{kind}_{ticker.replace('/', '_')}.pkl")
+
+    def _cache_get(self, kind: str, ticker: str, ttl_hours: float = None):
+        """Read a cached entry, or None if missing or past the TTL"""
+        if ttl_hours is None:
+            ttl_hours = self.cache_ttl_hours
+        path = self._cache_path(kind, ticker)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl_hours * 3600:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _cache_put(self, kind: str, ticker: str, value):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(kind, ticker), 'wb') as f:
+                pickle.dump(value, f)
+        except (OSError, pickle.PickleError):
+            pass  # caching is best-effort
+
     def enrich_stock_info(self, stock: Dict) -> Dict:
         """
         Fetch additional info for a stock (market cap, etc.)
-        Only called when needed for filtering.
+        Only called when needed for filtering. Info dicts are cached on
+        disk, so repeat runs within the TTL skip the network entirely.
         """
         try:
-            ticker = stock['ticker']
-            yf_ticker = yf.Ticker(ticker)
-            info = yf_ticker.info
-
-            stock['name'] = info.get('longName', stock.get('name', ticker))
-
-            # Only update sector if it was N/A
-            if stock.get('sector') == 'N/A':
-                raw_sector = info.get('sector', 'N/A')
-                stock['sector'] = normalize_sector(raw_sector)
-
-            stock['industry'] = info.get('industry', stock.get('industry', 'N/A'))
-
-            # Only update exchange if it was N/A (preserve our static data)
-            if stock.get('exchange') == 'N/A':
-                raw_exchange = info.get('exchange', 'N/A')
-                if 'NASDAQ' in raw_exchange.upper() or 'NMS' in raw_exchange.upper() or 'NGM' in raw_exchange.upper():
-                    stock['exchange'] = 'NASDAQ'
-                elif 'NYSE' in raw_exchange.upper() or 'NYQ' in raw_exchange.upper():
-                    stock['exchange'] = 'NYSE'
-                elif 'AMEX' in raw_exchange.upper():
-                    stock['exchange'] = 'AMEX'
-                else:
-                    stock['exchange'] = raw_exchange
-
-            stock['market_cap'] = info.get('marketCap', 0) or 0
-            stock['market_cap_universe'] = get_market_cap_universe(stock['market_cap'])
-
-            # Additional quick metrics
-            stock['gross_margin'] = (info.get('grossMargins', 0) or 0) * 100
-
+            info = self._cache_get('info', stock['ticker'])
+            if info is None:
+                _YAHOO_LIMITER.acquire()
+                info = yf.Ticker(stock['ticker'], session=self._session).info
+                self._cache_put('info', stock['ticker'], info)
+            self._apply_info(stock, info)
         except Exception as e:
             print(f"Error enriching {stock['ticker']}: {e}")
-            if 'market_cap_universe' not in stock:
-                stock['market_cap_universe'] = 'Unknown'
-            if 'gross_margin' not in stock:
-                stock['gross_margin'] = 0
+            self._apply_enrich_defaults(stock)
 
         return stock
 
+    def _enrich_batch(self, stocks: List[Dict],
+                      batch_size: int = ENRICH_BATCH_SIZE) -> List[Dict]:
+        """
+        Enrich a list of stocks with multi-symbol yf.Tickers requests.
+        One batched request covers up to batch_size symbols on a shared
+        session, instead of one HTTP round-trip per ticker. Cached
+        tickers are served from disk and excluded from the request.
+        """
+        misses = []
+        for stock in stocks:
+            info = self._cache_get('info', stock['ticker'])
+            if info is None:
+                misses.append(stock)
+            else:
+                try:
+                    self._apply_info(stock, info)
+                except Exception as e:
+                    print(f"Error enriching {stock['ticker']}: {e}")
+                    self._apply_enrich_defaults(stock)
+
+        for start in range(0, len(misses), batch_size):
+            chunk = misses[start:start + batch_size]
+            try:
+                _YAHOO_LIMITER.acquire()
+                tickers = yf.Tickers(" ".join(s['ticker'] for s in chunk),
+                                     session=self._session)
+            except Exception as e:
+                print(f"Error building ticker batch: {e}")
+                for stock in chunk:
+                    self._apply_enrich_defaults(stock)
+                continue
+
+            for stock in chunk:
+                try:
+                    info = tickers.tickers[stock['ticker'].upper()].info
+                    self._cache_put('info', stock['ticker'], info)
+                    self._apply_info(stock, info)
+                except Exception as e:
+                    print(f"Error enriching {stock['ticker']}: {e}")
+                    self._apply_enrich_defaults(stock)
+
+        return stocks
+
+    @staticmethod
+    def _apply_enrich_defaults(stock: Dict):
+        """Fill the enrichment fields filters rely on after a failure"""
+        if 'market_cap_universe' not in stock:
+            stock['market_cap_universe'] = 'Unknown'
+        if 'gross_margin' not in stock:
+            stock['gross_margin'] = 0
+
+    def _apply_info(self, stock: Dict, info: Dict):
+        """Populate enrichment fields from a yfinance info dict"""
+        ticker = stock['ticker']
+        stock['name'] = info.get('longName', stock.get('name', ticker))
+
+        # Only update sector if it was N/A
+        if stock.get('sector') == 'N/A':
+            raw_sector = info.get('sector', 'N/A')
+            stock['sector'] = normalize_sector(raw_sector)
+
+        stock['industry'] = info.get('industry', stock.get('industry', 'N/A'))
+
+        # Only update exchange if it was N/A (preserve our static data)
+        if stock.get('exchange') == 'N/A':
+            stock['exchange'] = _normalize_exchange(info.get('exchange', 'N/A'))
+
+        stock['market_cap'] = info.get('marketCap', 0) or 0
+        stock['market_cap_universe'] = get_market_cap_universe(stock['market_cap'])
+
+        # Additional quick metrics
+        stock['gross_margin'] = (info.get('grossMargins', 0) or 0) * 100
+
+    @staticmethod
+    def _statement_arrays(rows: List[Dict], value_field: str):
+        """
+        Turn statement rows into newest-first (year, value) arrays.
+        One DataFrame pass replaces per-row date slicing; dateless rows
+        are dropped and missing values coerce to 0, as before.
+        """
+        df = pd.DataFrame(rows)
+        if df.empty or 'date' not in df.columns:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+
+        date = df['date'].fillna('').astype(str)
+        dated = date != ''
+        years = date[dated].str[:4].astype(np.int64)
+        if value_field in df.columns:
+            values = df.loc[dated, value_field].fillna(0).astype(np.float64)
+        else:
+            values = pd.Series(0.0, index=years.index)
+
+        order = np.argsort(-years.to_numpy(), kind='stable')
+        return years.to_numpy()[order], values.to_numpy()[order]
+
     def get_financial_metrics(self, ticker: str, years: int = 10) -> Dict:
         """
         Fetch financial metrics needed for filtering.
         Returns metrics like FCF history, revenue growth, margins.
+        Results are cached in memory for the run and on disk for the
+        TTL, since fundamentals change at most daily.
         """
+        cached = self._metrics_cache.get(ticker)
+        if cached is None:
+            cached = self._cache_get('metrics', ticker)
+            if cached is not None:
+                self._metrics_cache[ticker] = cached
+        if cached is not None:
+            return cached
+
         try:
+            _YAHOO_LIMITER.acquire()
             if self.data_source == "roic":
                 data = self.fetcher.get_financial_data_complete(ticker, years_back=years)
             else:
                 data = self.fetcher.get_financial_data_complete(ticker)
 
-            # Extract FCF history
-            fcf_history = []
-            for cf in data.get('cash_flows', []):
-                fcf = cf.get('freeCashFlow', 0)
-                date = cf.get('date', '')
-                if date:
-                    year = int(date[:4])
-                    fcf_history.append({'year': year, 'fcf': fcf})
-
-            # Extract revenue history
-            revenue_history = []
-            for inc in data.get('income_statements', []):
-                revenue = inc.get('revenue', 0)
-                date = inc.get('date', '')
-                if date:
-                    year = int(date[:4])
-                    revenue_history.append({'year': year, 'revenue': revenue})
-
-            # Sort by year (newest first)
-            fcf_history.sort(key=lambda x: x['year'], reverse=True)
-            revenue_history.sort(key=lambda x: x['year'], reverse=True)
+            # Extract FCF and revenue as arrays sorted newest-first, so
+            # the year counts below become single vectorized reductions
+            fcf_years, fcf = self._statement_arrays(
+                data.get('cash_flows', []), 'freeCashFlow')
+            rev_years, rev = self._statement_arrays(
+                data.get('income_statements', []), 'revenue')
+
+            fcf_history = [{'year': int(y), 'fcf': float(f)}
+                           for y, f in zip(fcf_years, fcf)]
+            revenue_history = [{'year': int(y), 'revenue': float(r)}
+                               for y, r in zip(rev_years, rev)]
 
             # Calculate metrics
-            positive_fcf_last_year = fcf_history[0]['fcf'] > 0 if fcf_history else False
+            positive_fcf_last_year = bool(fcf[0] > 0) if fcf.size else False
 
-            positive_fcf_count_3 = sum(1 for f in fcf_history[:3] if f['fcf'] > 0)
-            positive_fcf_count_5 = sum(1 for f in fcf_history[:5] if f['fcf'] > 0)
-            positive_fcf_count_10 = sum(1 for f in fcf_history[:10] if f['fcf'] > 0)
+            positive_fcf_count_3 = int((fcf[:3] > 0).sum())
+            positive_fcf_count_5 = int((fcf[:5] > 0).sum())
+            positive_fcf_count_10 = int((fcf[:10] > 0).sum())
 
-            # Revenue growth years
-            revenue_growth_years = 0
-            for i in range(min(5, len(revenue_history) - 1)):
-                if revenue_history[i]['revenue'] > revenue_history[i + 1]['revenue']:
-                    revenue_growth_years += 1
+            # Revenue growth years: newest-first, so a year-over-year
+            # increase shows up as a negative difference
+            revenue_growth_years = int((np.diff(rev[:6]) < 0).sum())
 
-            return {
+            metrics = {
                 'positive_fcf_last_year': positive_fcf_last_year,
                 'positive_fcf_years_3': positive_fcf_count_3,
                 'positive_fcf_years_5': positive_fcf_count_5,
@@ -810,6 +996,11 @@ class BatchScreener:
                 'full_data': data  # Keep for DCF analysis
             }
 
+            # Failures are never cached, only real fetches
+            self._metrics_cache[ticker] = metrics
+            self._cache_put('metrics', ticker, metrics)
+            return metrics
+
         except Exception as e:
             print(f"Error fetching financial metrics for {ticker}: {e}")
             return {
@@ -846,13 +1037,7 @@ class BatchScreener:
             stock_exchange = stock.get('exchange', 'N/A')
             # Normalize exchange name
             if stock_exchange and stock_exchange != 'N/A':
-                stock_exchange_upper = stock_exchange.upper()
-                if 'NASDAQ' in stock_exchange_upper or 'NMS' in stock_exchange_upper or 'NGM' in stock_exchange_upper:
-                    stock_exchange = 'NASDAQ'
-                elif 'NYSE' in stock_exchange_upper or 'NYQ' in stock_exchange_upper:
-                    stock_exchange = 'NYSE'
-                elif 'AMEX' in stock_exchange_upper:
-                    stock_exchange = 'AMEX'
+                stock_exchange = _normalize_exchange(stock_exchange)
 
             # If stock exchange is N/A, let it pass
             if stock_exchange != 'N/A' and stock_exchange not in exchange_filter:
@@ -869,6 +1054,59 @@ class BatchScreener:
 
         return True
 
+    def apply_basic_filters(self, stocks: List[Dict], filters: Dict) -> List[Dict]:
+        """
+        Vectorized passes_basic_filters over a whole universe.
+        Builds the boolean masks column-wise with pandas instead of
+        re-checking strings per stock; same pass-through semantics
+        (N/A sector/exchange and Unknown market cap are let through).
+        """
+        if not stocks or not filters:
+            return list(stocks)
+
+        df = pd.DataFrame(stocks)
+        mask = pd.Series(True, index=df.index)
+
+        def column(name, default):
+            if name in df.columns:
+                return df[name].fillna(default).astype(str)
+            return pd.Series(default, index=df.index)
+
+        sector_filter = filters.get('sector')
+        if sector_filter and isinstance(sector_filter, list) and len(sector_filter) > 0:
+            sector = column('sector', 'N/A')
+            mask &= (sector == 'N/A') | sector.isin(sector_filter)
+
+        exchange_filter = filters.get('exchange')
+        if exchange_filter and isinstance(exchange_filter, list) and len(exchange_filter) > 0:
+            exchange = column('exchange', 'N/A')
+            normalized = exchange.map(_normalize_exchange)
+            mask &= (normalized == 'N/A') | normalized.isin(exchange_filter)
+
+        market_cap_filter = filters.get('market_cap_universe')
+        if market_cap_filter and isinstance(market_cap_filter, list) and len(market_cap_filter) > 0:
+            universe = column('market_cap_universe', 'Unknown')
+            mask &= (universe == 'Unknown') | universe.isin(market_cap_filter)
+
+        if mask.all():
+            return list(stocks)
+        return [stocks[i] for i in np.flatnonzero(mask.to_numpy())]
+
+    def _passes_enrichment_filters(self, stock: Dict, filters: Dict) -> bool:
+        """Re-check sector/market-cap filters once enrichment filled them in"""
+        sector_filter = filters.get('sector', [])
+        if sector_filter and len(sector_filter) > 0:
+            stock_sector = stock.get('sector', 'N/A')
+            if stock_sector != 'N/A' and stock_sector not in sector_filter:
+                return False
+
+        market_cap_filter = filters.get('market_cap_universe', [])
+        if market_cap_filter and len(market_cap_filter) > 0:
+            if stock.get('market_cap_universe', 'Unknown') not in market_cap_filter:
+                return False
+
+        return True
+
     def passes_financial_filters(self, stock: Dict, metrics: Dict, filters: Dict) -> bool:
         """
         Apply financial filters that require data fetch.
@@ -916,19 +1154,8 @@ class BatchScreener:
 
     def has_financial_filters(self, filters: Dict) -> bool:
         """Check if any financial filters are active"""
-        if filters.get('positive_fcf_last_year') not in [None, "Any", ""]:
-            return True
-        if filters.get('positive_fcf_years_3', 0) > 0:
-            return True
-        if filters.get('positive_fcf_years_5', 0) > 0:
-            return True
-        if filters.get('positive_fcf_years_10', 0) > 0:
-            return True
-        if filters.get('revenue_growth_years_5', 0) > 0:
-            return True
-        if filters.get('min_gross_margin', 0) > 0:
-            return True
-        return False
+        return any(filters[key] not in (None, "Any", "", 0, False)
+                   for key in _FINANCIAL_KEYS & filters.keys())
 
     def needs_enrichment(self, filters: Dict, pre_filtered: bool = False) -> bool:
         """
@@ -1030,49 +1257,92 @@ class BatchScreener:
         if progress_callback:
             progress_callback(5, 100, f"Screening {total_stocks} pre-filtered stocks...", True)
 
-        for i, stock in enumerate(stocks):
+        # Step 1: Basic filters - SKIP if data was pre-filtered server-side.
+        # Applied up front so enrichment is only spent on candidates.
+        if pre_filtered:
+            candidates = stocks
+        else:
+            candidates = self.apply_basic_filters(stocks, filters)
+        total_candidates = len(candidates)
+
+        # Step 2 pipeline: candidates are enriched in multi-symbol
+        # yf.Tickers batches, with a bounded thread pool running the
+        # batches concurrently. Results come back in order, streaming
+        # continues per stock, and an early break (max_stocks) stops
+        # after the in-flight window.
+        if need_enrichment:
+            # When only a handful of matches are needed and no financial
+            # filters run afterwards, keep fewer batches in flight: most
+            # enriched stocks match, so enriching ~2x max_stocks at a
+            # time usually fills the quota without touching the rest of
+            # the universe
+            if max_stocks and not need_financial:
+                window_size = min(ENRICH_MAX_WORKERS,
+                                  max(1, -(-max_stocks * 2 // ENRICH_BATCH_SIZE)))
+            else:
+                window_size = ENRICH_MAX_WORKERS
+
+            def iter_enriched():
+                batches = [candidates[start:start + ENRICH_BATCH_SIZE]
+                           for start in range(0, total_candidates, ENRICH_BATCH_SIZE)]
+                with ThreadPoolExecutor(max_workers=ENRICH_MAX_WORKERS) as pool:
+                    # Submit one window of batches at a time so a break
+                    # doesn't leave a long queue to drain on shutdown
+                    for start in range(0, len(batches), window_size):
+                        window = batches[start:start + window_size]
+                        for enriched in pool.map(self._enrich_batch, window):
+                            yield from enriched
+            stock_iter = iter_enriched()
+        else:
+            stock_iter = iter(candidates)
+
+        # Re-check enrichment-dependent filters only when the data
+        # wasn't pre-filtered server-side
+        recheck = need_enrichment and not pre_filtered
+
+        # Step 3 pipeline: financial metrics are fetched a window ahead
+        # on a bounded pool while earlier stocks stream out. The pool
+        # size caps the request rate, replacing the old per-ticker
+        # sleep; stocks that fail the enrichment re-check never hit
+        # the network. Fetched stocks are yielded in completion order,
+        # so one slow ticker doesn't hold back results that are ready.
+        if need_financial:
+            def iter_screened():
+                with ThreadPoolExecutor(max_workers=METRICS_MAX_WORKERS) as pool:
+                    in_flight = {}
+                    for stock in stock_iter:
+                        if recheck and not self._passes_enrichment_filters(stock, filters):
+                            yield stock, False, None
+                            continue
+                        future = pool.submit(self.get_financial_metrics, stock['ticker'])
+                        in_flight[future] = stock
+                        while len(in_flight) >= METRICS_MAX_WORKERS * 2:
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for finished in done:
+                                yield in_flight.pop(finished), True, finished
+                    while in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for finished in done:
+                            yield in_flight.pop(finished), True, finished
+            screened_iter = iter_screened()
+        else:
+            screened_iter = (
+                (stock,
+                 not recheck or self._passes_enrichment_filters(stock, filters),
+                 None)
+                for stock in stock_iter)
+
+        for i, (stock, passed_all, metrics_future) in enumerate(screened_iter):
             if max_stocks and matched_count >= max_stocks:
                 break
 
             # Progress update - pass actual count, not percentage
             if progress_callback:
-                progress_callback(i + 1, total_stocks, f"Checking {stock['ticker']}...", True)
-
-            # Step 1: Basic filters - SKIP if data was pre-filtered server-side
-            if not pre_filtered:
-                passes_basic = self.passes_basic_filters(stock, filters)
-                if not passes_basic:
-                    continue
-
-            # Track if this ticker required slow operations (enrichment/financial)
-            required_slow_check = need_enrichment or need_financial
-            passed_all = True
-
-            # Step 2: Enrichment if needed (only for gross margin when pre-filtered)
-            if need_enrichment:
-                stock = self.enrich_stock_info(stock)
-                time.sleep(0.1)  # Rate limiting
-
-                # Only re-check filters if data wasn't pre-filtered
-                if not pre_filtered:
-                    # Re-check sector filter after enrichment
-                    sector_filter = filters.get('sector', [])
-                    if sector_filter and len(sector_filter) > 0:
-                        stock_sector = stock.get('sector', 'N/A')
-                        if stock_sector != 'N/A' and stock_sector not in sector_filter:
-                            passed_all = False
-
-                    # Re-check market cap filter after enrichment
-                    if passed_all:
-                        market_cap_filter = filters.get('market_cap_universe', [])
-                        if market_cap_filter and len(market_cap_filter) > 0:
-                            if stock.get('market_cap_universe', 'Unknown') not in market_cap_filter:
-                                passed_all = False
+                progress_callback(i + 1, total_candidates, f"Checking {stock['ticker']}...", True)
 
             # Step 3: Financial filters if needed
             if passed_all and need_financial:
-                metrics = self.get_financial_metrics(stock['ticker'])
-                time.sleep(0.2)  # Rate limiting
+                metrics = metrics_future.result()
 
                 if not self.passes_financial_filters(stock, metrics, filters):
                     passed_all = False
@@ -1100,39 +1370,105 @@ class BatchScreener:
         if progress_callback:
             progress_callback(100, 100, f"Screening complete: {matched_count} stocks matched", False)
 
+    @staticmethod
+    def _financial_mask(stocks: List[Dict], metrics_list: List[Dict],
+                        filters: Dict) -> np.ndarray:
+        """
+        passes_financial_filters for a whole batch as one boolean mask.
+        Same pass rules, evaluated column-wise over a metrics DataFrame.
+        """
+        mdf = pd.DataFrame(metrics_list)
+        mask = np.ones(len(stocks), dtype=bool)
+
+        fcf_last = filters.get('positive_fcf_last_year')
+        if fcf_last in ("Yes", "No"):
+            col = mdf['positive_fcf_last_year'].fillna(False).astype(bool).to_numpy()
+            mask &= col if fcf_last == "Yes" else ~col
+
+        for key in ('positive_fcf_years_3', 'positive_fcf_years_5',
+                    'positive_fcf_years_10', 'revenue_growth_years_5'):
+            minimum = filters.get(key, 0)
+            if minimum and minimum > 0:
+                mask &= mdf[key].fillna(0).to_numpy() >= minimum
+
+        min_gross_margin = filters.get('min_gross_margin', 0)
+        if min_gross_margin and min_gross_margin > 0:
+            margins = np.array([s.get('gross_margin', 0) or 0 for s in stocks],
+                               dtype=np.float64)
+            mask &= margins >= min_gross_margin
+
+        return mask
+
     def screen_stocks(self, filters: Dict, progress_callback: Callable = None,
                      max_stocks: int = None) -> List[Dict]:
         """
         Screen stocks and return list (non-streaming version for compatibility).
+        Without a max_stocks cap this runs each stage over the whole
+        batch — mask-based basic filters, windowed batch enrichment,
+        pooled metrics fetches, then one financial mask — and only
+        builds the final record list at the end.
         """
-        results = list(self.screen_stocks_streaming(
-            filters=filters,
-            progress_callback=progress_callback,
-            max_stocks=max_stocks
-        ))
-        return results
+        if max_stocks:
+            # Early termination matters more than batch shape here; the
+            # streaming pipeline stops fetching once the cap is hit
+            return list(self.screen_stocks_streaming(
+                filters=filters,
+                progress_callback=progress_callback,
+                max_stocks=max_stocks
+            ))
+
+        if progress_callback:
+            progress_callback(0, 100, "Fetching filtered stock universe...", True)
+
+        stocks = self.get_stock_universe(filters=filters)
+        if not stocks:
+            if progress_callback:
+                progress_callback(100, 100, "No stocks found in universe", False)
+            return []
+
+        pre_filtered = (self.data_source == "roic" and
+                        stocks[0].get('market_cap_universe') not in [None, 'Unknown'])
+        candidates = stocks if pre_filtered else self.apply_basic_filters(stocks, filters)
+
+        if self.needs_enrichment(filters, pre_filtered=pre_filtered):
+            if progress_callback:
+                progress_callback(10, 100, f"Enriching {len(candidates)} stocks...", True)
+            batches = [candidates[start:start + ENRICH_BATCH_SIZE]
+                       for start in range(0, len(candidates), ENRICH_BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=ENRICH_MAX_WORKERS) as pool:
+                for batch in pool.map(self._enrich_batch, batches):
+                    pass
+            if not pre_filtered:
+                candidates = [s for s in candidates
+                              if self._passes_enrichment_filters(s, filters)]
+
+        if self.has_financial_filters(filters) and candidates:
+            if progress_callback:
+                progress_callback(50, 100, f"Fetching metrics for {len(candidates)} stocks...", True)
+            with ThreadPoolExecutor(max_workers=METRICS_MAX_WORKERS) as pool:
+                metrics_list = list(pool.map(
+                    lambda s: self.get_financial_metrics(s['ticker']), candidates))
+            keep = self._financial_mask(candidates, metrics_list, filters)
+            candidates = [dict(stock, metrics=metrics)
+                          for stock, metrics, kept
+                          in zip(candidates, metrics_list, keep) if kept]
+
+        if progress_callback:
+            progress_callback(100, 100, f"Screening complete: {len(candidates)} stocks matched", False)
+        return candidates
 
 
 # Get all unique sectors from the filter definition
-def get_all_sectors() -> List[str]:
+def get_all_sectors() -> Tuple[str, ...]:
     """Get list of all sectors for the filter dropdown"""
-    for f in FILTER_DEFINITIONS:
-        if f.key == 'sector':
-            return f.options
-    return []
+    return _OPTIONS_BY_KEY['sector']
 
 
-def get_all_exchanges() -> List[str]:
+def get_all_exchanges() -> Tuple[str, ...]:
     """Get list of all exchanges for the filter dropdown"""
-    for f in FILTER_DEFINITIONS:
-        if f.key == 'exchange':
-            return f.options
-    return []
+    return _OPTIONS_BY_KEY['exchange']
 
 
-def get_all_market_cap_universes() -> List[str]:
+def get_all_market_cap_universes() -> Tuple[str, ...]:
     """Get list of all market cap universes"""
-    for f in FILTER_DEFINITIONS:
-        if f.key == 'market_cap_universe':
-            return f.options
-    return []
+    return _OPTIONS_BY_KEY['market_cap_universe']